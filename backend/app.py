@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import time
+
+# timed for the startup phase report
+_import_start = time.perf_counter()
+
 import asyncio
-import json
 import os
 import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 from dotenv import find_dotenv, load_dotenv
-from fastapi import Body, FastAPI
+from fastapi import Body, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 import structlog
 
 from backend.common import (
+    Cluster,
     ClusterDescriptor,
     DesignToken,
     GenerateResponse,
@@ -27,6 +33,13 @@ from backend.common import (
     encode_image_to_data_url,
 )
 from backend import orchestrator
+from backend.utils.jobs import JobCancelledError
+from backend.utils.serialization import dump_json, json_body, sse_event
+
+if TYPE_CHECKING:
+    import numpy as np
+
+IMPORT_S = round(time.perf_counter() - _import_start, 2)
 
 # Directory configuration
 ROOT_DIR = Path(__file__).parent.resolve()
@@ -76,6 +89,8 @@ LOCAL_DEV_ORIGIN_REGEX = r"https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 # Session management
 # Maps session_id -> {"event": asyncio.Event, "confirmed": bool}
 pending_confirmations: dict[str, dict] = {}
+# Number of /extract runs in progress; artifacts are only cleared by a lone run
+active_extractions = 0
 
 # FastAPI application setup
 app = FastAPI(title="Imagin3D Backend", version="1.0.0")
@@ -91,13 +106,26 @@ app.add_middleware(
 artifacts_dir = ROOT_DIR / "artifacts"
 artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-# Mount artifacts directory
+# Mount artifacts directory (working files of this replica; clients get URLs of
+# the shared storage, see /storage)
 app.mount("/artifacts", StaticFiles(directory=ROOT_DIR / "artifacts"), name="artifacts")
 
 
 @app.on_event("startup")
 async def initialize_orchestrator() -> None:
-    await asyncio.to_thread(orchestrator._initialize)
+    # components load in the background; requests wait for the ones they need
+    orchestrator.startup_phases["import_s"] = IMPORT_S
+    orchestrator.start_initialization()
+
+
+@app.on_event("shutdown")
+async def shutdown_orchestrator() -> None:
+    if orchestrator.job_queue is not None:
+        await orchestrator.job_queue.stop()
+    if orchestrator.media_pool is not None:
+        orchestrator.media_pool.shutdown()
+    if orchestrator.trellis_engine is not None:
+        await orchestrator.trellis_engine.stop()
 
 
 @app.get("/status")
@@ -106,12 +134,71 @@ async def status():
     version = engine.version if engine is not None else None
     response = {
         "initialized": orchestrator._initialized,
+        "components": orchestrator.component_status,
     }
+    if orchestrator.component_errors:
+        response["errors"] = orchestrator.component_errors
     if version is not None:
         response["model"] = f"TrellisV{version}"
+    render_engine = orchestrator.render_engine
+    if render_engine is not None and render_engine.cache is not None:
+        response["render_cache"] = render_engine.cache.stats()
     return response
 
 
+@app.get("/health/live")
+async def liveness():
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness():
+    # Ready once boards can be ingested; the generation components warm up
+    # later and are listed for information only
+    statuses = orchestrator.component_status
+    ready = all(
+        statuses.get(name) in orchestrator.USABLE
+        for name in orchestrator.INGESTION_COMPONENTS
+    )
+    return JSONResponse(
+        {"ready": ready, "components": statuses},
+        status_code=200 if ready else 503,
+    )
+
+
+@app.get("/storage/{key:path}")
+async def stored_artifact(key: str):
+    # published artifacts of the local storage backend; only content-addressed
+    # blobs are served (they never change), not the cache manifests
+    await orchestrator.wait_ready("storage")
+    path = None
+    if key.startswith("blobs/"):
+        try:
+            path = orchestrator.storage.local_path(key)
+        except ValueError:
+            pass
+    if path is None or not path.is_file():
+        return JSONResponse({"error": "Artifact not found"}, status_code=404)
+    return FileResponse(
+        path, headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = orchestrator.job_queue.get(job_id) if orchestrator.job_queue else None
+    if job is None:
+        return {"error": "Job not found"}
+    return orchestrator.job_queue.snapshot(job)
+
+
+@app.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    if orchestrator.job_queue is None or not orchestrator.job_queue.cancel(job_id):
+        return {"error": "Job not found or already finished"}
+    return {"status": "cancelled"}
+
+
 @app.post("/confirm-weights/{session_id}")
 async def confirm_weights(
     session_id: str,
@@ -150,17 +237,18 @@ async def regenerate_master_prompt_image(
     if not clusters:
         return {"error": "Session has no cluster context"}
 
+    run_dir = Path(session["run_dir"])
     if session.get("multiview"):
         images = {}
         async for update in orchestrator.generate_multiview_master_images(
-            prompt, clusters
+            prompt, clusters, run_dir
         ):
             if update["event"] == "all_done":
                 images = update["images"]
         session["front_image_path"] = str(images["front"])
         session["back_image_path"] = str(images["back"])
 
-        master_prompt_path = ROOT_DIR / "artifacts" / "master_prompt.txt"
+        master_prompt_path = run_dir / "master_prompt.txt"
         with open(master_prompt_path, "w", encoding="utf-8") as f:
             f.write(prompt)
 
@@ -169,10 +257,12 @@ async def regenerate_master_prompt_image(
             "back_image": encode_image_to_data_url(images["back"]),
         }
     else:
-        master_image_path = await orchestrator.generate_master_image(prompt, clusters)
+        master_image_path = await orchestrator.generate_master_image(
+            prompt, clusters, run_dir
+        )
         session["master_image_path"] = str(master_image_path)
 
-        master_prompt_path = ROOT_DIR / "artifacts" / "master_prompt.txt"
+        master_prompt_path = run_dir / "master_prompt.txt"
         with open(master_prompt_path, "w", encoding="utf-8") as f:
             f.write(prompt)
 
@@ -205,6 +295,7 @@ async def edit_master_prompt_image(
             edit_prompt,
             payload.front_image,
             payload.back_image,
+            Path(session["run_dir"]),
             payload.view,
             session.get("clusters"),
         )
@@ -220,7 +311,10 @@ async def edit_master_prompt_image(
             return {"error": "Image data URL is required for single view edits"}
 
         master_image_path = await orchestrator.edit_master_image(
-            edit_prompt, payload.image, session.get("clusters")
+            edit_prompt,
+            payload.image,
+            Path(session["run_dir"]),
+            session.get("clusters"),
         )
         session["master_image_path"] = str(master_image_path)
 
@@ -229,9 +323,50 @@ async def edit_master_prompt_image(
         }
 
 
+async def _job_progress_events(job, stage: str):
+    """Yield SSE progress events with queue position and ETA until `job` starts."""
+    async for snapshot in orchestrator.job_queue.updates(job):
+        if snapshot["status"] == "queued":
+            stage_text = (
+                f"Queued for 3D generation ({snapshot['position']} ahead, "
+                f"~{round(snapshot['eta_s'])}s)"
+            )
+        else:
+            stage_text = stage
+        progress_event = {
+            "type": "progress",
+            "data": {
+                "current": 0,
+                "total": 1,
+                "stage": stage_text,
+                "job_id": job.id,
+                "queue_position": snapshot["position"],
+                "eta_s": snapshot["eta_s"],
+            },
+        }
+        yield sse_event(progress_event)
+
+
+async def _track_extraction(events):
+    """Count an /extract run as active while its event stream is open."""
+    global active_extractions
+    active_extractions += 1
+    try:
+        async for event in events:
+            yield event
+    finally:
+        active_extractions -= 1
+        await events.aclose()
+
+
 @app.post("/extract")
-async def extract(payload: MoodboardPayload) -> StreamingResponse:
-    orchestrator._initialize()
+async def extract(
+    payload: MoodboardPayload = Depends(json_body(MoodboardPayload)),
+) -> StreamingResponse:
+    await orchestrator.wait_ready(*orchestrator.INGESTION_COMPONENTS)
+    # numpy and trimesh are loaded with the components, not when the app is imported
+    from backend.utils.board import Moodboard
+    from backend.utils.glb import ModelValidationError
 
     async def generate():
         # ----- Ingestion -----
@@ -241,9 +376,20 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "type": "error",
                 "data": "Payload must contain elements or clusters",
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield sse_event(error_event)
             return
 
+        # Per-stage wall time, excluding user confirmation waits
+        stage_timings: dict[str, float] = {}
+        stage_start = time.perf_counter()
+        cost_start = orchestrator.llm_cost()
+
+        def end_stage(name: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            stage_timings[name] = round(now - stage_start, 3)
+            stage_start = now
+
         # Log start of moodboard extraction
         logger.info(
             "Starting moodboard extraction",
@@ -278,57 +424,55 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "stage": "Starting...",
             },
         }
-        yield f"data: {json.dumps(progress_event)}\n\n"
+        yield sse_event(progress_event)
 
-        # Clear artifacts directory
+        # Clear artifacts directory, unless other runs are still using it
         artifacts_dir = ROOT_DIR / "artifacts"
-        if artifacts_dir.exists():
+        if artifacts_dir.exists() and active_extractions == 1:
             shutil.rmtree(artifacts_dir)
         artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Timestamp
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Timestamp, made unique so overlapping runs don't share artifact files
+        timestamp = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        # Working files of this run (uploads, renders, master images)
+        run_dir = ROOT_DIR / "artifacts" / "runs" / timestamp
+        run_dir.mkdir(parents=True)
 
         # Dump raw elements and clusters to JSON file
         raw_path = ROOT_DIR / "artifacts" / "raw" / f"moodboard-{timestamp}.json"
         raw_path.parent.mkdir(parents=True, exist_ok=True)
-        with raw_path.open("w", encoding="utf-8") as target_file:
-            json.dump(payload.dict(), target_file, ensure_ascii=False, indent=2)
+        dump_json(payload, raw_path)
 
         # ----- Design Tokens -----
 
         # Turn elements into design tokens
-        async def process_element(element: dict) -> DesignToken:
+        async def process_element(element: dict) -> DesignToken | None:
             try:
                 element_type = element["content"]["type"]
 
                 # 1) Title and description generation
                 match element_type:
                     case "model":
-                        title, description = await orchestrator.handle_model(element)
+                        title, description = await orchestrator.handle_model(
+                            element, run_dir
+                        )
                     case "video":
-                        title, description = await orchestrator.handle_video(element)
+                        title, description = await orchestrator.handle_video(
+                            element, run_dir
+                        )
                     case "palette":
                         title, description = await orchestrator.handle_palette(element)
                     case "image":
-                        title, description = await orchestrator.handle_image(element)
+                        title, description = await orchestrator.handle_image(
+                            element, run_dir
+                        )
                     case "text":
                         title, description = await orchestrator.handle_text(element)
 
                 # 2) Generate embedding based on title
                 embedding = orchestrator.generate_embedding(title)
 
-                # 3) Signal progress
-                current = await increment_progress()
-                await progress_queue.put(
-                    {
-                        "current": current,
-                        "total": total_steps,
-                        "stage": "Processing elements...",
-                    }
-                )
-
-                # 4) Create and return the design token
+                # 3) Create and return the design token
                 return DesignToken(
                     id=element["id"],
                     type=element_type,
@@ -341,7 +485,14 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                         "y": element["position"]["y"],
                     },
                 )
-            except Exception:
+            except ModelValidationError as e:
+                # Reject only the malformed upload, the rest of the board goes on
+                logger.warning(
+                    "Rejected model element", element_id=element["id"], error=str(e)
+                )
+                rejected_elements.append((element["id"], str(e)))
+                return None
+            finally:
                 # Signal progress even on failure so the queue consumer doesn't hang
                 current = await increment_progress()
                 await progress_queue.put(
@@ -351,60 +502,58 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                         "stage": "Processing elements...",
                     }
                 )
-                raise
 
-        with raw_path.open("r", encoding="utf-8") as source_file:
-            data = json.load(source_file)
-
-            # Start processing all elements in parallel
-            tasks = [
-                asyncio.create_task(process_element(element))
-                for element in data["elements"]
-            ]
-
-            # Yield progress updates as they come in
-            completed = 0
-            while completed < len(tasks):
-                progress_data = await progress_queue.get()
-                completed += 1
-                progress_event = {"type": "progress", "data": progress_data}
-                yield f"data: {json.dumps(progress_event)}\n\n"
+        # Start processing all elements in parallel
+        rejected_elements: list[tuple[int, str]] = []
+        tasks = [
+            asyncio.create_task(process_element(element.model_dump()))
+            for element in payload.elements
+        ]
 
-            # Collect all results
-            design_tokens = list(await asyncio.gather(*tasks))
+        # Yield progress updates as they come in
+        completed = 0
+        while completed < len(tasks):
+            progress_data = await progress_queue.get()
+            completed += 1
+            progress_event = {"type": "progress", "data": progress_data}
+            yield sse_event(progress_event)
+
+        # Collect all results, leaving out rejected elements
+        results = await asyncio.gather(*tasks)
+        design_tokens = [token for token in results if token is not None]
+        # Non-fatal, unlike "error" events; the board goes on without them
+        for element_id, error in rejected_elements:
+            rejected_event = {
+                "type": "rejected",
+                "data": {"element_id": element_id, "reason": error},
+            }
+            yield sse_event(rejected_event)
 
         # Dump design tokens to JSON file
         design_tokens_path = (
             ROOT_DIR / "artifacts" / "design_tokens" / f"design-tokens-{timestamp}.json"
         )
         design_tokens_path.parent.mkdir(parents=True, exist_ok=True)
-        with design_tokens_path.open("w", encoding="utf-8") as f:
-            json.dump(
-                [token.dict() for token in design_tokens],
-                f,
-                ensure_ascii=False,
-                indent=2,
-            )
+        dump_json(design_tokens, design_tokens_path)
+
+        end_stage("design_tokens")
 
         # ----- Cluster Descriptors -----
 
-        # Create a lookup map from element id to design token
-        token_lookup: dict[int, DesignToken] = {
-            token.id: token for token in design_tokens
-        }
+        # Index the design tokens; every later stage works on this board
+        board = Moodboard(design_tokens)
+        members = [board.positions(cluster.elements) for cluster in payload.clusters]
 
         # Turn clusters into cluster descriptors
-        async def process_cluster(cluster: dict) -> ClusterDescriptor:
-            # 1) Gather elements for this cluster
-            elements: list[DesignToken] = [
-                token_lookup[element_id]
-                for element_id in cluster["elements"]
-                if element_id in token_lookup
-            ]
+        async def process_cluster(
+            cluster: Cluster, positions: np.ndarray
+        ) -> ClusterDescriptor:
+            # 1) Gather elements for this cluster, in payload order
+            elements = board.tokens_at(positions)
 
             # 2) Generate title and description via clusterer
             title, description = await orchestrator.handle_cluster(
-                cluster["title"], elements
+                cluster.title, elements
             )
 
             # 3) Signal progress
@@ -419,31 +568,29 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
 
             # 4) Create and return the cluster descriptor
             return ClusterDescriptor(
-                id=cluster["id"],
+                id=cluster.id,
                 title=title,
                 description=description,
                 elements=elements,
             )
 
-        with raw_path.open("r", encoding="utf-8") as source_file:
-            data = json.load(source_file)
-
-            # Start processing all clusters in parallel
-            cluster_tasks = [
-                asyncio.create_task(process_cluster(cluster))
-                for cluster in data["clusters"]
-            ]
+        # Start processing all clusters in parallel
+        cluster_tasks = [
+            asyncio.create_task(process_cluster(cluster, positions))
+            for cluster, positions in zip(payload.clusters, members)
+        ]
 
-            # Yield progress updates as they come in
-            completed = 0
-            while completed < len(cluster_tasks):
-                progress_data = await progress_queue.get()
-                completed += 1
-                progress_event = {"type": "progress", "data": progress_data}
-                yield f"data: {json.dumps(progress_event)}\n\n"
+        # Yield progress updates as they come in
+        completed = 0
+        while completed < len(cluster_tasks):
+            progress_data = await progress_queue.get()
+            completed += 1
+            progress_event = {"type": "progress", "data": progress_data}
+            yield sse_event(progress_event)
 
-            # Collect all results
-            cluster_descriptors = list(await asyncio.gather(*cluster_tasks))
+        # Collect all results
+        cluster_descriptors = list(await asyncio.gather(*cluster_tasks))
+        board.set_clusters(cluster_descriptors, members)
 
         # Dump each cluster descriptor to its own JSON file
         for cluster_descriptor in cluster_descriptors:
@@ -458,8 +605,7 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 cluster_descriptors_dir
                 / f"cluster-{cluster_descriptor.id}-{timestamp}.json"
             )
-            with cluster_descriptor_path.open("w", encoding="utf-8") as f:
-                json.dump(cluster_descriptor.dict(), f, ensure_ascii=False, indent=2)
+            dump_json(cluster_descriptor, cluster_descriptor_path)
 
         # ----- Process Adapt Subject -----
 
@@ -474,7 +620,7 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                     "stage": "Processing subject...",
                 },
             }
-            yield f"data: {json.dumps(progress_event)}\n\n"
+            yield sse_event(progress_event)
 
             subject_element = {
                 "id": "adapt_subject",
@@ -491,24 +637,18 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             try:
                 if subject_element["content"]["type"] == "model":
                     title, description = await orchestrator.handle_model(
-                        subject_element
-                    )
-                    renders_dir = (
-                        ROOT_DIR / "artifacts" / "model_renders" / "adapt_subject"
+                        subject_element, run_dir, profile="subject"
                     )
+                    renders_dir = run_dir / "model_renders" / "adapt_subject"
                     renders = sorted(renders_dir.glob("*.jpg"))
                     if renders:
                         adapt_subject_image_path = renders[0]
                 elif subject_element["content"]["type"] == "image":
                     title, description = await orchestrator.handle_image(
-                        subject_element
+                        subject_element, run_dir
                     )
                     adapt_subject_image_path = (
-                        ROOT_DIR
-                        / "artifacts"
-                        / "images"
-                        / "adapt_subject"
-                        / "image.jpg"
+                        run_dir / "images" / "adapt_subject" / "image.jpg"
                     )
 
                 # Append title and description to adapt_subject_text
@@ -522,22 +662,14 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             except Exception as e:
                 logger.error("Failed to process adapt subject file", error=e)
 
-        # ----- Intent Router -----
-
-        # Initialize weight tracking
-        element_weights: dict[int, int] = {}
+        end_stage("clusters")
 
-        # 1) Provide cluster context for design tokens
-        token_cluster_context: dict[int, str] = {}
-        for cluster_descriptor in cluster_descriptors:
-            for element in cluster_descriptor.elements:
-                token_cluster_context[element.id] = (
-                    f"{cluster_descriptor.title},{cluster_descriptor.description}"
-                )
+        # ----- Intent Router -----
 
-        # 2) Route design tokens and assign weights
-        async def route_single_token(token: DesignToken) -> tuple[int, int]:
-            cluster_context = token_cluster_context.get(token.id)
+        # 1) Route design tokens, with the context of their cluster
+        async def route_single_token(position: int) -> tuple[int, int]:
+            token = board.tokens[position]
+            cluster_context = board.cluster_context(position)
             subject_info = (
                 payload.adapt_subject_text
                 if payload.adapt_subject_text
@@ -559,7 +691,8 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
 
         # Start routing all tokens in parallel
         token_routing_tasks = [
-            asyncio.create_task(route_single_token(token)) for token in design_tokens
+            asyncio.create_task(route_single_token(position))
+            for position in range(len(board))
         ]
 
         # Yield progress updates as they come in
@@ -568,41 +701,34 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             progress_data = await progress_queue.get()
             completed += 1
             progress_event = {"type": "progress", "data": progress_data}
-            yield f"data: {json.dumps(progress_event)}\n\n"
+            yield sse_event(progress_event)
 
         # Collect all results
         token_routing_results = list(await asyncio.gather(*token_routing_tasks))
 
-        # Apply the routing results to design tokens
-        token_lookup_for_routing = {token.id: token for token in design_tokens}
+        # 2) Assign the weights; cluster descriptors share the token objects
         for token_id, weight in token_routing_results:
-            token_lookup_for_routing[token_id].weight = weight
-            element_weights[token_id] = weight
+            board.set_weight(token_id, weight)
+        # later stages see cluster elements in board order
+        board.sort_clusters()
 
-        # 4) Update cluster elements with weighted tokens
-        for cluster_descriptor in cluster_descriptors:
-            cluster_descriptor.elements = [
-                token
-                for token in design_tokens
-                if token.id in [e.id for e in cluster_descriptor.elements]
-            ]
-
-        # 5) Display weights in frontend and wait for confirmation
+        # 3) Display weights in frontend and wait for confirmation
         session_id = str(uuid.uuid4())
         pending_confirmations[session_id] = {
             "event": asyncio.Event(),
             "confirmed": False,
         }
         weights_response = WeightsRequest(
-            weights=element_weights,
+            weights=board.weight_map(),
             cluster_weights={},
         )
         weights_event = {
             "type": "weights",
-            "data": weights_response.dict(),
+            "data": weights_response,
             "session_id": session_id,
         }
-        yield f"data: {json.dumps(weights_event)}\n\n"
+        end_stage("intent_router")
+        yield sse_event(weights_event)
 
         # Wait for user confirmation
         logger.info("Waiting for user confirmation of weights...")
@@ -618,19 +744,17 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "type": "cancelled",
                 "data": "Pipeline cancelled by user",
             }
-            yield f"data: {json.dumps(cancelled_event)}\n\n"
+            yield sse_event(cancelled_event)
             return
         if edited_weights:
             edited_element_weights = edited_weights.get("weights", {})
 
             for token_id, user_weight in edited_element_weights.items():
-                if token_id in token_lookup_for_routing:
-                    clamped_weight = max(0, min(100, int(user_weight)))
-                    token_lookup_for_routing[token_id].weight = clamped_weight
-                    if token_id in element_weights:
-                        element_weights[token_id] = clamped_weight
+                if token_id in board.index:
+                    board.set_weight(token_id, max(0, min(100, int(user_weight))))
 
         logger.info("User confirmed weights, continuing pipeline...")
+        stage_start = time.perf_counter()
 
         # ----- Master Prompt Generation -----
 
@@ -644,14 +768,17 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "stage": "Generating master prompt...",
             },
         }
-        yield f"data: {json.dumps(progress_event)}\n\n"
+        yield sse_event(progress_event)
 
         master_prompt = await orchestrator.synthesize_master_prompt(
             payload.prompt,
             cluster_descriptors,
+            run_dir,
             subject=payload.adapt_subject_text,
         )
 
+        end_stage("master_prompt")
+
         # ----- Master Image Generation -----
 
         # Send progress update for master image generation
@@ -665,13 +792,14 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 else "Generating master image...",
             },
         }
-        yield f"data: {json.dumps(progress_event)}\n\n"
+        yield sse_event(progress_event)
 
         if payload.multiview:
             images = {}
             async for update in orchestrator.generate_multiview_master_images(
                 master_prompt,
                 cluster_descriptors,
+                run_dir,
                 base_image_path=adapt_subject_image_path,
                 prompt=payload.prompt
                 if (payload.adapt_subject_file or payload.adapt_subject_text)
@@ -686,7 +814,7 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                             "stage": "Generating back view...",
                         },
                     }
-                    yield f"data: {json.dumps(progress_event)}\n\n"
+                    yield sse_event(progress_event)
                 elif update["event"] == "all_done":
                     images = update["images"]
 
@@ -697,14 +825,15 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             master_image_path = await orchestrator.generate_master_image(
                 master_prompt,
                 cluster_descriptors,
+                run_dir,
                 base_image_path=adapt_subject_image_path,
                 prompt=payload.prompt
                 if (payload.adapt_subject_file or payload.adapt_subject_text)
                 else None,
             )
 
-        reference_images = orchestrator.get_reference_images_preview(
-            cluster_descriptors
+        reference_images = await orchestrator.get_reference_images_preview(
+            cluster_descriptors, run_dir
         )
 
         # Send master prompt and image to frontend for confirmation
@@ -729,6 +858,7 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             "confirmed": False,
             "clusters": cluster_descriptors,
             "multiview": payload.multiview,
+            "run_dir": str(run_dir),
         }
 
         if payload.multiview:
@@ -751,7 +881,8 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             },
             "session_id": master_session_id,
         }
-        yield f"data: {json.dumps(master_prompt_event)}\n\n"
+        end_stage("master_image")
+        yield sse_event(master_prompt_event)
 
         # Wait for user confirmation of master prompt
         logger.info("Waiting for user confirmation of master prompt...")
@@ -773,30 +904,89 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "type": "cancelled",
                 "data": "Master prompt cancelled by user",
             }
-            yield f"data: {json.dumps(cancelled_event)}\n\n"
+            yield sse_event(cancelled_event)
             return
         logger.info("User confirmed master prompt, continuing pipeline...")
+        stage_start = time.perf_counter()
 
         # ----- 3D Generative Model -----
 
-        # Send progress update for 3D model generation
-        progress_event = {
-            "type": "progress",
-            "data": {
-                "current": 0,
-                "total": 1,
-                "stage": "Generating 3D model...",
-            },
-        }
-        yield f"data: {json.dumps(progress_event)}\n\n"
+        # The 3D engine may still be starting; only this stage waits for it
+        try:
+            await orchestrator.wait_ready(*orchestrator.GENERATION_COMPONENTS)
+        except RuntimeError as e:
+            error_event = {"type": "error", "data": str(e)}
+            yield sse_event(error_event)
+            return
 
-        # Generate 3D model from master image using TRELLIS
-        if payload.multiview:
-            model_path = await orchestrator.generate_3d_model(
-                [front_image_path_conf, back_image_path_conf]
+        # Describe and embed the confirmed master image(s) for evaluation while
+        # the 3D model is generated
+        master_embeddings = asyncio.create_task(
+            orchestrator.prepare_master_embeddings(run_dir, payload.multiview)
+        )
+
+        # Queue 3D generation from the master image using TRELLIS
+        image_input = (
+            [front_image_path_conf, back_image_path_conf]
+            if payload.multiview
+            else master_image_path_conf
+        )
+        # progressive mode queues a fast draft ahead of the requested tier
+        draft_job = None
+        if payload.progressive and payload.quality != "draft":
+            draft_job = await orchestrator.submit_3d_model(
+                image_input,
+                priority=payload.priority,
+                tier="draft",
             )
-        else:
-            model_path = await orchestrator.generate_3d_model(master_image_path_conf)
+        job = await orchestrator.submit_3d_model(
+            image_input,
+            extra_outputs=payload.extra_outputs,
+            priority=payload.priority,
+            tier=payload.quality,
+        )
+
+        try:
+            if draft_job is not None:
+                async for event in _job_progress_events(
+                    draft_job, "Generating 3D preview..."
+                ):
+                    yield event
+                try:
+                    draft_path = await draft_job.wait()
+                except Exception as e:
+                    # the preview is best-effort; keep waiting for the final model
+                    logger.warning("3D preview generation failed", error=str(e))
+                else:
+                    preview_event = {
+                        "type": "preview",
+                        "data": {
+                            "file": await orchestrator.publish(draft_path),
+                            "job_id": draft_job.id,
+                        },
+                    }
+                    yield sse_event(preview_event)
+
+            async for event in _job_progress_events(job, "Generating 3D model..."):
+                yield event
+
+            try:
+                model_path = await job.wait()
+            except JobCancelledError:
+                logger.info("3D generation job cancelled", job_id=job.id)
+                cancelled_event = {
+                    "type": "cancelled",
+                    "data": "3D generation cancelled",
+                }
+                yield sse_event(cancelled_event)
+                return
+        finally:
+            # the client went away; don't spend GPU time on abandoned jobs
+            if job.status != "completed":
+                master_embeddings.cancel()
+            for pending_job in (draft_job, job):
+                if pending_job is not None and not pending_job.finished:
+                    orchestrator.job_queue.cancel(pending_job.id)
 
         progress_event = {
             "type": "progress",
@@ -804,9 +994,12 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
                 "current": 1,
                 "total": 1,
                 "stage": "Generating 3D model...",
+                "job_id": job.id,
             },
         }
-        yield f"data: {json.dumps(progress_event)}\n\n"
+        yield sse_event(progress_event)
+
+        end_stage("generation_3d")
 
         # ----- Final Response -----
 
@@ -814,14 +1007,14 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
         logger.info("Completed moodboard extraction and 3D model generation")
 
         # Send final response
-        relative_path = model_path.relative_to(ROOT_DIR / "artifacts")
-        model_url = f"/artifacts/{relative_path}"
+        # published to the shared storage, so any replica can serve the URLs
+        model_url = await orchestrator.publish(model_path)
 
         multiview_images = None
         if payload.multiview:
             multiview_images = {
-                "front": f"/artifacts/{front_image_path_conf.relative_to(ROOT_DIR / 'artifacts')}",
-                "back": f"/artifacts/{back_image_path_conf.relative_to(ROOT_DIR / 'artifacts')}",
+                "front": await orchestrator.publish(front_image_path_conf),
+                "back": await orchestrator.publish(back_image_path_conf),
             }
 
         final_response = GenerateResponse(
@@ -829,22 +1022,34 @@ async def extract(payload: MoodboardPayload) -> StreamingResponse:
             file=model_url,
             multiview_images=multiview_images,
         )
-        final_event = {"type": "complete", "data": final_response.dict()}
-        yield f"data: {json.dumps(final_event)}\n\n"
+        final_event = {"type": "complete", "data": final_response}
+        yield sse_event(final_event)
 
         # ----- Evaluation -----
 
         # Calculate score
         async for score_event in orchestrator.evaluate_model_async(
             model_path,
-            cluster_descriptors,
+            board,
+            run_dir,
             is_multiview=payload.multiview,
             adapt_subject_text=payload.adapt_subject_text,
+            master_embeddings=master_embeddings,
         ):
-            yield f"data: {json.dumps(score_event)}\n\n"
+            yield sse_event(score_event)
+        end_stage("evaluation")
+
+        stats_event = {
+            "type": "stats",
+            "data": {
+                "stages": stage_timings,
+                "cost": round(orchestrator.llm_cost() - cost_start, 6),
+            },
+        }
+        yield sse_event(stats_event)
 
     return StreamingResponse(
-        generate(),
+        _track_extraction(generate()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -0,0 +1,214 @@
+"""Benchmark of the /extract bookkeeping on large boards.
+
+Times the board-side work between the model calls (cluster membership, cluster
+context, weight updates and the closeness inputs) with the indexed `Moodboard`
+against the previous list- and dict-based code, on synthetic design tokens.
+Both must produce the same results:
+
+    python -m backend.benchmarks.board --sizes 1000 4000 16000
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from backend.common import Cluster, ClusterDescriptor, DesignToken
+from backend.orchestrator import RELEVANCE_THRESHOLD
+from backend.utils.board import Moodboard
+
+CLUSTER_SIZE = 8
+CLUSTER_STRIDE = 6  # neighbouring clusters share two elements
+STAGES = ("membership", "context", "weights", "closeness", "total")
+HEADER = f"{'elements':>8} {'variant':>8} " + " ".join(f"{s:>10}" for s in STAGES)
+
+
+def make_tokens(size: int, dimensions: int) -> list[DesignToken]:
+    rng = np.random.default_rng(size)
+    embeddings = rng.standard_normal((size, dimensions)).round(4)
+    return [
+        DesignToken(
+            id=i,
+            type="text",
+            title=f"Item {i}",
+            embedding=embeddings[i].tolist(),
+            size={"x": 1.0, "y": 1.0},
+            position={"x": float(i), "y": 0.0},
+        )
+        for i in range(size)
+    ]
+
+
+def make_clusters(size: int) -> list[Cluster]:
+    return [
+        # one id per cluster is not on the board, like elements removed meanwhile;
+        # every other cluster lists its elements against board order
+        Cluster(
+            id=c,
+            title=f"Cluster {c}",
+            elements=[
+                *range(start, min(start + CLUSTER_SIZE, size))[:: -1 if c % 2 else 1],
+                size + c,
+            ],
+        )
+        for c, start in enumerate(range(0, size, CLUSTER_STRIDE))
+    ]
+
+
+def _descriptor(cluster: Cluster, elements: list[DesignToken]) -> ClusterDescriptor:
+    return ClusterDescriptor(
+        id=cluster.id, title=cluster.title, description="", elements=elements
+    )
+
+
+def _weight(token_id: int) -> int:
+    return (token_id * 37) % 101
+
+
+def legacy(tokens: list[DesignToken], clusters: list[Cluster], timer: Callable):
+    """The bookkeeping as /extract did it before the indexed board."""
+    with timer("membership"):
+        token_lookup = {token.id: token for token in tokens}
+        descriptors = [
+            _descriptor(
+                cluster,
+                [token_lookup[i] for i in cluster.elements if i in token_lookup],
+            )
+            for cluster in clusters
+        ]
+    clusterer_input = [[t.id for t in d.elements] for d in descriptors]
+    with timer("context"):
+        token_cluster_context = {}
+        for descriptor in descriptors:
+            for element in descriptor.elements:
+                token_cluster_context[element.id] = (
+                    f"{descriptor.title},{descriptor.description}"
+                )
+        contexts = [token_cluster_context.get(token.id) for token in tokens]
+    with timer("weights"):
+        element_weights = {}
+        token_lookup_for_routing = {token.id: token for token in tokens}
+        for token in tokens:
+            token_lookup_for_routing[token.id].weight = _weight(token.id)
+            element_weights[token.id] = _weight(token.id)
+        for descriptor in descriptors:
+            descriptor.elements = [
+                token
+                for token in tokens
+                if token.id in [e.id for e in descriptor.elements]
+            ]
+    with timer("closeness"):
+        embeddings, weights = [], []
+        for descriptor in descriptors:
+            for token in descriptor.elements:
+                if token.weight <= RELEVANCE_THRESHOLD:
+                    continue
+                if token.embedding and len(token.embedding) > 0:
+                    embeddings.append(token.embedding)
+                    weights.append(token.weight)
+        embeddings, weights = np.array(embeddings), np.array(weights)
+    return clusterer_input, descriptors, contexts, element_weights, embeddings, weights
+
+
+def indexed(tokens: list[DesignToken], clusters: list[Cluster], timer: Callable):
+    with timer("membership"):
+        board = Moodboard(tokens)
+        members = [board.positions(cluster.elements) for cluster in clusters]
+        descriptors = [
+            _descriptor(cluster, board.tokens_at(positions))
+            for cluster, positions in zip(clusters, members)
+        ]
+        board.set_clusters(descriptors, members)
+    clusterer_input = [[t.id for t in d.elements] for d in descriptors]
+    with timer("context"):
+        contexts = [board.cluster_context(i) for i in range(len(board))]
+    with timer("weights"):
+        for token in tokens:
+            board.set_weight(token.id, _weight(token.id))
+        board.sort_clusters()
+        element_weights = board.weight_map()
+    with timer("closeness"):
+        embeddings, weights = board.relevant_embeddings(RELEVANCE_THRESHOLD)
+    return clusterer_input, descriptors, contexts, element_weights, embeddings, weights
+
+
+def _check_same(expected: tuple, actual: tuple) -> None:
+    clusterer_input, descriptors, contexts, element_weights, embeddings, weights = (
+        expected
+    )
+    assert clusterer_input == actual[0], "clusterer inputs differ"
+    assert [[t.id for t in d.elements] for d in descriptors] == [
+        [t.id for t in d.elements] for d in actual[1]
+    ], "cluster members differ"
+    assert contexts == actual[2], "cluster contexts differ"
+    assert element_weights == actual[3], "weights differ"
+    assert np.array_equal(embeddings, actual[4]), "closeness embeddings differ"
+    assert np.array_equal(weights, actual[5]), "closeness weights differ"
+
+
+def run(size: int, dimensions: int, with_legacy: bool) -> dict[str, Any]:
+    clusters = make_clusters(size)
+    results: dict[str, Any] = {"elements": size, "clusters": len(clusters)}
+    outputs = {}
+    variants = {"indexed": indexed}
+    if with_legacy:
+        variants["legacy"] = legacy
+    for name, variant in variants.items():
+        # fresh tokens, since the stages set their weights
+        tokens = make_tokens(size, dimensions)
+        timings: dict[str, float] = {}
+
+        @contextlib.contextmanager
+        def timer(stage: str) -> Iterator[None]:
+            start = time.perf_counter()
+            yield
+            timings[stage] = round(time.perf_counter() - start, 4)
+
+        outputs[name] = variant(tokens, clusters, timer)
+        results[name] = {**timings, "total": round(sum(timings.values()), 4)}
+    if with_legacy:
+        _check_same(outputs["legacy"], outputs["indexed"])
+    return results
+
+
+def format_rows(result: dict[str, Any]) -> str:
+    return "\n".join(
+        f"{result['elements']:>8} {variant:>8} "
+        + " ".join(f"{result[variant][s]:>10.4f}" for s in STAGES)
+        for variant in ("legacy", "indexed")
+        if variant in result
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000]
+    )
+    parser.add_argument("--dimensions", type=int, default=1024)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=8000,
+        help="largest board to also run the previous code on",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    print(HEADER)
+    for size in args.sizes:
+        results.append(run(size, args.dimensions, size <= args.legacy_max))
+        print(format_rows(results[-1]), flush=True)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
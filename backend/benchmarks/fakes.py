@@ -0,0 +1,156 @@
+"""Offline stand-ins for the model providers, Blender and TRELLIS.
+
+The fakes keep the interfaces and output shapes of the real backends and only
+simulate their latency, so benchmarks measure the pipeline's own overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import itertools
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Collection, Optional, Union
+
+import numpy as np
+import pydantic_ai
+import trimesh
+from PIL import Image
+from pydantic_ai.messages import FilePart, ModelMessage, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+from pydantic_ai.profiles import ModelProfile
+from pydantic_ai.usage import RequestUsage
+
+from backend.agents.clusterer import Clusterer
+from backend.agents.descriptor import Descriptor
+from backend.agents.intent_router import IntentRouter
+from backend.agents.prompt_synthesizer import PromptSynthesizer
+from backend.agents.visualizer import Visualizer
+from backend.utils.trellis import TrellisEngine
+
+STUB_BLENDER = Path(__file__).parent / "stub_blender.py"
+
+
+def _jpeg(size: int = 512, color: tuple[int, int, int] = (200, 180, 160)) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (size, size), color).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+# Structured answers per agent, by call number; the visualizer answers with an image
+ANSWERS: dict[str, Optional[Callable[[int], dict[str, Any]]]] = {
+    "descriptor": lambda n: {"title": f"Item {n}", "description": f"Item {n}."},
+    "clusterer": lambda n: {"title": f"Cluster {n}", "description": f"Cluster {n}."},
+    "intent_router": lambda n: {"weight": (n * 37) % 101, "reasoning": "Benchmark."},
+    "prompt_synthesizer": lambda n: {"prompt": f"Benchmark master prompt {n}."},
+    "visualizer": None,
+}
+
+
+def fake_llm(
+    model_name: str,
+    answer: Optional[Callable[[int], dict[str, Any]]],
+    latency_s: float = 0.0,
+    input_tokens: int = 1000,
+    output_tokens: int = 100,
+) -> FunctionModel:
+    """A model replying after `latency_s` with `answer(n)` or, if None, a JPEG.
+
+    The model name is kept so agents price the reported tokens as the real model.
+    """
+    counter = itertools.count()
+    image = _jpeg()
+
+    async def respond(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(latency_s)
+        usage = RequestUsage(input_tokens=input_tokens, output_tokens=output_tokens)
+        if answer is None:
+            part = FilePart(
+                content=pydantic_ai.BinaryImage(data=image, media_type="image/jpeg")
+            )
+        else:
+            args = {"info": answer(next(counter))}
+            part = ToolCallPart(info.output_tools[0].name, args)
+        return ModelResponse(parts=[part], usage=usage)
+
+    return FunctionModel(
+        respond,
+        model_name=model_name,
+        profile=ModelProfile(
+            supports_json_schema_output=True,
+            supports_json_object_output=True,
+            supports_image_output=True,
+        ),
+    )
+
+
+def fake_agents(
+    model_names: dict[str, str],
+    latency_s: float = 0.0,
+    input_tokens: int = 1000,
+    output_tokens: int = 100,
+) -> dict[str, Any]:
+    """Build all agents on fake models, named after the configured models."""
+    agents = {
+        "descriptor": Descriptor,
+        "clusterer": Clusterer,
+        "intent_router": IntentRouter,
+        "prompt_synthesizer": PromptSynthesizer,
+        "visualizer": Visualizer,
+    }
+    return {
+        name: agent(
+            fake_llm(
+                model_names[name], ANSWERS[name], latency_s, input_tokens, output_tokens
+            )
+        )
+        for name, agent in agents.items()
+    }
+
+
+class FakeEmbeddingFunction:
+    """Deterministic unit vectors per text, in place of the Titan embeddings."""
+
+    def __init__(self, latency_s: float = 0.0, dimensions: int = 1024):
+        self.latency_s = latency_s
+        self.dimensions = dimensions
+
+    def __call__(self, texts: list[str]) -> list[np.ndarray]:
+        # blocking, like the Bedrock client it replaces
+        time.sleep(self.latency_s)
+        embeddings = []
+        for text in texts:
+            rng = np.random.default_rng(zlib.crc32(text.encode()))
+            vector = rng.standard_normal(self.dimensions).astype(np.float32)
+            embeddings.append(vector / np.linalg.norm(vector))
+        return embeddings
+
+
+class StubTrellisEngine(TrellisEngine):
+    """TRELLIS v2 stand-in that writes a cube after `latency_s`."""
+
+    def __init__(self, latency_s: float = 1.0, **kwargs: Any):
+        kwargs["version"] = 2
+        super().__init__(**kwargs)
+        self.latency_s = latency_s
+
+    @property
+    def ready(self) -> bool:
+        return True
+
+    async def start(self) -> None:
+        pass
+
+    async def generate_with_params(
+        self,
+        image_path: Union[Path, list[Path]],
+        output_dir: Path,
+        params: Any,
+        extra_outputs: Collection[str] = (),
+    ) -> None:
+        await asyncio.sleep(self.latency_s)
+        await asyncio.to_thread(
+            trimesh.creation.box().export, output_dir / "sample.glb"
+        )
@@ -0,0 +1,104 @@
+"""Import-time budget for the backend app.
+
+Imports `backend.app` in fresh interpreters under `python -X importtime` and
+fails if the best run exceeds the budget, or if modules that should only load
+once components are built (model SDKs, Hydra, mesh and video libraries) are
+imported eagerly:
+
+    python -m backend.benchmarks.import_time --budget-ms 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TARGET = "backend.app"
+# imported at first use, never by the app module itself
+LAZY_MODULES = (
+    "boto3",
+    "botocore",
+    "hydra",
+    "omegaconf",
+    "pydantic_ai",
+    "google.genai",
+    "genai_prices",
+    "numpy",
+    "trimesh",
+    "cv2",
+    "torch",
+)
+
+
+def measure() -> list[tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) for one import of the app."""
+    env = {
+        # the app refuses to import without provider keys
+        "BEDROCK_ACCESS_KEY_ID": "x",
+        "BEDROCK_SECRET_ACCESS_KEY": "x",
+        "GOOGLE_API_KEY": "x",
+        **os.environ,
+    }
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {TARGET} failed:\n{proc.stderr[-2000:]}")
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def by_package(modules: list[tuple[str, int, int]]) -> list[tuple[str, int]]:
+    """Self time per top-level package, slowest first."""
+    totals: collections.Counter[str] = collections.Counter()
+    for name, self_us, _ in modules:
+        totals[name.split(".")[0]] += self_us
+    return totals.most_common()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs; the fastest one is checked"
+    )
+    parser.add_argument("--top", type=int, default=10, help="packages to list")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeat)]
+    totals = [dict((n, c) for n, _, c in run)[TARGET] / 1000 for run in runs]
+    best = runs[totals.index(min(totals))]
+
+    print(f"import {TARGET}: {min(totals):.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for package, self_us in by_package(best)[: args.top]:
+        print(f"{package:>24} {self_us / 1000:>8.1f} ms")
+
+    failures = []
+    if min(totals) > args.budget_ms:
+        failures.append(f"over budget by {min(totals) - args.budget_ms:.0f} ms")
+    imported = {name for name, _, _ in best}
+    eager = [m for m in LAZY_MODULES if m in imported]
+    if eager:
+        failures.append(f"imported eagerly: {', '.join(eager)}")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
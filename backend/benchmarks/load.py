@@ -0,0 +1,240 @@
+"""HTTP load test driving the full /extract event-stream protocol.
+
+Each simulated client replays stored moodboards: it holds the /extract event
+stream open and, after a think time, confirms the weights and master prompt
+sessions over separate requests, optionally regenerating or editing the master
+image first. Reports time-to-first-event, -weights, -master-image and -GLB
+percentiles, measured as server time (client think time excluded):
+
+    python -m backend.benchmarks.serve --port 8000 &
+    python -m backend.benchmarks.load boards/ --url http://localhost:8000 \\
+        --clients 8 --sessions 40 --think-ms 1000 --regenerate 0.2 --edit 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+MILESTONES = ("first_event", "weights", "master_image", "glb", "total")
+REQUESTS = ("confirm", "regenerate", "edit")
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {
+        "n": len(ordered),
+        "p50": rank(0.5),
+        "p90": rank(0.9),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+class Session:
+    """One /extract run, timing milestones net of client-side time."""
+
+    def __init__(self, client: httpx.AsyncClient, url: str, args: argparse.Namespace):
+        self.client = client
+        self.url = url
+        self.args = args
+        self.rng = random.Random()
+        self.milestones: dict[str, float] = {}
+        self.requests: dict[str, list[float]] = {name: [] for name in REQUESTS}
+        self._start = 0.0
+        self._client_s = 0.0  # think time and side requests so far
+
+    def _mark(self, name: str) -> None:
+        if name not in self.milestones:
+            elapsed = time.perf_counter() - self._start - self._client_s
+            self.milestones[name] = elapsed
+
+    async def _think(self) -> None:
+        if self.args.think_ms > 0:
+            seconds = self.rng.uniform(0.5, 1.5) * self.args.think_ms / 1000
+            await asyncio.sleep(seconds)
+            self._client_s += seconds
+
+    async def _post(self, name: str, path: str, body: dict[str, Any]) -> dict:
+        start = time.perf_counter()
+        response = await self.client.post(f"{self.url}{path}", json=body)
+        elapsed = time.perf_counter() - start
+        self._client_s += elapsed
+        self.requests[name].append(elapsed)
+        response.raise_for_status()
+        reply = response.json()
+        if "error" in reply:
+            raise RuntimeError(f"{path}: {reply['error']}")
+        return reply
+
+    async def _refine_master(self, event: dict[str, Any]) -> None:
+        session_id = event["session_id"]
+        data = event["data"]
+        if self.rng.random() < self.args.regenerate:
+            reply = await self._post(
+                "regenerate",
+                f"/master-prompt/{session_id}/regenerate",
+                {"prompt": data["prompt"]},
+            )
+            data = {**data, **reply}
+            await self._think()
+        if self.rng.random() < self.args.edit:
+            body = {"prompt": "Make the colours slightly warmer"}
+            if data.get("multiview"):
+                body.update(
+                    front_image=data["front_image"], back_image=data["back_image"]
+                )
+            else:
+                body["image"] = data["image"]
+            await self._post("edit", f"/master-prompt/{session_id}/edit-image", body)
+            await self._think()
+
+    async def run(self, board: bytes) -> None:
+        self._start = time.perf_counter()
+        async with self.client.stream(
+            "POST",
+            f"{self.url}/extract",
+            content=board,
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                self._mark("first_event")
+                event = json.loads(line[len("data: ") :])
+                match event["type"]:
+                    case "weights":
+                        self._mark("weights")
+                        await self._think()
+                        await self._confirm(event["session_id"])
+                    case "master_prompt":
+                        self._mark("master_image")
+                        await self._think()
+                        await self._refine_master(event)
+                        await self._confirm(event["session_id"])
+                    case "complete":
+                        self._mark("glb")
+                    case "rejected":
+                        pass  # the board goes on without the element
+                    case "error" | "cancelled":
+                        raise RuntimeError(f"/extract {event['type']}: {event['data']}")
+        if "glb" not in self.milestones:
+            raise RuntimeError("stream ended before the model was generated")
+        self._mark("total")
+
+    async def _confirm(self, session_id: str) -> None:
+        await self._post(
+            "confirm", f"/confirm-weights/{session_id}", {"confirmed": True}
+        )
+
+
+async def run_load(boards: list[bytes], args: argparse.Namespace) -> dict[str, Any]:
+    sessions = iter(range(args.sessions))
+    done: list[Session] = []
+    errors: list[str] = []
+
+    async def client_loop() -> None:
+        timeout = httpx.Timeout(60, read=None)
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            for n in sessions:
+                session = Session(client, args.url.rstrip("/"), args)
+                session.rng.seed(args.seed + n)
+                try:
+                    await asyncio.wait_for(
+                        session.run(boards[n % len(boards)]), args.timeout
+                    )
+                except (httpx.HTTPError, RuntimeError, asyncio.TimeoutError) as e:
+                    errors.append(f"session {n}: {e!r}")
+                    print(errors[-1], file=sys.stderr)
+                else:
+                    done.append(session)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(args.clients)))
+    wall_s = time.perf_counter() - start
+
+    return {
+        "clients": args.clients,
+        "sessions": len(done),
+        "errors": len(errors),
+        "wall_s": round(wall_s, 3),
+        "sessions_per_min": round(len(done) / wall_s * 60, 2),
+        "milestones_s": {
+            name: percentiles([s.milestones[name] for s in done]) for name in MILESTONES
+        },
+        "requests_s": {
+            name: percentiles([t for s in done for t in s.requests[name]])
+            for name in REQUESTS
+        },
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [
+        f"{report['sessions']} sessions ok, {report['errors']} failed, "
+        f"{report['clients']} clients, {report['wall_s']:.1f}s "
+        f"({report['sessions_per_min']:.1f} sessions/min)",
+        f"{'':>14} {'n':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}",
+    ]
+    for group in ("milestones_s", "requests_s"):
+        for name, stats in report[group].items():
+            if stats:
+                lines.append(
+                    f"{name:>14} {stats['n']:>5} {stats['p50']:>8.3f} "
+                    f"{stats['p90']:>8.3f} {stats['p99']:>8.3f} {stats['max']:>8.3f}"
+                )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("boards", type=Path, help="directory of moodboard-*.json")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=20, help="total sessions")
+    parser.add_argument(
+        "--think-ms", type=float, default=1000, help="mean pause before each action"
+    )
+    parser.add_argument(
+        "--regenerate", type=float, default=0.0, help="share of sessions regenerating"
+    )
+    parser.add_argument(
+        "--edit", type=float, default=0.0, help="share of sessions editing the image"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=1800, help="per-session timeout in seconds"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args()
+
+    # read up front; /extract may clear the directory the boards came from
+    boards = [
+        path.read_bytes() for path in sorted(args.boards.glob("moodboard-*.json"))
+    ]
+    if not boards:
+        parser.error(f"no moodboard-*.json files in {args.boards}")
+
+    report = asyncio.run(run_load(boards, args))
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
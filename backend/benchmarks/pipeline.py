@@ -0,0 +1,353 @@
+"""In-process benchmark of the /extract pipeline with fake model backends.
+
+Drives the /extract event stream and the orchestrator directly, with fake LLMs
+and embeddings, a stub Blender executable and a stub TRELLIS engine (see
+`backend.benchmarks.fakes`), so it runs offline and measures the pipeline's own
+overhead: per-stage wall time, event-loop lag, peak RSS and throughput across
+board sizes and concurrent sessions.
+
+    python -m backend.benchmarks.pipeline --sizes 10 100 1000 --sessions 1 4
+    python -m backend.benchmarks.pipeline --sizes 10 100 --output bench.json \\
+        --baseline baseline.json  # exits 1 on regressions, e.g. in CI
+
+Like a real run, sessions write to backend/artifacts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import importlib
+import io
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import structlog
+import trimesh
+from hydra import compose, initialize_config_dir
+from PIL import Image
+
+from backend import orchestrator
+from backend.benchmarks.fakes import (
+    ANSWERS,
+    STUB_BLENDER,
+    FakeEmbeddingFunction,
+    StubTrellisEngine,
+    fake_agents,
+)
+from backend.common import MoodboardPayload, WeightsResponse
+from backend.evaluate import STAGES
+
+# Element types in board order; every 20th element is a 3D model
+ELEMENT_MIX = ("text", "image", "palette", "image", "text")
+MODEL_EVERY = 20
+CLUSTER_SIZE = 8
+
+
+def _image_data_url(i: int) -> str:
+    # a noisy gradient, so decoding and re-encoding does real work
+    rng = np.random.default_rng(i)
+    x = np.linspace(0, 255, 256)
+    pixels = np.stack(
+        [np.add.outer(x, x) / 2, np.tile(x, (256, 1)), np.tile(x, (256, 1)).T],
+        axis=-1,
+    )
+    pixels = (pixels + rng.normal(0, 12, pixels.shape)).clip(0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, format="JPEG", quality=90)
+    return f"data:image/jpeg;base64,{base64.b64encode(buf.getvalue()).decode()}"
+
+
+def _model_data_url(i: int) -> str:
+    glb = trimesh.creation.box(extents=[1.0, 1.0 + (i % 7) / 10, 1.0]).export(
+        file_type="glb"
+    )
+    return f"data:model/gltf-binary;base64,{base64.b64encode(glb).decode()}"
+
+
+def make_board(size: int, first_id: int = 0) -> dict[str, Any]:
+    """A synthetic moodboard with `size` mixed elements in clusters of 8."""
+    elements = []
+    for i in range(size):
+        element_id = first_id + i
+        if i % MODEL_EVERY == MODEL_EVERY - 1:
+            kind = "model"
+            data = {"src": _model_data_url(i), "fileName": f"model-{element_id}.glb"}
+        else:
+            kind = ELEMENT_MIX[i % len(ELEMENT_MIX)]
+            data = {
+                "text": {"text": f"Benchmark note {i}: warm oak, soft curves."},
+                "image": {"src": _image_data_url(i)},
+                "palette": {"colors": ["#c8b4a0", "#3c2a1e", f"#{i % 256:02x}8080"]},
+            }[kind]
+        elements.append(
+            {
+                "id": element_id,
+                "content": {"type": kind, "data": data},
+                "position": {"x": float(i % 40) * 100, "y": float(i // 40) * 100},
+                "size": {"x": 1.0 + (i % 3) / 2, "y": 1.0},
+            }
+        )
+    clusters = [
+        {
+            "id": first_id + start,
+            "title": f"Cluster {start // CLUSTER_SIZE}",
+            "elements": [e["id"] for e in elements[start : start + CLUSTER_SIZE]],
+        }
+        for start in range(0, size, CLUSTER_SIZE)
+    ]
+    return {"elements": elements, "clusters": clusters, "prompt": "A lounge chair"}
+
+
+class LoopMonitor:
+    """Samples event-loop lag (oversleep of a short timer) while running."""
+
+    def __init__(self, interval_s: float = 0.005):
+        self.interval_s = interval_s
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._sample())
+
+    def stop(self) -> dict[str, float]:
+        self._task.cancel()
+        lags_ms = sorted(lag * 1000 for lag in self.lags) or [0.0]
+        return {
+            "p50": round(lags_ms[len(lags_ms) // 2], 2),
+            "p99": round(lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))], 2),
+            "max": round(lags_ms[-1], 2),
+        }
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval_s)
+            self.lags.append(max(0.0, time.perf_counter() - start - self.interval_s))
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+async def run_session(app: Any, payload: MoodboardPayload) -> dict[str, Any]:
+    """Run one board through /extract, confirming every step as sent."""
+    stats = None
+    response = await app.extract(payload)
+    async for chunk in response.body_iterator:
+        event = json.loads(chunk.removeprefix(b"data: "))
+        if event["type"] in ("weights", "master_prompt"):
+            await app.confirm_weights(event["session_id"], WeightsResponse())
+        elif event["type"] == "rejected":
+            continue  # the board goes on without the element
+        elif event["type"] in ("error", "cancelled"):
+            raise RuntimeError(f"/extract {event['type']}: {event['data']}")
+        elif event["type"] == "stats":
+            stats = event["data"]
+    if stats is None:
+        raise RuntimeError("/extract ended without stats")
+    return stats
+
+
+async def run_scenario(app: Any, size: int, sessions: int) -> dict[str, Any]:
+    payloads = [
+        MoodboardPayload(**make_board(size, first_id=s * size)) for s in range(sessions)
+    ]
+    monitor = LoopMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(run_session(app, payload) for payload in payloads), return_exceptions=True
+    )
+    wall_s = time.perf_counter() - start
+    loop_lag_ms = monitor.stop()
+
+    stats = [r for r in results if not isinstance(r, BaseException)]
+    for error in (r for r in results if isinstance(r, BaseException)):
+        print(f"session failed: {error!r}", file=sys.stderr)
+    stages = {
+        stage: round(statistics.mean(s["stages"].get(stage, 0.0) for s in stats), 3)
+        for stage in STAGES
+        if stats
+    }
+    return {
+        "elements": size,
+        "sessions": sessions,
+        "errors": len(results) - len(stats),
+        "wall_s": round(wall_s, 3),
+        "boards_per_min": round(len(stats) / wall_s * 60, 2),
+        "elements_per_s": round(len(stats) * size / wall_s, 1),
+        "loop_lag_ms": loop_lag_ms,
+        "peak_rss_mib": _peak_rss_mib(),
+        "cost": round(sum(s["cost"] for s in stats), 6),
+        "stages_s": stages,
+    }
+
+
+def add_fake_arguments(parser: argparse.ArgumentParser) -> None:
+    """Options of the fake backends, shared with `backend.benchmarks.serve`."""
+    parser.add_argument("--llm-latency-ms", type=float, default=50)
+    parser.add_argument("--input-tokens", type=int, default=1000)
+    parser.add_argument("--output-tokens", type=int, default=100)
+    parser.add_argument("--embedding-latency-ms", type=float, default=5)
+    parser.add_argument("--blender-latency-ms", type=float, default=0)
+    parser.add_argument("--trellis-latency-ms", type=float, default=500)
+    parser.add_argument(
+        "--caches", action="store_true", help="use fresh render/proxy/TRELLIS caches"
+    )
+    parser.add_argument("--log-level", default="warning")
+
+
+def setup(args: argparse.Namespace, cache_dir: Path) -> Any:
+    """Install the fakes in the orchestrator and import the app."""
+    # the app checks provider keys at import; the fakes never use them
+    for key in ("BEDROCK_ACCESS_KEY_ID", "BEDROCK_SECRET_ACCESS_KEY", "GOOGLE_API_KEY"):
+        os.environ.setdefault(key, "benchmark")
+    app = importlib.import_module("backend.app")
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            getattr(logging, args.log_level.upper())
+        )
+    )
+
+    os.environ["STUB_BLENDER_LATENCY_S"] = str(args.blender_latency_ms / 1000)
+    overrides = [
+        f"engine.exe={STUB_BLENDER}",
+        "trellis._target_=backend.benchmarks.fakes.StubTrellisEngine",
+        f"+trellis.latency_s={args.trellis_latency_ms / 1000}",
+        "trellis.prewarm=off",
+        f"storage.directory={cache_dir / 'storage'}",
+    ]
+    # fresh caches per run, or none, so runs stay comparable
+    for key in ("engine.cache", "model_preprocessor.cache", "trellis.cache"):
+        if args.caches:
+            overrides.append(f"{key}.directory={cache_dir / key.split('.')[0]}")
+        else:
+            overrides.append(f"{key}=null")
+
+    with initialize_config_dir(
+        config_dir=str(orchestrator.ROOT_DIR / "config"), version_base=None
+    ):
+        cfg = compose(config_name="config")
+    agents = fake_agents(
+        {name: cfg[name].llm.model_name for name in ANSWERS},
+        latency_s=args.llm_latency_ms / 1000,
+        input_tokens=args.input_tokens,
+        output_tokens=args.output_tokens,
+    )
+    orchestrator.initialize_with(
+        overrides,
+        embedding_function=FakeEmbeddingFunction(args.embedding_latency_ms / 1000),
+        **agents,
+    )
+    assert isinstance(orchestrator.trellis_engine, StubTrellisEngine)
+    return app
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Regressions of wall time and loop lag beyond `tolerance` of the baseline."""
+    previous = {(r["elements"], r["sessions"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        base = previous.get((result["elements"], result["sessions"]))
+        if base is None:
+            continue
+        for name, now, before in (
+            ("wall_s", result["wall_s"], base["wall_s"]),
+            (
+                "loop_lag_p99_ms",
+                result["loop_lag_ms"]["p99"],
+                base["loop_lag_ms"]["p99"],
+            ),
+        ):
+            if now > before * (1 + tolerance):
+                regressions.append(
+                    f"{result['elements']} elements x {result['sessions']} sessions: "
+                    f"{name} {now} vs {before}"
+                )
+        if result["errors"] > base["errors"]:
+            regressions.append(
+                f"{result['elements']} elements x {result['sessions']} sessions: "
+                f"{result['errors']} failed sessions"
+            )
+    return regressions
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    header = (
+        f"{'elements':>8} {'sessions':>8} {'wall_s':>8} {'elem/s':>8} "
+        f"{'lag_p99':>8} {'lag_max':>8} {'rss_mib':>8} "
+        + " ".join(f"{stage[:12]:>12}" for stage in STAGES)
+    )
+    lines = [header]
+    for r in results:
+        lines.append(
+            f"{r['elements']:>8} {r['sessions']:>8} {r['wall_s']:>8.2f} "
+            f"{r['elements_per_s']:>8.1f} {r['loop_lag_ms']['p99']:>8.1f} "
+            f"{r['loop_lag_ms']['max']:>8.1f} {r['peak_rss_mib']:>8.1f} "
+            + " ".join(f"{r['stages_s'].get(stage, 0):>12.3f}" for stage in STAGES)
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        app = setup(args, Path(cache_dir))
+        results = []
+        try:
+            for size in args.sizes:
+                for sessions in args.sessions:
+                    result = await run_scenario(app, size, sessions)
+                    results.append(result)
+                    print(
+                        f"{size} elements x {sessions} sessions: "
+                        f"{result['wall_s']:.2f}s",
+                        file=sys.stderr,
+                    )
+        finally:
+            await app.shutdown_orchestrator()
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4])
+    add_fake_arguments(parser)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare to")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(format_table(results))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
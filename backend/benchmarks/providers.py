@@ -0,0 +1,316 @@
+"""Local stand-in for the model provider APIs.
+
+Speaks the wire protocols the app's clients use: Bedrock Converse and Titan
+embeddings through `invoke_model` (boto3), and Gemini `generateContent` (the
+google-genai client behind GoogleModel). Answers are schema-shaped placeholders;
+latency, throttling and error rates are configurable so that whole-server load
+tests, including client connection pools and retries, run offline:
+
+    python -m backend.benchmarks.providers --port 8950 --llm-latency-ms 800
+    BEDROCK_ENDPOINT_URL=http://localhost:8950 \\
+    GOOGLE_GEMINI_BASE_URL=http://localhost:8950 \\
+    BEDROCK_ACCESS_KEY_ID=x BEDROCK_SECRET_ACCESS_KEY=x GOOGLE_API_KEY=x \\
+        python backend/run.py
+
+The endpoint variables feed the `endpoints` block of the app config.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import io
+import json
+import random
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from PIL import Image
+
+
+@dataclass
+class Behaviour:
+    """Latency and failure settings of one API."""
+
+    latency_ms: float
+    sigma: float = 0.0  # lognormal spread; 0 keeps the latency constant
+    concurrency: int = 0  # requests beyond this are throttled; 0 is unlimited
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.in_flight = 0
+
+    def latency_s(self) -> float:
+        if self.sigma <= 0:
+            return self.latency_ms / 1000
+        # lognormal with the configured mean
+        mu = np.log(self.latency_ms / 1000) - self.sigma**2 / 2
+        return float(np.random.lognormal(mu, self.sigma))
+
+    def failure(self) -> str | None:
+        """The failure to simulate: "throttle", "error" or None."""
+        if self.concurrency and self.in_flight >= self.concurrency:
+            return "throttle"
+        roll = random.random()
+        if roll < self.throttle_rate:
+            return "throttle"
+        if roll < self.throttle_rate + self.error_rate:
+            return "error"
+        return None
+
+
+def example(schema: dict[str, Any], defs: dict[str, Any], n: int = 0) -> Any:
+    """A placeholder value matching a JSON schema."""
+    if "$ref" in schema:
+        return example(defs[schema["$ref"].rsplit("/", 1)[-1]], defs, n)
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            return example(schema[key][0], defs, n)
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "string")
+    kind = kind.lower()
+    if kind == "object":
+        return {
+            name: example(prop, defs, n)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [example(schema.get("items", {}), defs, n)]
+    if kind == "integer":
+        return int(schema.get("minimum", 0)) + n % 101
+    if kind == "number":
+        return float(n % 101)
+    if kind == "boolean":
+        return True
+    return f"Stand-in text {n}"
+
+
+def _schema_defs(schema: dict[str, Any]) -> dict[str, Any]:
+    return {**schema.get("definitions", {}), **schema.get("$defs", {})}
+
+
+def _tokens(body: bytes) -> int:
+    # roughly four bytes per token, ignoring inline media
+    return max(1, len(body) // 4)
+
+
+def _image(size: int) -> str:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, size)
+    pixels = np.stack(
+        [np.add.outer(x, x) / 2, np.tile(x, (size, 1)), np.full((size, size), 200.0)],
+        axis=-1,
+    )
+    pixels = (pixels + rng.normal(0, 8, pixels.shape)).clip(0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, format="PNG")
+    return base64.b64encode(buf.getvalue()).decode()
+
+
+def create_app(args: argparse.Namespace) -> FastAPI:
+    app = FastAPI(title="Imagin3D provider stand-in")
+    behaviours = {
+        "converse": Behaviour(
+            args.llm_latency_ms,
+            args.latency_sigma,
+            args.concurrency,
+            args.throttle_rate,
+            args.error_rate,
+        ),
+        "embedding": Behaviour(
+            args.embedding_latency_ms,
+            args.latency_sigma,
+            args.concurrency,
+            args.throttle_rate,
+            args.error_rate,
+        ),
+        "gemini": Behaviour(
+            args.image_latency_ms,
+            args.latency_sigma,
+            args.concurrency,
+            args.throttle_rate,
+            args.error_rate,
+        ),
+    }
+    image_data = _image(args.image_size)
+    counter = iter(range(10**12))
+
+    async def serve(api: str, respond) -> JSONResponse:
+        behaviour = behaviours[api]
+        failure = behaviour.failure()
+        if failure == "throttle":
+            return _failure(api, failure)
+        behaviour.in_flight += 1
+        try:
+            await asyncio.sleep(behaviour.latency_s())
+            if failure is not None:
+                return _failure(api, failure)
+            return JSONResponse(respond(next(counter)))
+        finally:
+            behaviour.in_flight -= 1
+
+    @app.post("/model/{model_id}/converse")
+    async def converse(model_id: str, request: Request):
+        body = await request.body()
+        payload = json.loads(body)
+
+        def respond(n: int) -> dict[str, Any]:
+            tools = payload.get("toolConfig", {}).get("tools", [])
+            if tools:
+                spec = tools[0]["toolSpec"]
+                schema = spec["inputSchema"]["json"]
+                content = {
+                    "toolUse": {
+                        "toolUseId": f"tooluse_{uuid.uuid4().hex[:20]}",
+                        "name": spec["name"],
+                        "input": example(schema, _schema_defs(schema), n),
+                    }
+                }
+                stop_reason = "tool_use"
+            else:
+                content = {"text": f"Stand-in answer {n}."}
+                stop_reason = "end_turn"
+            input_tokens = _tokens(body)
+            return {
+                "output": {"message": {"role": "assistant", "content": [content]}},
+                "stopReason": stop_reason,
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": args.output_tokens,
+                    "totalTokens": input_tokens + args.output_tokens,
+                },
+                "metrics": {"latencyMs": int(behaviours["converse"].latency_ms)},
+            }
+
+        return await serve("converse", respond)
+
+    @app.post("/model/{model_id}/invoke")
+    async def invoke(model_id: str, request: Request):
+        payload = json.loads(await request.body())
+        text = payload.get("inputText", "")
+
+        def respond(n: int) -> dict[str, Any]:
+            dimensions = payload.get("dimensions", 1024)
+            rng = np.random.default_rng(zlib.crc32(text.encode()))
+            vector = rng.standard_normal(dimensions)
+            vector /= np.linalg.norm(vector)
+            return {
+                "embedding": vector.round(6).tolist(),
+                "inputTextTokenCount": _tokens(text.encode()),
+            }
+
+        return await serve("embedding", respond)
+
+    @app.post("/{version}/models/{model}:generateContent")
+    async def generate_content(version: str, model: str, request: Request):
+        body = await request.body()
+        payload = json.loads(body)
+
+        def respond(n: int) -> dict[str, Any]:
+            config = payload.get("generationConfig", {})
+            declarations = [
+                declaration
+                for tool in payload.get("tools", [])
+                for declaration in tool.get("functionDeclarations", [])
+            ]
+            schema = config.get("responseJsonSchema") or config.get("responseSchema")
+            if declarations:
+                declaration = declarations[0]
+                schema = (
+                    declaration.get("parametersJsonSchema")
+                    or declaration.get("parameters")
+                    or {}
+                )
+                part = {
+                    "functionCall": {
+                        "name": declaration["name"],
+                        "args": example(schema, _schema_defs(schema), n),
+                    }
+                }
+            elif schema:
+                part = {"text": json.dumps(example(schema, _schema_defs(schema), n))}
+            elif "image" in model or "IMAGE" in config.get("responseModalities", []):
+                # image models answer with an image unless asked for structured output
+                part = {"inlineData": {"mimeType": "image/png", "data": image_data}}
+            else:
+                part = {"text": f"Stand-in answer {n}."}
+            input_tokens = _tokens(body)
+            return {
+                "candidates": [
+                    {
+                        "content": {"role": "model", "parts": [part]},
+                        "finishReason": "STOP",
+                        "index": 0,
+                    }
+                ],
+                "usageMetadata": {
+                    "promptTokenCount": input_tokens,
+                    "candidatesTokenCount": args.output_tokens,
+                    "totalTokenCount": input_tokens + args.output_tokens,
+                },
+                "modelVersion": model,
+                "responseId": uuid.uuid4().hex,
+            }
+
+        return await serve("gemini", respond)
+
+    return app
+
+
+def _failure(api: str, failure: str) -> JSONResponse:
+    if api == "gemini":
+        status, code = (
+            (429, "RESOURCE_EXHAUSTED") if failure == "throttle" else (500, "INTERNAL")
+        )
+        return JSONResponse(
+            {"error": {"code": status, "message": "Stand-in failure", "status": code}},
+            status_code=status,
+        )
+    # botocore reads the error code from this header
+    status, code = (
+        (429, "ThrottlingException")
+        if failure == "throttle"
+        else (500, "InternalServerException")
+    )
+    return JSONResponse(
+        {"message": "Stand-in failure"},
+        status_code=status,
+        headers={"x-amzn-ErrorType": f"{code}:http://internal.amazon.com/"},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8950)
+    parser.add_argument("--llm-latency-ms", type=float, default=800)
+    parser.add_argument("--embedding-latency-ms", type=float, default=60)
+    parser.add_argument("--image-latency-ms", type=float, default=6000)
+    parser.add_argument(
+        "--latency-sigma", type=float, default=0.4, help="lognormal spread, 0 = fixed"
+    )
+    parser.add_argument("--output-tokens", type=int, default=150)
+    parser.add_argument("--image-size", type=int, default=1024)
+    parser.add_argument(
+        "--concurrency", type=int, default=0, help="per-API limit before throttling"
+    )
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
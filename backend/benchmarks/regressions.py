@@ -0,0 +1,218 @@
+"""Regression checks for inputs that used to break an /extract run.
+
+Each check builds a small input in memory and asserts how the backend handles
+it; the command fails if any check does:
+
+    python -m backend.benchmarks.regressions
+    python -m backend.benchmarks.regressions glb  # checks whose name contains "glb"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+import sys
+import tempfile
+import traceback
+import zlib
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import trimesh
+
+from backend.utils.cache import FileCache
+from backend.utils.glb import (
+    CHUNK_BIN,
+    CHUNK_JSON,
+    ModelPreprocessor,
+    ModelValidationError,
+    inspect_glb,
+)
+from backend.utils.media import MediaPool
+from backend.utils.storage import LocalStorage
+from backend.utils.video import KeyFrameExtractor, _feature_vector
+
+CHECKS: dict[str, Callable[[Path], None]] = {}
+
+
+def check(func: Callable[[Path], None]) -> Callable[[Path], None]:
+    CHECKS[func.__name__.removeprefix("check_")] = func
+    return func
+
+
+def _png_header(width: int, height: int) -> bytes:
+    """A PNG that declares `width` x `height` pixels but carries no image data."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IEND", b"")
+
+
+def _split_glb(data: bytes) -> tuple[dict, bytes]:
+    json_length = struct.unpack_from("<I", data, 12)[0]
+    gltf = json.loads(data[20 : 20 + json_length])
+    binary = data[20 + json_length + 8 :]
+    return gltf, binary
+
+
+def _join_glb(gltf: dict, binary: bytes) -> bytes:
+    binary += b"\x00" * (-len(binary) % 4)
+    gltf["buffers"][0]["byteLength"] = len(binary)
+    json_chunk = json.dumps(gltf).encode()
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    chunks = struct.pack("<II", len(json_chunk), CHUNK_JSON) + json_chunk
+    chunks += struct.pack("<II", len(binary), CHUNK_BIN) + binary
+    return struct.pack("<4sII", b"glTF", 2, 12 + len(chunks)) + chunks
+
+
+def _box_glb(texture: bytes | None = None) -> bytes:
+    """A unit box, with `texture` embedded as its only image if given."""
+    gltf, binary = _split_glb(trimesh.creation.box().export(file_type="glb"))
+    if texture is not None:
+        offset = len(binary) + (-len(binary) % 4)
+        binary = binary.ljust(offset, b"\x00") + texture
+        gltf["bufferViews"].append(
+            {"buffer": 0, "byteOffset": offset, "byteLength": len(texture)}
+        )
+        gltf["images"] = [
+            {"bufferView": len(gltf["bufferViews"]) - 1, "mimeType": "image/png"}
+        ]
+        gltf["textures"] = [{"source": 0}]
+        gltf["materials"] = [
+            {"pbrMetallicRoughness": {"baseColorTexture": {"index": 0}}}
+        ]
+        for mesh in gltf["meshes"]:
+            for primitive in mesh["primitives"]:
+                primitive["material"] = 0
+    return _join_glb(gltf, binary)
+
+
+def _expect_rejected(preprocessor: ModelPreprocessor, model_path: Path) -> str:
+    try:
+        preprocessor.prepare(model_path)
+    except ModelValidationError as e:
+        return str(e)
+    raise AssertionError("the model was not rejected with ModelValidationError")
+
+
+@check
+def check_glb_decompression_bomb_texture(tmp: Path) -> None:
+    # 16384² is over Pillow's decompression bomb limit; it counts as oversize,
+    # and the proxy is built without the texture
+    model_path = tmp / "bomb.glb"
+    model_path.write_bytes(_box_glb(_png_header(16384, 16384)))
+    _, stats = inspect_glb(model_path.read_bytes())
+    assert stats.max_texture_size > 2048, stats
+    proxy_path = ModelPreprocessor(200000, 2048).prepare(model_path)
+    _, stats = inspect_glb(proxy_path.read_bytes())
+    assert stats.max_texture_size <= 2048, stats
+
+
+@check
+def check_glb_proxy_build_failure(tmp: Path) -> None:
+    # structurally valid, but trimesh can't decode the accessor
+    gltf, binary = _split_glb(_box_glb())
+    gltf["accessors"][0]["componentType"] = 9999
+    model_path = tmp / "broken.glb"
+    model_path.write_bytes(_join_glb(gltf, binary))
+    error = _expect_rejected(ModelPreprocessor(1, 2048), model_path)
+    assert "render proxy" in error, error
+
+
+@check
+def check_video_static_key_frames_unique(tmp: Path) -> None:
+    # the frames of a static video have identical features; the float32
+    # distances between them rounded below the marker for selected frames, and
+    # farthest-point sampling picked the first frame over and over
+    colors = np.random.default_rng(3).integers(0, 256, (4, 4, 3))
+    frame = np.kron(colors, np.ones((64, 64, 1))).astype(np.uint8)
+    features = np.stack([_feature_vector(frame)] * 60)
+    selected = KeyFrameExtractor(frame_count=5)._select(features)
+    assert len(selected) == len(set(selected)) == 5, selected
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+@check
+def check_media_pool_worker_crash(tmp: Path) -> None:
+    # the crashing call fails instead of being rerun in the server process, and
+    # the pool recovers for the calls after it
+    async def run() -> None:
+        pool = MediaPool(workers=1)
+        try:
+            for _ in range(2):
+                try:
+                    await pool.run(_crash)
+                except BrokenProcessPool:
+                    pass
+                else:
+                    raise AssertionError("the crashing call did not fail")
+                assert await pool.run(os.getpid) != os.getpid()
+        finally:
+            pool.shutdown()
+
+    asyncio.run(run())
+
+
+@check
+def check_storage_keeps_published_files(tmp: Path) -> None:
+    # eviction removed published models while clients still had their URLs
+    storage = LocalStorage(str(tmp / "storage"), max_bytes=3000)
+    keys = []
+    for i in range(6):
+        path = tmp / f"{i}.bin"
+        path.write_bytes(os.urandom(1000))
+        keys.append(storage.put_file(path))
+        if i == 0:
+            storage.url(keys[0])
+    kept = [key for key in keys if storage.exists(key)]
+    assert kept == [keys[0], *keys[-2:]], kept
+
+
+@check
+def check_cache_restore_failure(tmp: Path) -> None:
+    # an entry that fails halfway through the copy (here a directory where a
+    # file should be) is a miss and leaves no partial output
+    cache = FileCache(str(tmp / "cache"), max_bytes=1 << 20)
+    (tmp / "a.bin").write_bytes(b"a")
+    cache.store("key", [tmp / "a.bin"])
+    (cache.directory / "key" / "b.bin").mkdir()
+    output_dir = tmp / "output"
+    assert not cache.restore("key", output_dir)
+    assert not any(output_dir.iterdir()), list(output_dir.iterdir())
+    assert cache.stats() == {"hits": 0, "misses": 1}, cache.stats()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("match", nargs="?", default="", help="run matching checks")
+    args = parser.parse_args()
+
+    failed = []
+    for name, func in CHECKS.items():
+        if args.match not in name:
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                func(Path(tmp))
+            except Exception:
+                failed.append(name)
+                print(f"FAIL {name}\n{traceback.format_exc()}", file=sys.stderr)
+            else:
+                print(f"ok   {name}")
+    if failed:
+        sys.exit(f"{len(failed)} check(s) failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
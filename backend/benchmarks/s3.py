@@ -0,0 +1,76 @@
+"""Local stand-in for an S3-compatible object store.
+
+Serves the object calls `S3Storage` makes (PutObject, GetObject including
+presigned URLs, HeadObject) with path-style addressing, keeping the objects in
+memory, so the S3 storage backend can be exercised offline:
+
+    python -m backend.benchmarks.s3 --port 8960
+
+then select `storage: s3` in config.yaml and start the backend with
+`ARTIFACTS_ENDPOINT_URL=http://localhost:8960` (and any AWS credentials set).
+Requests are not authenticated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+from email.utils import formatdate
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+
+def _error(status: int, code: str, key: str) -> Response:
+    body = f"<Error><Code>{code}</Code><Key>{key}</Key></Error>"
+    return Response(body, status_code=status, media_type="application/xml")
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(title="Imagin3D S3 stand-in")
+    objects: dict[tuple[str, str], tuple[bytes, str, float]] = {}
+
+    def headers(data: bytes, content_type: str, modified: float) -> dict[str, str]:
+        return {
+            "Content-Type": content_type,
+            "Content-Length": str(len(data)),
+            "ETag": f'"{hashlib.md5(data).hexdigest()}"',
+            "Last-Modified": formatdate(modified, usegmt=True),
+        }
+
+    @app.put("/{bucket}/{key:path}")
+    async def put_object(bucket: str, key: str, request: Request) -> Response:
+        data = await request.body()
+        content_type = request.headers.get("content-type", "binary/octet-stream")
+        objects[bucket, key] = (data, content_type, time.time())
+        return Response(headers={"ETag": f'"{hashlib.md5(data).hexdigest()}"'})
+
+    @app.get("/{bucket}/{key:path}")
+    async def get_object(bucket: str, key: str) -> Response:
+        if (bucket, key) not in objects:
+            return _error(404, "NoSuchKey", key)
+        data, content_type, modified = objects[bucket, key]
+        return Response(data, headers=headers(data, content_type, modified))
+
+    @app.head("/{bucket}/{key:path}")
+    async def head_object(bucket: str, key: str) -> Response:
+        if (bucket, key) not in objects:
+            return Response(status_code=404)
+        data, content_type, modified = objects[bucket, key]
+        return Response(headers=headers(data, content_type, modified))
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8960)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark of the /extract serialization path on large boards.
+
+Compares the previous `json` module path (parse then validate, indented dumps,
+`json.dumps` per event) with `backend.utils.serialization` for request parsing,
+the raw board and design-token dumps and the SSE event frames, and validating
+the opaque element content with passing it through:
+
+    python -m backend.benchmarks.serialization --sizes 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import pydantic_core
+
+from backend.benchmarks.board import make_tokens
+from backend.benchmarks.pipeline import make_board
+from backend.common import Cluster, Element, MoodboardPayload, WeightsRequest
+from backend.utils.serialization import sse_event
+
+
+class _ValidatedElement(Element):
+    content: Dict[str, Any]  # walked by validation, base64 media included
+
+
+class _ValidatedPayload(MoodboardPayload):
+    elements: List[_ValidatedElement]
+    adapt_subject_file: Dict[str, Any] | None = None
+
+
+_ValidatedPayload.model_rebuild(_types_namespace={"Cluster": Cluster})
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return round(statistics.median(times) * 1000, 2)
+
+
+def _events(size: int) -> list[dict[str, Any]]:
+    progress = [
+        {
+            "type": "progress",
+            "data": {"current": i, "total": size, "stage": "Processing elements..."},
+        }
+        for i in range(size)
+    ]
+    weights = WeightsRequest(weights={i: (i * 37) % 101 for i in range(size)})
+    return [*progress, {"type": "weights", "data": weights, "session_id": "x"}]
+
+
+def _legacy_event(event: dict[str, Any]) -> str:
+    data = event["data"]
+    if isinstance(data, WeightsRequest):
+        event = {**event, "data": data.model_dump()}
+    return f"data: {json.dumps(event)}\n\n"
+
+
+def run(size: int, dimensions: int, repeat: int) -> list[dict[str, Any]]:
+    body = json.dumps(make_board(size)).encode()
+    payload = MoodboardPayload.model_validate_json(body)
+    tokens = make_tokens(size, dimensions)
+    events = _events(size)
+    cases = {
+        "parse": (
+            lambda: MoodboardPayload(**json.loads(body)),
+            lambda: MoodboardPayload.model_validate_json(body),
+        ),
+        "content": (
+            lambda: _ValidatedPayload.model_validate_json(body),
+            lambda: MoodboardPayload.model_validate_json(body),
+        ),
+        "raw_dump": (
+            lambda: json.dumps(payload.model_dump(), ensure_ascii=False, indent=2),
+            lambda: pydantic_core.to_json(payload),
+        ),
+        "token_dump": (
+            lambda: json.dumps(
+                [token.model_dump() for token in tokens], ensure_ascii=False, indent=2
+            ),
+            lambda: pydantic_core.to_json(tokens),
+        ),
+        "events": (
+            lambda: [_legacy_event(event) for event in events],
+            lambda: [sse_event(event) for event in events],
+        ),
+    }
+    rows = []
+    for name, (legacy, current) in cases.items():
+        legacy_ms = _median_ms(legacy, repeat)
+        current_ms = _median_ms(current, repeat)
+        rows.append(
+            {
+                "elements": size,
+                "case": name,
+                "legacy_ms": legacy_ms,
+                "current_ms": current_ms,
+                "speedup": round(legacy_ms / max(current_ms, 1e-3), 1),
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--dimensions", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'elements':>8} {'case':>10} {'legacy_ms':>10} {'current_ms':>10} {'x':>6}")
+    for size in args.sizes:
+        for row in run(size, args.dimensions, args.repeat):
+            print(
+                f"{row['elements']:>8} {row['case']:>10} {row['legacy_ms']:>10.2f} "
+                f"{row['current_ms']:>10.2f} {row['speedup']:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Serve the API on the fake model backends, e.g. as a load-test target.
+
+python -m backend.benchmarks.serve --port 8000 --llm-latency-ms 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import uvicorn
+
+from backend.benchmarks.pipeline import add_fake_arguments, setup
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    add_fake_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        app = setup(args, Path(cache_dir))
+        uvicorn.run(app.app, host=args.host, port=args.port, log_level=args.log_level)
+
+
+if __name__ == "__main__":
+    main()
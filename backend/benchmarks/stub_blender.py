@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Stand-in for the Blender executable in benchmarks.
+
+Accepts the arguments the Blender engine passes (`--background --factory-startup
+--python-expr <script>`), reads the output directory and views from the render
+script and writes flat grey JPEG views. STUB_BLENDER_LATENCY_S adds a delay.
+"""
+
+import os
+import re
+import sys
+import time
+
+from PIL import Image
+
+
+def main() -> None:
+    start = time.perf_counter()
+    script = sys.argv[sys.argv.index("--python-expr") + 1]
+    renders_dir = re.search(r'pathlib\.Path\("([^"]+)"\) / render_filename', script)
+    num_views = re.search(r"for i in range\((\d+)\)", script)
+    width = re.search(r"resolution_x = (\d+)", script)
+    height = re.search(r"resolution_y = (\d+)", script)
+    if not (renders_dir and num_views and width and height):
+        print("Error: unrecognised render script", file=sys.stderr)
+        sys.exit(1)
+
+    time.sleep(float(os.getenv("STUB_BLENDER_LATENCY_S", "0")))
+    names = [f"view_{i:01d}.jpg" for i in range(int(num_views.group(1)))]
+    if '"view_back.jpg"' in script:
+        names.append("view_back.jpg")
+    image = Image.new("RGB", (int(width.group(1)), int(height.group(1))), "grey")
+    for name in names:
+        image.save(os.path.join(renders_dir.group(1), name), format="JPEG")
+    print(f"IMAGIN3D_TIMING render={time.perf_counter() - start:.4f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,14 @@ from __future__ import annotations
 import base64
 import binascii
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
-import pydantic_ai
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 from typing import NamedTuple
 
+if TYPE_CHECKING:
+    import pydantic_ai
+
 # --- Frontend / Backend link ---
 
 
@@ -17,8 +19,17 @@ class MoodboardPayload(BaseModel):
     clusters: List[Cluster] = Field(default_factory=list)
     prompt: str = Field(default="")
     adapt_subject_text: Optional[str] = Field(default=None)
-    adapt_subject_file: Optional[Dict[str, Any]] = Field(default=None)
+    # opaque upload (base64 media included), passed through unvalidated
+    adapt_subject_file: SkipValidation[Optional[Dict[str, Any]]] = Field(default=None)
     multiview: bool = Field(default=False)
+    extra_outputs: List[Literal["video", "ply"]] = Field(
+        default_factory=list
+    )  # opt-in TRELLIS v1 outputs besides the GLB
+    priority: int = Field(default=0)  # higher runs first in the 3D generation queue
+    quality: str = Field(default="high")  # TRELLIS quality tier from the config
+    progressive: bool = Field(
+        default=False
+    )  # stream a draft model before the final one
 
 
 class WeightsRequest(BaseModel):
@@ -59,7 +70,8 @@ class GenerateResponse(BaseModel):
 
 class Element(BaseModel):
     id: int
-    content: Dict[str, Any]
+    # opaque to the backend, base64 media included; the handlers read what they need
+    content: SkipValidation[Dict[str, Any]]
     position: Dict[str, float]
     size: Dict[str, float]
 
@@ -147,4 +159,6 @@ def decode_data_url_to_binary_image(image_data_url: str) -> pydantic_ai.BinaryIm
     except binascii.Error as exc:
         raise ValueError("Invalid base64 image payload") from exc
 
+    import pydantic_ai
+
     return pydantic_ai.BinaryImage(data=image_bytes, media_type=media_type)
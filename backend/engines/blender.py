@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import pathlib
 import shutil
 
 import jinja2
-import pydantic_ai
 import structlog
 
 from backend.engines import engine
 
 logger = structlog.stdlib.get_logger(__name__)
 
+TIMING_PREFIX = "IMAGIN3D_TIMING"
+
 
 class Blender(engine.Engine):
     """Blender 3D engine implementation."""
@@ -32,6 +34,9 @@ class Blender(engine.Engine):
         self._jinja_env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(template_dir))
         )
+        self._template_hash = hashlib.sha256(
+            (template_dir / "render.j2").read_bytes()
+        ).hexdigest()
 
     @classmethod
     def get_semaphore(cls) -> asyncio.Semaphore:
@@ -39,20 +44,15 @@ class Blender(engine.Engine):
             cls._semaphore = asyncio.Semaphore(1)
         return cls._semaphore
 
-    async def render_views(
+    async def _render(
         self,
         model_path: pathlib.Path,
         output_dir: pathlib.Path,
-        render_back: bool = False,
-    ) -> list[engine.Render]:
+        settings: engine.RenderProfile,
+    ) -> None:
         async with self.get_semaphore():
-            # create renders directory if it doesn't exist
-            output_dir.mkdir(exist_ok=True, parents=True)
-
             # create the full script
-            full_script = self._create_render_script(
-                model_path, output_dir, render_back
-            )
+            full_script = self._create_render_script(model_path, output_dir, settings)
 
             # run blender and execute the rendering script
             try:
@@ -73,42 +73,39 @@ class Blender(engine.Engine):
                 logger.warning("Blender error during rendering.", exc_info=stderr)
                 raise engine.EngineException(stderr)
 
-            # collect rendered images
-            renders = []
-            for i in range(self.num_views):
-                render_filename = f"view_{i:01d}.jpg"
-                render_path = output_dir / render_filename
-
-                # check if the file exists before trying to read it
-                if not render_path.exists():
-                    raise FileNotFoundError(f"Render file not created: {render_path}")
+            logger.info("Blender render timings", **self._parse_timings(stdout))
 
-                with open(render_path, "rb") as f:
-                    image_bytes = f.read()
-                    renders.append(
-                        engine.Render(
-                            image=pydantic_ai.BinaryImage(
-                                data=image_bytes, media_type="image/jpeg"
-                            )
-                        )
-                    )
-
-            return renders
+    def _cache_settings(self, settings: engine.RenderProfile) -> dict:
+        return {**super()._cache_settings(settings), "template": self._template_hash}
 
     def _create_render_script(
         self,
         model_path: pathlib.Path,
         renders_dir: pathlib.Path,
-        render_back: bool = False,
+        settings: engine.RenderProfile,
     ) -> str:
         template = self._jinja_env.get_template("render.j2")
         return template.render(
-            cfg=self,
+            profile=settings,
             model_path=str(model_path.resolve()),
             renders_dir=str(renders_dir.resolve()),
-            render_back=render_back,
+            timing_prefix=TIMING_PREFIX,
         )
 
+    @staticmethod
+    def _parse_timings(stdout: str) -> dict[str, float]:
+        # the render script reports per-stage timings as "<prefix> <stage>=<seconds>"
+        timings = {}
+        for line in stdout.splitlines():
+            if not line.startswith(TIMING_PREFIX):
+                continue
+            stage, _, seconds = line[len(TIMING_PREFIX) :].strip().partition("=")
+            try:
+                timings[f"{stage}_s"] = float(seconds)
+            except ValueError:
+                continue
+        return timings
+
     async def _run_script(self, script_content: str) -> tuple[str, str, int | None]:
         exe_path = shutil.which(self.exe)
         if exe_path is None:
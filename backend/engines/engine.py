@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import pathlib
 from abc import ABC, abstractmethod
+from typing import Any
 
 import pydantic
 import pydantic_ai
 
+from backend.utils.cache import FileCache
+
+DEFAULT_PROFILE = "default"
+
 
 class Render(pydantic.BaseModel):
     image: pydantic_ai.BinaryImage = pydantic.Field(
@@ -18,6 +24,17 @@ class EngineException(Exception):
     pass
 
 
+@dataclasses.dataclass(frozen=True)
+class RenderProfile:
+    """Render settings for one use of an engine (ingestion, evaluation, ...)."""
+
+    resolution_x: int
+    resolution_y: int
+    num_views: int
+    samples: int
+    render_back: bool = False
+
+
 @dataclasses.dataclass
 class Engine(ABC):
     name: str
@@ -27,13 +44,98 @@ class Engine(ABC):
     resolution_y: int
     num_views: int
     timeout_s: int
+    samples: int = 64
+    cache: FileCache | None = None
+    profiles: dict[str, dict[str, Any]] = dataclasses.field(default_factory=dict)
+
+    def profile(self, name: str = DEFAULT_PROFILE) -> RenderProfile:
+        """Resolve a named profile; unset settings fall back to the engine defaults."""
+        default = RenderProfile(
+            resolution_x=self.resolution_x,
+            resolution_y=self.resolution_y,
+            num_views=self.num_views,
+            samples=self.samples,
+        )
+        if name == DEFAULT_PROFILE:
+            return default
+        if name not in self.profiles:
+            raise EngineException(f"Unknown render profile '{name}'")
+        return dataclasses.replace(default, **dict(self.profiles[name]))
 
-    @abstractmethod
     async def render_views(
         self,
         model_path: pathlib.Path,
         output_dir: pathlib.Path,
-        render_back: bool = False,
+        profile: str = DEFAULT_PROFILE,
     ) -> list[Render]:
-        """Render a number of camera views and return image renders per view."""
+        """Render the views of a named profile and return image renders per view."""
+        settings = self.profile(profile)
+
+        # reuse earlier renders of the same model with the same settings
+        cache_key = None
+        if self.cache is not None:
+            cache_key = await asyncio.to_thread(
+                self.cache.key, model_path, self._cache_settings(settings)
+            )
+            if await asyncio.to_thread(self.cache.restore, cache_key, output_dir):
+                return self._collect_renders(output_dir, settings)
+
+        output_dir.mkdir(exist_ok=True, parents=True)
+        await self._render(model_path, output_dir, settings)
+        renders = self._collect_renders(output_dir, settings)
+
+        if self.cache is not None and cache_key is not None:
+            await asyncio.to_thread(
+                self.cache.store, cache_key, self._view_paths(output_dir, settings)
+            )
+
+        return renders
+
+    @abstractmethod
+    async def _render(
+        self,
+        model_path: pathlib.Path,
+        output_dir: pathlib.Path,
+        settings: RenderProfile,
+    ) -> None:
+        """Write the views of `settings` to `output_dir` as view_<i>.jpg files."""
         pass
+
+    def _cache_settings(self, settings: RenderProfile) -> dict[str, Any]:
+        return {
+            **dataclasses.asdict(settings),
+            "engine": self.name,
+            "version": self.version,
+        }
+
+    @staticmethod
+    def _view_paths(
+        output_dir: pathlib.Path, settings: RenderProfile
+    ) -> list[pathlib.Path]:
+        paths = [output_dir / f"view_{i:01d}.jpg" for i in range(settings.num_views)]
+        if settings.render_back:
+            paths.append(output_dir / "view_back.jpg")
+        return paths
+
+    @staticmethod
+    def _collect_renders(
+        output_dir: pathlib.Path, settings: RenderProfile
+    ) -> list[Render]:
+        renders = []
+        for i in range(settings.num_views):
+            render_path = output_dir / f"view_{i:01d}.jpg"
+
+            # check if the file exists before trying to read it
+            if not render_path.exists():
+                raise FileNotFoundError(f"Render file not created: {render_path}")
+
+            with open(render_path, "rb") as f:
+                renders.append(
+                    Render(
+                        image=pydantic_ai.BinaryImage(
+                            data=f.read(), media_type="image/jpeg"
+                        )
+                    )
+                )
+
+        return renders
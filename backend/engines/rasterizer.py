@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import pathlib
+import time
+
+import numpy as np
+import structlog
+import trimesh
+from PIL import Image
+
+from backend.engines import engine
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# match the framing and lighting of engines/templates/render.j2
+FOV_DEG = 30.0
+RADIUS_FACTOR = 2.5
+ELEVATION_FACTOR = 0.6
+AMBIENT = 0.35
+KEY_STRENGTH = 0.75
+BACKGROUND = (204, 204, 204)
+# upper bound on pixel samples evaluated at once, bounds peak memory per chunk
+MAX_CHUNK_SAMPLES = 1 << 22
+
+
+class Rasterizer(engine.Engine):
+    """CPU software rasterizer; renders the same orbit views as Blender using numpy."""
+
+    def __init__(self, *args, supersample: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.supersample = supersample
+
+    async def _render(
+        self,
+        model_path: pathlib.Path,
+        output_dir: pathlib.Path,
+        settings: engine.RenderProfile,
+    ) -> None:
+        try:
+            await asyncio.wait_for(
+                asyncio.to_thread(self._render_sync, model_path, output_dir, settings),
+                self.timeout_s,
+            )
+        except asyncio.TimeoutError:
+            msg = f"Rasterizer timed out (>{self.timeout_s} s) during rendering."
+            logger.warning(msg)
+            raise engine.EngineException(msg)
+
+    def _render_sync(
+        self,
+        model_path: pathlib.Path,
+        output_dir: pathlib.Path,
+        settings: engine.RenderProfile,
+    ) -> None:
+        import_start = time.perf_counter()
+        meshes = _load_meshes(model_path)
+        import_s = time.perf_counter() - import_start
+
+        # frame the camera on the bounding box of all meshes
+        analysis_start = time.perf_counter()
+        if meshes:
+            bounds = np.array([m.bounds for m in meshes])
+            min_coords = bounds[:, 0].min(axis=0)
+            max_coords = bounds[:, 1].max(axis=0)
+            center = (min_coords + max_coords) / 2
+            max_dimension = float((max_coords - min_coords).max()) or 1.0
+        else:
+            center = np.zeros(3)
+            max_dimension = 1.0
+        scene_analysis_s = time.perf_counter() - analysis_start
+
+        # glTF is Y-up; the Blender importer maps it to Z-up, so orbit around Y here
+        angles = [
+            (f"view_{i:01d}.jpg", 2.0 * math.pi * i / settings.num_views)
+            for i in range(settings.num_views)
+        ]
+        if settings.render_back:
+            angles.append(("view_back.jpg", math.pi))
+
+        render_start = time.perf_counter()
+        for filename, angle in angles:
+            eye = center + np.array(
+                [
+                    max_dimension * RADIUS_FACTOR * math.sin(angle),
+                    max_dimension * ELEVATION_FACTOR,
+                    -max_dimension * RADIUS_FACTOR * math.cos(angle),
+                ]
+            )
+            image = self._render_view(meshes, eye, center, settings)
+            image.save(output_dir / filename, format="JPEG", quality=90)
+
+        logger.info(
+            "Rasterizer render timings",
+            import_s=round(import_s, 4),
+            scene_analysis_s=round(scene_analysis_s, 4),
+            render_s=round(time.perf_counter() - render_start, 4),
+        )
+
+    def _render_view(
+        self,
+        meshes: list[trimesh.Trimesh],
+        eye: np.ndarray,
+        target: np.ndarray,
+        settings: engine.RenderProfile,
+    ) -> Image.Image:
+        width = settings.resolution_x * self.supersample
+        height = settings.resolution_y * self.supersample
+
+        # camera basis, looking at the target with +Y up
+        forward = target - eye
+        forward /= np.linalg.norm(forward)
+        right = np.cross(forward, [0.0, 1.0, 0.0])
+        right /= np.linalg.norm(right)
+        up = np.cross(right, forward)
+        focal = (max(width, height) / 2) / math.tan(math.radians(FOV_DEG) / 2)
+
+        depth = np.full(height * width, np.inf, dtype=np.float32)
+        color = np.empty((height * width, 3), dtype=np.float32)
+        color[:] = BACKGROUND
+
+        for mesh in meshes:
+            _rasterize_mesh(
+                mesh, eye, right, up, forward, focal, width, height, depth, color
+            )
+
+        image = Image.fromarray(
+            np.clip(color, 0, 255).astype(np.uint8).reshape(height, width, 3)
+        )
+        if self.supersample > 1:
+            image = image.resize(
+                (settings.resolution_x, settings.resolution_y), Image.Resampling.BOX
+            )
+        return image
+
+
+def _load_meshes(model_path: pathlib.Path) -> list[trimesh.Trimesh]:
+    scene = trimesh.load(str(model_path), force="scene")
+    # bake node transforms into world-space meshes
+    return [
+        geometry
+        for geometry in scene.dump()
+        if isinstance(geometry, trimesh.Trimesh) and len(geometry.faces) > 0
+    ]
+
+
+def _surface(mesh: trimesh.Trimesh):
+    """Return (texture, uv, corner_colors, base_color) describing the diffuse colour."""
+    visual = mesh.visual
+    base_color = np.array([200.0, 200.0, 200.0])
+    if isinstance(visual, trimesh.visual.TextureVisuals):
+        material = visual.material
+        texture = getattr(material, "baseColorTexture", None)
+        if texture is None:
+            texture = getattr(material, "image", None)
+        factor = getattr(material, "baseColorFactor", None)
+        if factor is not None:
+            base_color = np.asarray(factor[:3], dtype=np.float64)
+            if base_color.max() <= 1.0:
+                base_color = base_color * 255
+        if texture is not None and visual.uv is not None:
+            pixels = np.asarray(texture.convert("RGB"), dtype=np.float32)
+            tint = (base_color / 255).astype(np.float32)
+            return pixels * tint, np.asarray(visual.uv, dtype=np.float32), None, None
+        return None, None, None, base_color
+    if visual.kind == "vertex":
+        vertex_colors = visual.vertex_colors[:, :3].astype(np.float32)
+        return None, None, vertex_colors[mesh.faces], None
+    if visual.kind == "face":
+        face_colors = visual.face_colors[:, :3].astype(np.float32)
+        return None, None, np.repeat(face_colors[:, None, :], 3, axis=1), None
+    return None, None, None, base_color
+
+
+def _rasterize_mesh(
+    mesh: trimesh.Trimesh,
+    eye: np.ndarray,
+    right: np.ndarray,
+    up: np.ndarray,
+    forward: np.ndarray,
+    focal: float,
+    width: int,
+    height: int,
+    depth: np.ndarray,
+    color: np.ndarray,
+) -> None:
+    # project vertices to screen space
+    relative = np.asarray(mesh.vertices, dtype=np.float64) - eye
+    cam_z = relative @ forward
+    screen_x = width / 2 + focal * (relative @ right) / cam_z
+    screen_y = height / 2 - focal * (relative @ up) / cam_z
+
+    faces = np.asarray(mesh.faces)
+    face_z = cam_z[faces]
+    x = screen_x[faces]
+    y = screen_y[faces]
+
+    # signed area; degenerate, clipped and off-screen triangles are skipped
+    area = (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0]) - (x[:, 2] - x[:, 0]) * (
+        y[:, 1] - y[:, 0]
+    )
+    keep = np.flatnonzero(
+        (face_z > 1e-6).all(axis=1)
+        & (np.abs(area) > 1e-12)
+        & (x.max(axis=1) >= 0)
+        & (x.min(axis=1) < width)
+        & (y.max(axis=1) >= 0)
+        & (y.min(axis=1) < height)
+    )
+    if keep.size == 0:
+        return
+    faces, face_z, x, y, area = faces[keep], face_z[keep], x[keep], y[keep], area[keep]
+
+    x_min = np.floor(x.min(axis=1)).clip(0, width - 1).astype(np.int64)
+    x_max = np.ceil(x.max(axis=1)).clip(0, width - 1).astype(np.int64)
+    y_min = np.floor(y.min(axis=1)).clip(0, height - 1).astype(np.int64)
+    y_max = np.ceil(y.max(axis=1)).clip(0, height - 1).astype(np.int64)
+
+    # barycentric coordinates are affine in screen space: b = a * x + b * y + c
+    edges = np.stack(
+        [
+            y[:, 1] - y[:, 2],
+            x[:, 2] - x[:, 1],
+            x[:, 1] * y[:, 2] - x[:, 2] * y[:, 1],
+            y[:, 2] - y[:, 0],
+            x[:, 0] - x[:, 2],
+            x[:, 2] * y[:, 0] - x[:, 0] * y[:, 2],
+        ],
+        axis=1,
+    )
+    edges = (edges / area[:, None]).astype(np.float32)
+    inv_face_z = (1.0 / face_z).astype(np.float32)
+
+    # two-sided lambert shading with the key light along the view direction
+    normals = np.asarray(mesh.face_normals, dtype=np.float64)[keep]
+    shade = (AMBIENT + KEY_STRENGTH * np.abs(normals @ forward)).astype(np.float32)
+
+    texture, uv, corner_colors, base_color = _surface(mesh)
+    if corner_colors is not None:
+        corner_colors = corner_colors[keep]
+
+    counts = (x_max - x_min + 1) * (y_max - y_min + 1)
+    start = 0
+    while start < faces.shape[0]:
+        # take as many triangles as fit into one chunk of pixel samples
+        cumulative = np.cumsum(counts[start:])
+        stop = start + max(1, int(np.searchsorted(cumulative, MAX_CHUNK_SAMPLES)))
+        chunk_counts = counts[start:stop]
+
+        # enumerate every pixel in each triangle's bounding box
+        face = np.repeat(np.arange(start, stop), chunk_counts)
+        offsets = np.arange(face.size) - np.repeat(
+            np.cumsum(chunk_counts) - chunk_counts, chunk_counts
+        )
+        start = stop
+        box_w = x_max[face] - x_min[face] + 1
+        px = x_min[face] + offsets % box_w
+        py = y_min[face] + offsets // box_w
+        sx = px.astype(np.float32) + 0.5
+        sy = py.astype(np.float32) + 0.5
+
+        coef = edges[face]
+        b0 = coef[:, 0] * sx + coef[:, 1] * sy + coef[:, 2]
+        b1 = coef[:, 3] * sx + coef[:, 4] * sy + coef[:, 5]
+        b2 = 1.0 - b0 - b1
+        inside = (b0 >= 0) & (b1 >= 0) & (b2 >= 0)
+        if not inside.any():
+            continue
+
+        face = face[inside]
+        pixel = py[inside] * width + px[inside]
+        bary = np.stack([b0[inside], b1[inside], b2[inside]], axis=1)
+
+        # perspective-correct interpolation
+        inv_z = bary * inv_face_z[face]
+        z = 1.0 / inv_z.sum(axis=1)
+        bary = inv_z * z[:, None]
+
+        # depth test; the nearest sample per pixel wins
+        nearer = z < depth[pixel]
+        face, pixel, bary, z = face[nearer], pixel[nearer], bary[nearer], z[nearer]
+        np.minimum.at(depth, pixel, z)
+        winner = z == depth[pixel]
+        face, pixel, bary = face[winner], pixel[winner], bary[winner]
+        if pixel.size == 0:
+            continue
+
+        if texture is not None:
+            sample_uv = np.einsum("ij,ijk->ik", bary, uv[faces[face]])
+            tex_h, tex_w = texture.shape[:2]
+            u = np.mod(sample_uv[:, 0], 1.0)
+            v = np.mod(sample_uv[:, 1], 1.0)
+            tx = (u * (tex_w - 1)).astype(np.int64)
+            ty = ((1.0 - v) * (tex_h - 1)).astype(np.int64)
+            albedo = texture[ty, tx]
+        elif corner_colors is not None:
+            albedo = np.einsum("ij,ijk->ik", bary, corner_colors[face])
+        else:
+            albedo = np.broadcast_to(base_color, (face.size, 3))
+
+        color[pixel] = albedo * shade[face][:, None]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+
+import structlog
+
+from backend.engines import engine
+from backend.utils.remote import (
+    RemoteClient,
+    RemoteWorkerError,
+    decode_files,
+    encode_files,
+)
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class RemoteEngine(engine.Engine):
+    """Dispatches renders to a render node running `python -m backend.worker render`."""
+
+    def __init__(self, *args, url: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = RemoteClient(url, self.timeout_s)
+
+    async def _render(
+        self,
+        model_path: pathlib.Path,
+        output_dir: pathlib.Path,
+        settings: engine.RenderProfile,
+    ) -> None:
+        payload = {
+            "model": encode_files([model_path])[0],
+            "settings": dataclasses.asdict(settings),
+        }
+        try:
+            reply = await self.client.post("/render", payload)
+        except RemoteWorkerError as e:
+            logger.warning("Remote render failed", error=str(e))
+            raise engine.EngineException(str(e))
+        decode_files(reply["files"], output_dir)
@@ -0,0 +1,234 @@
+"""Offline batch evaluation over stored moodboards.
+
+Replays moodboards dumped by /extract (`artifacts/raw/moodboard-*.json`)
+against running API servers, confirming weights and master prompts
+automatically, and appends one row per board to a CSV results table:
+
+    python -m backend.evaluate boards/ --url http://localhost:8000 --results results.csv
+
+Boards already in the table with status "ok" are skipped, so an interrupted
+run picks up where it stopped. Each server runs `--concurrency` boards at a
+time, and boards are spread over several servers by repeating `--url`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ROOT_DIR = Path(__file__).parent.resolve()
+
+# Stage names of the "stats" event emitted at the end of /extract
+STAGES = (
+    "design_tokens",
+    "clusters",
+    "intent_router",
+    "master_prompt",
+    "master_image",
+    "generation_3d",
+    "evaluation",
+)
+FIELDS = (
+    "board",
+    "status",
+    "error",
+    "preservation",
+    "closeness",
+    "model",
+    "cost",
+    "wall_s",
+    *(f"{stage}_s" for stage in STAGES),
+    "rejected",
+)
+
+
+def load_results(path: Path) -> dict[str, dict[str, str]]:
+    """Read an existing results table, keyed by board file name."""
+    if not path.exists():
+        return {}
+    with path.open(newline="", encoding="utf-8") as f:
+        return {row["board"]: row for row in csv.DictReader(f)}
+
+
+def append_result(path: Path, row: dict[str, Any]) -> None:
+    new_file = not path.exists() or path.stat().st_size == 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+async def run_board(
+    client: httpx.AsyncClient, url: str, board_path: Path, timeout_s: float
+) -> dict[str, Any]:
+    """Run one moodboard through /extract on `url` and collect its results."""
+    row: dict[str, Any] = {"board": board_path.name, "status": "error"}
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(_stream_board(client, url, board_path, row), timeout_s)
+    except asyncio.TimeoutError:
+        row["error"] = f"timed out after {timeout_s:.0f}s"
+    except (httpx.HTTPError, OSError, ValueError) as e:
+        row["error"] = str(e) or type(e).__name__
+    row["wall_s"] = round(time.perf_counter() - start, 3)
+    return row
+
+
+async def _stream_board(
+    client: httpx.AsyncClient, url: str, board_path: Path, row: dict[str, Any]
+) -> None:
+    payload = board_path.read_bytes()
+    async with client.stream(
+        "POST",
+        f"{url}/extract",
+        content=payload,
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            raise ValueError(f"/extract failed ({response.status_code})")
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            event = json.loads(line[len("data: ") :])
+            event_type = event.get("type")
+            if event_type in ("weights", "master_prompt"):
+                # accept the suggested weights and master image as-is
+                reply = await client.post(
+                    f"{url}/confirm-weights/{event['session_id']}",
+                    json={"confirmed": True},
+                )
+                reply.raise_for_status()
+            elif event_type == "complete":
+                row["model"] = event["data"].get("file")
+            elif event_type == "score":
+                row[event["data"]["type"]] = event["data"]["score"]
+            elif event_type == "rejected":
+                # the board goes on without the element
+                row["rejected"] = row.get("rejected", 0) + 1
+            elif event_type == "stats":
+                row["cost"] = event["data"]["cost"]
+                for stage, seconds in event["data"]["stages"].items():
+                    row[f"{stage}_s"] = seconds
+            elif event_type in ("error", "cancelled"):
+                row["status"] = event_type
+                row["error"] = event["data"]
+                return
+    if "model" not in row:
+        raise ValueError("stream ended before the model was generated")
+    row["status"] = "ok"
+
+
+async def evaluate(
+    boards: list[Path],
+    urls: list[str],
+    results_path: Path,
+    timeout_s: float,
+    concurrency: int = 1,
+) -> list[dict[str, Any]]:
+    """Run `boards` spread over the servers at `urls`, `concurrency` per server."""
+    queue: asyncio.Queue[Path] = asyncio.Queue()
+    for board in boards:
+        queue.put_nowait(board)
+    rows = []
+
+    async def worker(url: str) -> None:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(60, read=None)) as client:
+            while not queue.empty():
+                board = queue.get_nowait()
+                logger.info("Evaluating moodboard", board=board.name, url=url)
+                row = await run_board(client, url, board, timeout_s)
+                append_result(results_path, row)
+                rows.append(row)
+                logger.info(
+                    "Moodboard evaluated",
+                    board=board.name,
+                    status=row["status"],
+                    error=row.get("error"),
+                    wall_s=row["wall_s"],
+                )
+
+    await asyncio.gather(
+        *(worker(url.rstrip("/")) for url in urls for _ in range(concurrency))
+    )
+    return rows
+
+
+def summarize(rows: list[dict[str, Any]]) -> str:
+    ok = [row for row in rows if row["status"] == "ok"]
+    lines = [f"{len(ok)}/{len(rows)} boards completed"]
+    for column in ("preservation", "closeness", "cost", "wall_s"):
+        values = [float(row[column]) for row in ok if row.get(column) not in (None, "")]
+        if values:
+            lines.append(
+                f"{column:>12}: mean {statistics.mean(values):.4f}, "
+                f"min {min(values):.4f}, max {max(values):.4f}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("boards", type=Path, help="directory of moodboard-*.json")
+    parser.add_argument(
+        "--url",
+        action="append",
+        help="API server to run boards on; repeat to use several "
+        "(default: http://localhost:8000)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="boards run at once per server"
+    )
+    parser.add_argument("--results", type=Path, default=Path("evaluation.csv"))
+    parser.add_argument(
+        "--timeout", type=float, default=1800, help="per-board timeout in seconds"
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    boards_dir = args.boards.resolve()
+    if boards_dir.is_relative_to(ROOT_DIR / "artifacts"):
+        parser.error(
+            "copy the moodboards out of backend/artifacts first, "
+            "/extract clears that directory"
+        )
+    done = {
+        board
+        for board, row in load_results(args.results).items()
+        if row["status"] == "ok"
+    }
+    boards = [
+        path
+        for path in sorted(boards_dir.glob("moodboard-*.json"))
+        if path.name not in done
+    ]
+    logger.info("Starting batch evaluation", boards=len(boards), skipped=len(done))
+
+    rows = asyncio.run(
+        evaluate(
+            boards,
+            args.url or ["http://localhost:8000"],
+            args.results,
+            args.timeout,
+            args.concurrency,
+        )
+    )
+    print(summarize(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,40 @@
 from __future__ import annotations
 
-import base64
+import asyncio
 import io
+import os
+import time
+import uuid
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
-import boto3
-import numpy as np
-import hydra
 from PIL import Image
-from hydra import compose, initialize_config_dir
-from omegaconf import DictConfig
-import pydantic_ai
 import structlog
 
 from backend import common
-from backend.agents.descriptor import Descriptor
-from backend.agents.clusterer import Clusterer
-from backend.agents.intent_router import IntentRouter
-from backend.agents.prompt_synthesizer import PromptSynthesizer
-from backend.agents.visualizer import Visualizer
-from backend.engines.blender import Blender
-from backend.utils.trellis import TrellisEngine
-from backend.utils.embeddings import BedrockEmbeddingFunction
-from backend.utils.video import extract_key_frames
+from backend.utils.trellis import DEFAULT_TIER
+from backend.utils.jobs import Job, JobQueue
+from backend.utils.media import MediaPool, encode_data_urls, save_data_url, to_jpeg
+
+# Heavy modules (model SDKs, Hydra, numpy, mesh and video libraries) are imported
+# at first use, so the server binds before the components are built
+if TYPE_CHECKING:
+    import numpy as np
+    import pydantic_ai
+    from omegaconf import DictConfig
+
+    from backend.agents.descriptor import Descriptor
+    from backend.agents.clusterer import Clusterer
+    from backend.agents.intent_router import IntentRouter
+    from backend.agents.prompt_synthesizer import PromptSynthesizer
+    from backend.agents.visualizer import Visualizer
+    from backend.engines.engine import Engine
+    from backend.utils.board import Moodboard
+    from backend.utils.storage import Storage
+    from backend.utils.trellis import TrellisEngine
+    from backend.utils.embeddings import BedrockEmbeddingFunction
+    from backend.utils.glb import ModelPreprocessor
+    from backend.utils.video import KeyFrameExtractor
 
 # Logging configuration
 logger = structlog.stdlib.get_logger(__name__)
@@ -32,8 +43,12 @@ logger = structlog.stdlib.get_logger(__name__)
 RELEVANCE_THRESHOLD = 50
 ROOT_DIR = Path(__file__).parent.resolve()
 _initialized = False
-blender_engine: Union[Blender, None] = None
+render_engine: Union[Engine, None] = None
+model_preprocessor: Union[ModelPreprocessor, None] = None
 trellis_engine: Union[TrellisEngine, None] = None
+job_queue: Union[JobQueue, None] = None
+key_frame_extractor: Union[KeyFrameExtractor, None] = None
+media_pool: Union[MediaPool, None] = None
 descriptor: Union[Descriptor, None] = None
 clusterer: Union[Clusterer, None] = None
 intent_router: Union[IntentRouter, None] = None
@@ -41,52 +56,247 @@ prompt_synthesizer: Union[PromptSynthesizer, None] = None
 visualizer: Union[Visualizer, None] = None
 bedrock_client: Any = None
 embedding_function: Union[BedrockEmbeddingFunction, None] = None
+storage: Union[Storage, None] = None
+
+
+# Components built from the Hydra config, by global name and config key
+_COMPONENTS = {
+    # built first; the caches of other components share it
+    "storage": "storage",
+    "descriptor": "descriptor",
+    "clusterer": "clusterer",
+    "intent_router": "intent_router",
+    "prompt_synthesizer": "prompt_synthesizer",
+    "visualizer": "visualizer",
+    "render_engine": "engine",
+    "model_preprocessor": "model_preprocessor",
+    "trellis_engine": "trellis",
+    "job_queue": "jobs",
+    "key_frame_extractor": "video",
+    "media_pool": "media_pool",
+}
+COMPONENT_NAMES = (*_COMPONENTS, "embedding_function")
+# Only 3D generation needs these, so the other stages don't wait for them
+GENERATION_COMPONENTS = ("trellis_engine", "job_queue")
+INGESTION_COMPONENTS = tuple(
+    name for name in COMPONENT_NAMES if name not in GENERATION_COMPONENTS
+)
+# Components can be used once built; warming or cold ones load on first use
+USABLE = ("warming", "cold", "ready")
+component_status: dict[str, str] = {}  # loading, warming, cold, ready or failed
+component_errors: dict[str, str] = {}
+component_durations: dict[str, float] = {}
+# Sequential startup phases in seconds; the app adds its own import time
+startup_phases: dict[str, float] = {}
+_init_task: Optional[asyncio.Task] = None
+
+
+def _compose_config(overrides: Sequence[str] = ()) -> DictConfig:
+    from hydra import compose, initialize_config_dir
+
+    # Initialize via Hydra configuration
+    config_dir = str(ROOT_DIR / "config")
+    with initialize_config_dir(config_dir=config_dir, version_base=None):
+        cfg = compose(config_name="config", overrides=list(overrides))
+    _apply_endpoints(cfg)
+    return cfg
+
+
+def _apply_endpoints(cfg: DictConfig) -> None:
+    # the boto3 and google-genai clients, including those inside the agents'
+    # models, read endpoint overrides from the environment
+    if cfg.endpoints.bedrock:
+        os.environ["AWS_ENDPOINT_URL_BEDROCK_RUNTIME"] = cfg.endpoints.bedrock
+    if cfg.endpoints.google:
+        os.environ["GOOGLE_GEMINI_BASE_URL"] = cfg.endpoints.google
+
+
+def _init_component(name: str, cfg: DictConfig) -> None:
+    global bedrock_client, embedding_function
+
+    component_status[name] = "loading"
+    start = time.perf_counter()
+    try:
+        if name == "embedding_function":
+            import boto3
+            from backend.utils.embeddings import BedrockEmbeddingFunction
+
+            bedrock_client = boto3.client("bedrock-runtime")
+            embedding_function = BedrockEmbeddingFunction(bedrock_client)
+        else:
+            import hydra.utils
+
+            node = cfg[_COMPONENTS[name]]
+            # caches reuse the storage component rather than building a client each
+            shared = {}
+            if name != "storage" and storage is not None and node.get("cache"):
+                shared = {"cache": {"storage": storage}}
+            globals()[name] = hydra.utils.instantiate(node, **shared)
+    except Exception as e:
+        component_status[name] = "failed"
+        component_errors[name] = str(e)
+        logger.error("Failed to initialize component", component=name, error=str(e))
+        raise
+    _size_job_queue()
+    component_status[name] = "ready"
+    component_durations[name] = round(time.perf_counter() - start, 2)
+    logger.info(
+        "Initialized component",
+        component=name,
+        duration_s=component_durations[name],
+    )
+
+
+def _size_job_queue() -> None:
+    # the queue runs as many jobs at once as the engine takes, unless configured
+    if job_queue is None or trellis_engine is None or job_queue.concurrency:
+        return
+    job_queue.concurrency = trellis_engine.job_concurrency
+    logger.info("Sized job queue", concurrency=job_queue.concurrency)
 
 
 def _initialize():
-    global \
-        _initialized, \
-        blender_engine, \
-        trellis_engine, \
-        descriptor, \
-        clusterer, \
-        intent_router, \
-        prompt_synthesizer, \
-        visualizer, \
-        bedrock_client, \
-        embedding_function
+    """Build all components synchronously; heavy engines load on first use."""
+    global _initialized
 
     if _initialized:
         return
 
-    # Initialize via Hydra configuration
-    config_dir = str(ROOT_DIR / "config")
-    with initialize_config_dir(config_dir=config_dir, version_base=None):
-        cfg: DictConfig = compose(config_name="config")
-
-    blender_engine = hydra.utils.instantiate(cfg.engine)
-    trellis_engine = hydra.utils.instantiate(cfg.trellis)
-    descriptor = hydra.utils.instantiate(cfg.descriptor)
-    clusterer = hydra.utils.instantiate(cfg.clusterer)
-    intent_router = hydra.utils.instantiate(cfg.intent_router)
-    prompt_synthesizer = hydra.utils.instantiate(cfg.prompt_synthesizer)
-    visualizer = hydra.utils.instantiate(cfg.visualizer)
-    bedrock_client = boto3.client("bedrock-runtime")
-    embedding_function = BedrockEmbeddingFunction(bedrock_client)
+    cfg = _compose_config()
+    for name in COMPONENT_NAMES:
+        _init_component(name, cfg)
     _initialized = True
 
 
-async def handle_model(element: dict) -> tuple[str, str]:
-    # Save model file
-    model_path = await _save_model_file(element)
+def initialize_with(overrides: Sequence[str] = (), **components: Any) -> None:
+    """Build all components synchronously from the config with `overrides`.
+
+    Components passed by name are used as-is, e.g. fake model backends in benchmarks.
+    """
+    global _initialized
+
+    unknown = set(components) - set(COMPONENT_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown components: {sorted(unknown)}")
+    cfg = _compose_config(overrides)
+    for name in COMPONENT_NAMES:
+        if name in components:
+            globals()[name] = components[name]
+            component_status[name] = "ready"
+        else:
+            _init_component(name, cfg)
+    _size_job_queue()
+    _initialized = True
+
+
+async def _initialize_async() -> None:
+    global _initialized
+
+    if _initialized:
+        return
+
+    for name in COMPONENT_NAMES:
+        component_status.setdefault(name, "loading")
+    start = time.perf_counter()
+    cfg = await asyncio.to_thread(_compose_config)
+    startup_phases["config_s"] = round(time.perf_counter() - start, 2)
+
+    # storage is shared by the caches of other components; the rest are
+    # independent, so build them concurrently
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        asyncio.to_thread(_init_component, "storage", cfg), return_exceptions=True
+    )
+    results += await asyncio.gather(
+        *(
+            asyncio.to_thread(_init_component, name, cfg)
+            for name in COMPONENT_NAMES
+            if name != "storage"
+        ),
+        return_exceptions=True,
+    )
+    _initialized = not any(isinstance(r, Exception) for r in results)
+    startup_phases["components_s"] = round(time.perf_counter() - start, 2)
+
+    # warm up the 3D engine last; the LLM stages already accept traffic
+    if component_status.get("trellis_engine") == "ready":
+        start = time.perf_counter()
+        await _warm_up_trellis()
+        startup_phases["trellis_warmup_s"] = round(time.perf_counter() - start, 2)
+
+    slowest = max(component_durations, key=component_durations.get, default=None)
+    logger.info(
+        "Startup phases",
+        **startup_phases,
+        total_s=round(sum(startup_phases.values()), 2),
+        slowest_component=slowest,
+    )
+
+
+async def _warm_up_trellis() -> None:
+    component_status["trellis_engine"] = "warming"
+    start = time.perf_counter()
+    try:
+        await trellis_engine.start()
+    except Exception as e:
+        # jobs retry the load on their own
+        component_status["trellis_engine"] = "cold"
+        component_errors["trellis_engine"] = str(e)
+        logger.error("Failed to warm up TRELLIS engine", error=str(e))
+        return
+    component_status["trellis_engine"] = "ready"
+    logger.info(
+        "Warmed up TRELLIS engine",
+        prewarm=trellis_engine.prewarm,
+        duration_s=round(time.perf_counter() - start, 2),
+    )
+
+
+def start_initialization() -> asyncio.Task:
+    """Initialize all components in the background; safe to call repeatedly."""
+    global _init_task
+
+    if _init_task is None:
+        _init_task = asyncio.create_task(_initialize_async())
+    return _init_task
+
+
+async def wait_ready(*names: str, timeout_s: float = 300.0) -> None:
+    """Wait until the named components (default: all) can be used."""
+    start_initialization()
+    names = names or COMPONENT_NAMES
+    deadline = time.monotonic() + timeout_s
+    while True:
+        failed = [n for n in names if component_status.get(n) == "failed"]
+        if failed:
+            raise RuntimeError(f"Components failed to initialize: {failed}")
+        if all(component_status.get(n) in USABLE for n in names):
+            return
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Timed out waiting for components: {list(names)}")
+        await asyncio.sleep(0.1)
+
+
+def llm_cost() -> float:
+    """Total LLM spend (USD) of all agents since startup."""
+    agents = (descriptor, clusterer, intent_router, prompt_synthesizer, visualizer)
+    return sum(agent.total_cost.price for agent in agents if agent is not None)
+
+
+async def handle_model(
+    element: dict, run_dir: Path, profile: str = "ingestion"
+) -> tuple[str, str]:
+    # Save model file and build a bounded-size proxy for rendering
+    model_path = await _save_model_file(element, run_dir)
+    proxy_path = await asyncio.to_thread(model_preprocessor.prepare, model_path)
 
     # Create renders directory
     unique_name = str(element["id"])
-    renders_dir = ROOT_DIR / "artifacts" / "model_renders" / unique_name
+    renders_dir = run_dir / "model_renders" / unique_name
     renders_dir.mkdir(parents=True, exist_ok=True)
 
-    # Create renders using Blender
-    renders = await blender_engine.render_views(model_path, renders_dir)
+    # Create renders using the configured render engine
+    renders = await render_engine.render_views(proxy_path, renders_dir, profile)
     images = [render.image for render in renders]
 
     # Generate title and description
@@ -94,15 +304,19 @@ async def handle_model(element: dict) -> tuple[str, str]:
     return result.output.info.title, result.output.info.description
 
 
-async def handle_video(element: dict) -> tuple[str, str]:
+async def handle_video(element: dict, run_dir: Path) -> tuple[str, str]:
+    from backend.utils.video import save_video
+
     video_base64 = element["content"]["data"]["src"]
+    unique_name = str(element["id"])
 
-    # Extract key frames from video
-    frames = extract_key_frames(video_base64, frame_count=5)
+    # Save the video asset and extract key frames from it in a single pass
+    videos_dir = run_dir / "videos"
+    video_path = await media_pool.run(save_video, video_base64, videos_dir, unique_name)
+    frames = await media_pool.run(key_frame_extractor.extract, video_path)
 
     # Save the frames
-    unique_name = str(element["id"])
-    frames_dir = ROOT_DIR / "artifacts" / "video_frames" / unique_name
+    frames_dir = run_dir / "video_frames" / unique_name
     frames_dir.mkdir(parents=True, exist_ok=True)
     for i, frame in enumerate(frames):
         frame_path = frames_dir / f"frame_{i}.jpg"
@@ -114,23 +328,16 @@ async def handle_video(element: dict) -> tuple[str, str]:
     return result.output.info.title, result.output.info.description
 
 
-async def handle_image(element: dict) -> tuple[str, str]:
+async def handle_image(element: dict, run_dir: Path) -> tuple[str, str]:
     image_base64 = element["content"]["data"]["src"]
 
     # Process image into BinaryImage, converting to JPEG
-    base64_data = image_base64.split(",", 1)[1]
-    raw_bytes = base64.b64decode(base64_data)
-    img = Image.open(io.BytesIO(raw_bytes))
-    if img.mode in ("RGBA", "P", "LA"):
-        img = img.convert("RGB")
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG")
-    image_bytes = buf.getvalue()
-    image = pydantic_ai.BinaryImage(data=image_bytes, media_type="image/jpeg")
+    image_bytes = await media_pool.run(to_jpeg, image_base64)
+    image = _binary_image(image_bytes)
 
     # Save image to artifacts
     unique_name = str(element["id"])
-    images_dir = ROOT_DIR / "artifacts" / "images" / unique_name
+    images_dir = run_dir / "images" / unique_name
     images_dir.mkdir(parents=True, exist_ok=True)
     image_path = images_dir / "image.jpg"
     with open(image_path, "wb") as f:
@@ -196,6 +403,7 @@ def generate_embedding(title: str) -> list[float]:
 async def synthesize_master_prompt(
     prompt: str,
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
     subject: str | None = None,
 ) -> str:
     filtered_clusters = []
@@ -220,14 +428,14 @@ async def synthesize_master_prompt(
                 }
             )
 
-    style_images = _collect_style_images(clusters)
+    style_images = _collect_style_images(clusters, run_dir)
     result = await prompt_synthesizer.run(
         prompt, filtered_clusters, subject, images=style_images
     )
     master_prompt = result.output.info.prompt
 
     # Save master prompt to artifacts
-    master_prompt_path = ROOT_DIR / "artifacts" / "master_prompt.txt"
+    master_prompt_path = run_dir / "master_prompt.txt"
     with open(master_prompt_path, "w") as f:
         f.write(master_prompt)
 
@@ -237,10 +445,11 @@ async def synthesize_master_prompt(
 async def generate_master_image(
     master_prompt: str,
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
     base_image_path: Path | None = None,
     prompt: str | None = None,
 ) -> Path:
-    style_images = _collect_style_images(clusters)
+    style_images = _collect_style_images(clusters, run_dir)
     logger.info(
         f"Collected {len(style_images)} style images for master image generation"
     )
@@ -248,7 +457,7 @@ async def generate_master_image(
     base_image = None
     if base_image_path and Path(base_image_path).exists():
         with open(base_image_path, "rb") as f:
-            base_image = pydantic_ai.BinaryImage(data=f.read(), media_type="image/jpeg")
+            base_image = _binary_image(f.read())
 
     # Generate master image
     result = await visualizer.run(
@@ -256,7 +465,7 @@ async def generate_master_image(
     )
 
     # Save master image to artifacts
-    master_image_path = ROOT_DIR / "artifacts" / "master_image.jpg"
+    master_image_path = run_dir / "master_image.jpg"
 
     with open(master_image_path, "wb") as f:
         f.write(result.output.data)
@@ -267,16 +476,17 @@ async def generate_master_image(
 async def edit_master_image(
     edit_prompt: str,
     image_data_url: str,
+    run_dir: Path,
     clusters: list[common.ClusterDescriptor] | None = None,
 ) -> Path:
     source_image = common.decode_data_url_to_binary_image(image_data_url)
     style_images = [source_image] + (
-        _collect_style_images(clusters) if clusters else []
+        _collect_style_images(clusters, run_dir) if clusters else []
     )
 
     result = await visualizer.run(edit_prompt, style_images, is_edit=True)
     # Save master image to artifacts
-    master_image_path = ROOT_DIR / "artifacts" / "master_image.jpg"
+    master_image_path = run_dir / "master_image.jpg"
 
     with open(master_image_path, "wb") as f:
         f.write(result.output.data)
@@ -287,36 +497,35 @@ async def edit_master_image(
 async def generate_multiview_master_images(
     master_prompt: str,
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
     base_image_path: Path | None = None,
     prompt: str | None = None,
 ):
-    style_images = _collect_style_images(clusters)
+    style_images = _collect_style_images(clusters, run_dir)
     logger.info(f"Collected {len(style_images)} style images for multiview generation")
 
     base_image = None
     if base_image_path and Path(base_image_path).exists():
         with open(base_image_path, "rb") as f:
-            base_image = pydantic_ai.BinaryImage(data=f.read(), media_type="image/jpeg")
+            base_image = _binary_image(f.read())
 
     # Generate front view
     result_front = await visualizer.run(
         master_prompt, style_images, base_image, prompt=prompt, view="front"
     )
-    front_image_path = ROOT_DIR / "artifacts" / "master_image_front.jpg"
+    front_image_path = run_dir / "master_image_front.jpg"
     with open(front_image_path, "wb") as f:
         f.write(result_front.output.data)
 
     yield {"event": "front_done"}
 
     # Generate back view + prepend the front image so the model can maintain consistency
-    front_binary = pydantic_ai.BinaryImage(
-        data=result_front.output.data, media_type="image/jpeg"
-    )
+    front_binary = _binary_image(result_front.output.data)
     back_style_images = [front_binary] + style_images
     result_back = await visualizer.run(
         master_prompt, back_style_images, base_image, prompt=prompt, view="back"
     )
-    back_image_path = ROOT_DIR / "artifacts" / "master_image_back.jpg"
+    back_image_path = run_dir / "master_image_back.jpg"
     with open(back_image_path, "wb") as f:
         f.write(result_back.output.data)
 
@@ -330,10 +539,11 @@ async def edit_multiview_master_images(
     edit_prompt: str,
     front_data_url: str,
     back_data_url: str,
+    run_dir: Path,
     view: str = "both",
     clusters: list[common.ClusterDescriptor] | None = None,
 ) -> dict[str, Path]:
-    collected_styles = _collect_style_images(clusters) if clusters else []
+    collected_styles = _collect_style_images(clusters, run_dir) if clusters else []
 
     source_front = common.decode_data_url_to_binary_image(front_data_url)
     style_images_front = [source_front] + collected_styles
@@ -341,8 +551,8 @@ async def edit_multiview_master_images(
     source_back = common.decode_data_url_to_binary_image(back_data_url)
     style_images_back = [source_back] + collected_styles
 
-    front_image_path = ROOT_DIR / "artifacts" / "master_image_front.jpg"
-    back_image_path = ROOT_DIR / "artifacts" / "master_image_back.jpg"
+    front_image_path = run_dir / "master_image_front.jpg"
+    back_image_path = run_dir / "master_image_back.jpg"
 
     if view in ["both", "front"]:
         result_front = await visualizer.run(
@@ -361,32 +571,67 @@ async def edit_multiview_master_images(
     return {"front": front_image_path, "back": back_image_path}
 
 
-def get_reference_images_preview(
+async def get_reference_images_preview(
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
     max_images: int = 8,
 ) -> list[str]:
-    image_paths = _collect_style_image_paths(clusters)
-    previews: list[str] = []
-    for path in image_paths[:max_images]:
-        with open(path, "rb") as f:
-            encoded = base64.b64encode(f.read()).decode("utf-8")
-        ext = path.suffix.lower()
-        mime_type = "image/png" if ext == ".png" else "image/jpeg"
-        previews.append(f"data:{mime_type};base64,{encoded}")
-    return previews
-
-
-async def generate_3d_model(master_image_path: Path | list[Path]) -> Path:
+    image_paths = _collect_style_image_paths(clusters, run_dir)
+    return await media_pool.run(encode_data_urls, image_paths[:max_images])
+
+
+async def publish(path: Path) -> str:
+    """Store an artifact for clients and return its URL, valid on any replica."""
+    key = await asyncio.to_thread(storage.put_file, path)
+    return storage.url(key)
+
+
+async def submit_3d_model(
+    master_image_path: Path | list[Path],
+    extra_outputs: list[str] | None = None,
+    priority: int = 0,
+    tier: str = DEFAULT_TIER,
+) -> Job:
+    """Queue 3D generation; each job writes to its own output directory."""
+    trellis_engine.params(tier)  # reject unknown tiers before queueing
+    job_id = str(uuid.uuid4())
+    output_dir = ROOT_DIR / "artifacts" / "trellis" / job_id
+
+    # results of identical inputs are served from the cache without queueing
+    model_path = await trellis_engine.cached_result(
+        master_image_path, output_dir, extra_outputs or (), tier
+    )
+    if model_path is not None:
+        logger.info("Reusing cached 3D model", model_path=str(model_path))
+        return job_queue.record(model_path, job_id=job_id)
+
+    return job_queue.submit(
+        lambda: generate_3d_model(master_image_path, extra_outputs, output_dir, tier),
+        priority=priority,
+        job_id=job_id,
+    )
+
+
+async def generate_3d_model(
+    master_image_path: Path | list[Path],
+    extra_outputs: list[str] | None = None,
+    output_dir: Path | None = None,
+    tier: str = DEFAULT_TIER,
+) -> Path:
     logger.info(
-        "Generating 3D model from master image", image_path=str(master_image_path)
+        "Generating 3D model from master image",
+        image_path=str(master_image_path),
+        tier=tier,
     )
 
     # Create output directory for TRELLIS
-    output_dir = ROOT_DIR / "artifacts" / "trellis"
+    output_dir = output_dir or ROOT_DIR / "artifacts" / "trellis"
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Use TRELLIS engine to generate 3D model
-    model_path = await trellis_engine.generate_3d_model(master_image_path, output_dir)
+    model_path = await trellis_engine.generate_3d_model(
+        master_image_path, output_dir, extra_outputs or (), tier
+    )
 
     logger.info("3D model generation completed", model_path=str(model_path))
     return model_path
@@ -397,68 +642,87 @@ def _load_image_for_eval(image_path: Path) -> pydantic_ai.BinaryImage:
         img_bytes = f.read()
         img = Image.open(io.BytesIO(img_bytes))
         fmt = img.format.lower() if img.format else "jpeg"
-        return pydantic_ai.BinaryImage(data=img_bytes, media_type=f"image/{fmt}")
+        return _binary_image(img_bytes, f"image/{fmt}")
+
+
+async def prepare_master_embeddings(
+    run_dir: Path, is_multiview: bool = False
+) -> list[np.ndarray]:
+    import numpy as np
+
+    # Describe and embed the confirmed master image(s) for the preservation score
+    if is_multiview:
+        names = ["master_image_front.jpg", "master_image_back.jpg"]
+    else:
+        names = ["master_image.jpg"]
+
+    async def embed(name: str) -> np.ndarray:
+        image = _load_image_for_eval(run_dir / name)
+        desc = await descriptor.run([image], type="image")
+        title = desc.output.info.title
+        return np.array(await asyncio.to_thread(generate_embedding, title))
+
+    return list(await asyncio.gather(*(embed(name) for name in names)))
 
 
 async def evaluate_model_async(
     model_path: Path,
-    clusters: list[common.ClusterDescriptor],
+    board: Moodboard,
+    run_dir: Path,
     is_multiview: bool = False,
     adapt_subject_text: Optional[str] = None,
+    master_embeddings: Optional[asyncio.Task] = None,
 ):
+    import numpy as np
+
+    # The master image side only depends on the confirmed images, so callers can
+    # start it while the model is being generated
+    if master_embeddings is None:
+        master_embeddings = asyncio.create_task(
+            prepare_master_embeddings(run_dir, is_multiview)
+        )
+
     unique_name = "generated"
-    renders_dir = ROOT_DIR / "artifacts" / "model_renders" / unique_name
+    renders_dir = run_dir / "model_renders" / unique_name
     renders_dir.mkdir(parents=True, exist_ok=True)
 
-    renders = await blender_engine.render_views(
-        model_path, renders_dir, render_back=is_multiview
+    renders = await render_engine.render_views(
+        model_path,
+        renders_dir,
+        profile="evaluation_multiview" if is_multiview else "evaluation",
     )
     images = [render.image for render in renders]
 
+    async def embed_model(view_images: list[pydantic_ai.BinaryImage]) -> np.ndarray:
+        desc = await descriptor.run(view_images, type="model")
+        title = desc.output.info.title
+        return np.array(await asyncio.to_thread(generate_embedding, title))
+
     model_embedding = None
     front_model_emb = None
     back_model_emb = None
     try:
         # Generate embedding for the generated model
         if is_multiview:
-            front_desc = await descriptor.run([renders[0].image], type="model")
-            front_model_emb = np.array(generate_embedding(front_desc.output.info.title))
-
             with open(renders_dir / "view_back.jpg", "rb") as f:
-                back_image = pydantic_ai.BinaryImage(
-                    data=f.read(), media_type="image/jpeg"
-                )
-            back_desc = await descriptor.run([back_image], type="model")
-            back_model_emb = np.array(generate_embedding(back_desc.output.info.title))
+                back_image = _binary_image(f.read())
+            front_model_emb, back_model_emb = await asyncio.gather(
+                embed_model([renders[0].image]), embed_model([back_image])
+            )
 
             model_embedding = np.average([front_model_emb, back_model_emb], axis=0)
         else:
-            result = await descriptor.run(images, type="model")
-            title = result.output.info.title
-            model_embedding = np.array(generate_embedding(title))
+            model_embedding = await embed_model(images)
     except Exception as e:
         logger.error(f"Error generating model embeddings: {e}")
 
     try:
         # Metric 1: 2D to 3D preservation
         if model_embedding is None:
+            master_embeddings.cancel()
             preservation_score = 0
         elif is_multiview:
-            front_master_path = ROOT_DIR / "artifacts" / "master_image_front.jpg"
-            back_master_path = ROOT_DIR / "artifacts" / "master_image_back.jpg"
-
-            front_master_image = _load_image_for_eval(front_master_path)
-            back_master_image = _load_image_for_eval(back_master_path)
-
-            front_master_desc = await descriptor.run([front_master_image], type="image")
-            front_master_emb = np.array(
-                generate_embedding(front_master_desc.output.info.title)
-            )
-
-            back_master_desc = await descriptor.run([back_master_image], type="image")
-            back_master_emb = np.array(
-                generate_embedding(back_master_desc.output.info.title)
-            )
+            front_master_emb, back_master_emb = await master_embeddings
 
             cos_front = np.dot(front_master_emb, front_model_emb) / (
                 np.linalg.norm(front_master_emb) * np.linalg.norm(front_model_emb)
@@ -468,11 +732,7 @@ async def evaluate_model_async(
             )
             preservation_score = int(max(0, (cos_front + cos_back) / 2) * 100)
         else:
-            master_path = ROOT_DIR / "artifacts" / "master_image.jpg"
-            master_image = _load_image_for_eval(master_path)
-
-            master_desc = await descriptor.run([master_image], type="image")
-            master_emb = np.array(generate_embedding(master_desc.output.info.title))
+            (master_emb,) = await master_embeddings
 
             cos_sim = np.dot(master_emb, model_embedding) / (
                 np.linalg.norm(master_emb) * np.linalg.norm(model_embedding)
@@ -492,24 +752,11 @@ async def evaluate_model_async(
         if model_embedding is None:
             closeness_score = 0
         else:
-            embeddings = []
-            weights = []
+            embeddings_np, weights_np = board.relevant_embeddings(RELEVANCE_THRESHOLD)
 
-            for cluster in clusters:
-                for token in cluster.elements:
-                    if token.weight <= RELEVANCE_THRESHOLD:
-                        continue
-
-                    if token.embedding and len(token.embedding) > 0:
-                        embeddings.append(token.embedding)
-                        weights.append(token.weight)
-
-            if not embeddings:
+            if not len(embeddings_np):
                 closeness_score = 0
             else:
-                embeddings_np = np.array(embeddings)
-                weights_np = np.array(weights)
-
                 if np.sum(weights_np) == 0:
                     weights_np = np.ones_like(weights_np) / len(weights_np)
                 else:
@@ -562,42 +809,42 @@ def _save_master_image(output: pydantic_ai.BinaryImage) -> Path:
     return master_image_path
 
 
-async def _save_model_file(element: dict) -> Path:
+async def _save_model_file(element: dict, run_dir: Path) -> Path:
     # Save a model file from base64 data and return its path
     model_data = element["content"]["data"]["src"]
     model_filename = element["content"]["data"]["fileName"]
-    base64_data = model_data.split(",", 1)[1]
-    model_bytes = base64.b64decode(base64_data)
 
-    models_dir = ROOT_DIR / "artifacts" / "models"
-    models_dir.mkdir(parents=True, exist_ok=True)
-    model_path = models_dir / model_filename
+    models_dir = run_dir / "models"
+    return await media_pool.run(save_data_url, model_data, models_dir / model_filename)
 
-    with model_path.open("wb") as f:
-        f.write(model_bytes)
 
-    return model_path
+# -- Helper Functions ---
 
 
-# -- Helper Functions ---
+def _binary_image(
+    data: bytes, media_type: str = "image/jpeg"
+) -> pydantic_ai.BinaryImage:
+    import pydantic_ai
+
+    return pydantic_ai.BinaryImage(data=data, media_type=media_type)
 
 
 def _collect_style_images(
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
 ) -> list[pydantic_ai.BinaryImage]:
-    image_paths = _collect_style_image_paths(clusters)
+    image_paths = _collect_style_image_paths(clusters, run_dir)
     style_images: list[pydantic_ai.BinaryImage] = []
 
     for image_path in image_paths:
         with open(image_path, "rb") as f:
-            style_images.append(
-                pydantic_ai.BinaryImage(data=f.read(), media_type="image/jpeg")
-            )
+            style_images.append(_binary_image(f.read()))
     return style_images
 
 
 def _collect_style_image_paths(
     clusters: list[common.ClusterDescriptor],
+    run_dir: Path,
 ) -> list[Path]:
     image_paths: list[Path] = []
     model_paths: list[Path] = []
@@ -607,17 +854,15 @@ def _collect_style_image_paths(
                 continue
 
             if elem.type == "image":
-                image_path = (
-                    ROOT_DIR / "artifacts" / "images" / str(elem.id) / "image.jpg"
-                )
+                image_path = run_dir / "images" / str(elem.id) / "image.jpg"
                 if image_path.exists():
                     image_paths.append(image_path)
             elif elem.type == "video":
-                frames_dir = ROOT_DIR / "artifacts" / "video_frames" / str(elem.id)
+                frames_dir = run_dir / "video_frames" / str(elem.id)
                 if frames_dir.exists():
                     image_paths.extend(sorted(frames_dir.glob("*.jpg")))
             elif elem.type == "model":
-                renders_dir = ROOT_DIR / "artifacts" / "model_renders" / str(elem.id)
+                renders_dir = run_dir / "model_renders" / str(elem.id)
                 if renders_dir.exists():
                     model_paths.extend(sorted(renders_dir.glob("*.jpg")))
 
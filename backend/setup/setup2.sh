@@ -37,10 +37,12 @@ pip install \
   hydra-core \
   huggingface_hub \
   fastapi \
+  httpx \
   uvicorn \
   boto3 \
   jinja2 \
   genai-prices \
+  trimesh \
   numpy \
   imageio \
   opencv-python-headless
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from backend.common import ClusterDescriptor, DesignToken
+
+
+class Moodboard:
+    """Design tokens of one /extract run, indexed by their position on the board.
+
+    Clusters hold arrays of token positions and the weights live in one vector, so
+    lookups, membership and weight updates stay linear in the board size. Cluster
+    descriptors share the token objects, so weight changes show up in both.
+    """
+
+    def __init__(self, tokens: Sequence[DesignToken]):
+        self.tokens = list(tokens)
+        self.index = {token.id: i for i, token in enumerate(self.tokens)}
+        self.weights = np.array([token.weight for token in self.tokens], dtype=int)
+        self.clusters: list[ClusterDescriptor] = []
+        self.members: list[np.ndarray] = []
+        # position of the last cluster each token belongs to, -1 if none
+        self._cluster_of = np.full(len(self.tokens), -1)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def positions(self, token_ids: Iterable[int]) -> np.ndarray:
+        """Board positions of the known ids, each once, in the order given."""
+        found = np.array([self.index[i] for i in token_ids if i in self.index], int)
+        _, first = np.unique(found, return_index=True)
+        return found[np.sort(first)]
+
+    def tokens_at(self, positions: np.ndarray) -> list[DesignToken]:
+        return [self.tokens[i] for i in positions]
+
+    def set_clusters(
+        self, clusters: Sequence[ClusterDescriptor], members: Sequence[np.ndarray]
+    ) -> None:
+        self.clusters = list(clusters)
+        self.members = list(members)
+        self._cluster_of[:] = -1
+        for c, positions in enumerate(self.members):
+            self._cluster_of[positions] = c
+
+    def sort_clusters(self) -> None:
+        """Put the members of every cluster in board order, as routing always has."""
+        self.members = [np.sort(positions) for positions in self.members]
+        for cluster, positions in zip(self.clusters, self.members):
+            cluster.elements = self.tokens_at(positions)
+
+    def cluster_context(self, position: int) -> str | None:
+        """Title and description of the token's cluster, for the intent router."""
+        c = self._cluster_of[position]
+        if c < 0:
+            return None
+        cluster = self.clusters[c]
+        return f"{cluster.title},{cluster.description}"
+
+    def set_weight(self, token_id: int, weight: int) -> None:
+        position = self.index[token_id]
+        self.weights[position] = weight
+        self.tokens[position].weight = weight
+
+    def weight_map(self) -> dict[int, int]:
+        return {
+            token.id: weight
+            for token, weight in zip(self.tokens, self.weights.tolist())
+        }
+
+    def relevant_embeddings(self, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+        """Embeddings and weights of the cluster members weighted above `threshold`.
+
+        Tokens count once per cluster they belong to.
+        """
+        if not self.members:
+            return np.empty((0, 0)), np.empty(0, dtype=int)
+        positions = np.concatenate(self.members)
+        has_embedding = np.array([bool(token.embedding) for token in self.tokens])
+        keep = positions[
+            (self.weights[positions] > threshold) & has_embedding[positions]
+        ]
+        if not len(keep):
+            return np.empty((0, 0)), np.empty(0, dtype=int)
+        embeddings = np.array([self.tokens[i].embedding for i in keep])
+        return embeddings, self.weights[keep]
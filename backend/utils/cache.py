@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+import structlog
+
+if TYPE_CHECKING:
+    from backend.utils.storage import Storage
+
+logger = structlog.stdlib.get_logger(__name__)
+
+BACKEND_DIR = pathlib.Path(__file__).parents[1]
+_CHUNK_SIZE = 1 << 20
+
+
+class FileCache:
+    """Disk cache of derived files keyed by input file content and settings.
+
+    Each entry is a directory holding the files produced for one key (render
+    views, model proxies, ...). Entries are evicted least-recently-used first
+    once the cache exceeds `max_bytes`.
+
+    With a shared `storage`, stored entries are also uploaded as content-addressed
+    blobs plus a manifest, and local misses are filled from there, so replicas
+    reuse each other's results.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int,
+        name: str = "file",
+        storage: Storage | None = None,
+    ):
+        self.name = name
+        path = pathlib.Path(directory)
+        self.directory = path if path.is_absolute() else BACKEND_DIR / path
+        self.max_bytes = max_bytes
+        self.storage = storage
+        self.hits = 0
+        self.misses = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def hash_file(path: pathlib.Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def key(
+        self,
+        path: pathlib.Path | Sequence[pathlib.Path],
+        settings: dict[str, Any],
+    ) -> str:
+        paths = [path] if isinstance(path, pathlib.Path) else path
+        digest = hashlib.sha256()
+        for input_path in paths:
+            digest.update(self.hash_file(input_path).encode())
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def restore(self, key: str, output_dir: pathlib.Path) -> bool:
+        """Copy the cached files for `key` into `output_dir`, if present."""
+        entry = self.directory / key
+        try:
+            files = sorted(entry.iterdir())
+        except OSError:
+            files = []
+        source = "local"
+        if not files and self.storage is not None:
+            files = self._fetch(key)
+            source = "shared"
+        if not files:
+            self.misses += 1
+            logger.info(f"{self.name} cache miss", key=key[:12], misses=self.misses)
+            return False
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        copied = []
+        try:
+            for file in files:
+                copied.append(output_dir / file.name)
+                shutil.copyfile(file, copied[-1])
+        except OSError as e:
+            # evicted by another worker mid-copy, or out of disk space; leave no
+            # partial output behind
+            for path in copied:
+                path.unlink(missing_ok=True)
+            self.misses += 1
+            logger.warning(
+                f"{self.name} cache entry unreadable, treating it as a miss",
+                key=key[:12],
+                error=str(e),
+            )
+            return False
+
+        # mark as recently used for LRU eviction, unless it was just evicted
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry)
+        self.hits += 1
+        logger.info(
+            f"{self.name} cache hit", key=key[:12], hits=self.hits, source=source
+        )
+        return True
+
+    def store(self, key: str, files: list[pathlib.Path]) -> None:
+        """Store copies of the given files under `key`."""
+        entry = self.directory / key
+        if entry.is_dir():
+            os.utime(entry)
+            return
+
+        def copy(staging: pathlib.Path) -> None:
+            for file in files:
+                shutil.copyfile(file, staging / file.name)
+
+        self._install(key, copy)
+        if self.storage is not None:
+            self._share(key, files)
+        self._evict()
+
+    def _install(self, key: str, fill: Callable[[pathlib.Path], None]) -> None:
+        # write to a temporary directory first so readers never see partial entries
+        staging = self.directory / f".{key}-{uuid.uuid4().hex}"
+        staging.mkdir(parents=True)
+        try:
+            fill(staging)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        try:
+            os.replace(staging, self.directory / key)
+        except OSError:
+            # another worker stored the same entry concurrently
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _manifest_key(self, key: str) -> str:
+        return f"caches/{self.name}/{key}.json"
+
+    def _share(self, key: str, files: list[pathlib.Path]) -> None:
+        try:
+            blobs = {file.name: self.storage.put_file(file) for file in files}
+            self.storage.put_json(self._manifest_key(key), {"files": blobs})
+        except Exception as e:
+            # the local entry still serves this replica
+            logger.warning(f"Failed to share {self.name} cache entry", error=str(e))
+
+    def _fetch(self, key: str) -> list[pathlib.Path]:
+        """Install the shared entry for `key` locally; its files, or [] if absent."""
+        try:
+            manifest = self.storage.get_json(self._manifest_key(key))
+            if manifest is None:
+                return []
+
+            def download(staging: pathlib.Path) -> None:
+                for name, blob in manifest["files"].items():
+                    self.storage.download(blob, staging / name)
+
+            self._install(key, download)
+        except Exception as e:
+            logger.warning(
+                f"Failed to fetch shared {self.name} cache entry", error=str(e)
+            )
+            return []
+        self._evict()
+        entry = self.directory / key
+        return sorted(entry.iterdir()) if entry.is_dir() else []
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in self.directory.iterdir():
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+            entries.append((entry.stat().st_mtime, size, entry))
+            total += size
+
+        # remove least recently used entries until under quota
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            logger.info(f"Evicted {self.name} cache entry", key=entry.name[:12])
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import dataclasses
+import io
+import json
+import math
+import struct
+from pathlib import Path
+
+import numpy as np
+import structlog
+import trimesh
+from PIL import Image
+
+from backend.utils.cache import FileCache
+
+logger = structlog.stdlib.get_logger(__name__)
+
+GLB_MAGIC = b"glTF"
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+PROXY_FILENAME = "proxy.glb"
+
+
+class ModelValidationError(ValueError):
+    pass
+
+
+@dataclasses.dataclass
+class GlbStats:
+    triangles: int
+    max_texture_size: int
+    repaired: bool
+
+
+def inspect_glb(data: bytes) -> tuple[bytes, GlbStats]:
+    """Validate a binary glTF file; return the (possibly repaired) bytes and stats."""
+    if len(data) < 12:
+        raise ModelValidationError("File is too small to be a GLB model")
+
+    magic, version, declared_length = struct.unpack_from("<4sII", data, 0)
+    if magic != GLB_MAGIC:
+        raise ModelValidationError("File is not a binary glTF (GLB) model")
+    if version != 2:
+        raise ModelValidationError(f"Unsupported glTF version: {version}")
+
+    # trailing bytes after the declared length are dropped, missing bytes are fatal
+    repaired = False
+    if declared_length > len(data):
+        raise ModelValidationError("GLB file is truncated")
+    if declared_length < len(data):
+        data = data[:declared_length]
+        repaired = True
+
+    # walk the chunks
+    chunks: dict[int, bytes] = {}
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_length, chunk_type = struct.unpack_from("<II", data, offset)
+        start = offset + 8
+        if start + chunk_length > len(data):
+            raise ModelValidationError("GLB chunk exceeds file length")
+        chunks.setdefault(chunk_type, data[start : start + chunk_length])
+        offset = start + chunk_length
+    if CHUNK_JSON not in chunks:
+        raise ModelValidationError("GLB file has no JSON chunk")
+
+    try:
+        gltf = json.loads(chunks[CHUNK_JSON].rstrip(b" \x00"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ModelValidationError("GLB JSON chunk is not valid JSON") from exc
+
+    # every buffer view must lie inside its buffer
+    buffers = gltf.get("buffers", [])
+    binary = chunks.get(CHUNK_BIN, b"")
+    for index, buffer in enumerate(buffers):
+        if "uri" not in buffer and buffer.get("byteLength", 0) > len(binary):
+            raise ModelValidationError(f"Buffer {index} exceeds the GLB binary chunk")
+    for index, view in enumerate(gltf.get("bufferViews", [])):
+        buffer_index = view.get("buffer", 0)
+        if buffer_index >= len(buffers):
+            raise ModelValidationError(f"Buffer view {index} references no buffer")
+        end = view.get("byteOffset", 0) + view.get("byteLength", 0)
+        if end > buffers[buffer_index].get("byteLength", 0):
+            raise ModelValidationError(f"Buffer view {index} exceeds its buffer")
+
+    if not gltf.get("meshes"):
+        raise ModelValidationError("GLB model contains no meshes")
+
+    accessors = gltf.get("accessors", [])
+    triangles = 0
+    for mesh in gltf["meshes"]:
+        for primitive in mesh.get("primitives", []):
+            # only triangle lists (mode 4, the default) contribute to the budget
+            if primitive.get("mode", 4) != 4:
+                continue
+            index = primitive.get(
+                "indices", primitive.get("attributes", {}).get("POSITION")
+            )
+            if index is None or index >= len(accessors):
+                raise ModelValidationError("Mesh primitive references no accessor")
+            triangles += accessors[index].get("count", 0) // 3
+
+    max_texture_size = max(
+        (_image_size(gltf, binary, image) for image in gltf.get("images", [])),
+        default=0,
+    )
+
+    return data, GlbStats(triangles, max_texture_size, repaired)
+
+
+def _image_size(gltf: dict, binary: bytes, image: dict) -> int:
+    """The longer side of an embedded image, read from its header only."""
+    views = gltf.get("bufferViews", [])
+    if image.get("bufferView", len(views)) >= len(views):
+        return 0  # external images are not part of the upload
+    view = views[image["bufferView"]]
+    if view.get("buffer", 0) != 0:
+        return 0  # only buffer 0 lives in the binary chunk
+    start = view.get("byteOffset", 0)
+    data = binary[start : start + view.get("byteLength", 0)]
+    try:
+        with Image.open(io.BytesIO(data)) as texture:
+            return max(texture.size)
+    except Image.DecompressionBombError:
+        # too many pixels to decode safely; its longer side is at least this
+        return math.isqrt(2 * Image.MAX_IMAGE_PIXELS)
+    except (OSError, SyntaxError, ValueError):
+        # formats PIL can't read (e.g. KTX2) are left to the renderer
+        return 0
+
+
+class ModelPreprocessor:
+    """Validates uploaded GLB models and builds bounded-size proxies for rendering."""
+
+    def __init__(
+        self,
+        max_faces: int,
+        max_texture_size: int,
+        cache: FileCache | None = None,
+    ):
+        self.max_faces = max_faces
+        self.max_texture_size = max_texture_size
+        self.cache = cache
+
+    def prepare(self, model_path: Path) -> Path:
+        """Return the path of a render proxy for `model_path`."""
+        output_dir = model_path.parent / f"{model_path.stem}_proxy"
+        proxy_path = output_dir / PROXY_FILENAME
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key(
+                model_path,
+                {
+                    "max_faces": self.max_faces,
+                    "max_texture_size": self.max_texture_size,
+                    "rules": 2,  # bump when the proxy decision changes
+                },
+            )
+            if self.cache.restore(cache_key, output_dir):
+                return proxy_path
+
+        data, stats = inspect_glb(model_path.read_bytes())
+        output_dir.mkdir(parents=True, exist_ok=True)
+        if (
+            stats.triangles <= self.max_faces
+            and stats.max_texture_size <= self.max_texture_size
+        ):
+            proxy_path.write_bytes(data)
+        else:
+            try:
+                proxy = self._build_proxy(data)
+            except Exception as e:
+                # trimesh and PIL fail in many ways on models that passed inspection
+                raise ModelValidationError(
+                    f"Could not build a render proxy: {e}"
+                ) from e
+            proxy_path.write_bytes(proxy)
+        logger.info(
+            "Prepared model proxy",
+            model=model_path.name,
+            triangles=stats.triangles,
+            repaired=stats.repaired,
+        )
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.store(cache_key, [proxy_path])
+        return proxy_path
+
+    def _build_proxy(self, data: bytes) -> bytes:
+        scene = trimesh.load(io.BytesIO(data), file_type="glb", force="scene")
+        total_faces = sum(
+            len(g.faces) for g in scene.geometry.values() if hasattr(g, "faces")
+        )
+
+        for name, geometry in list(scene.geometry.items()):
+            if not isinstance(geometry, trimesh.Trimesh):
+                continue
+            # share the face budget proportionally between meshes
+            if total_faces > self.max_faces:
+                target = max(4, self.max_faces * len(geometry.faces) // total_faces)
+                geometry = _cluster_decimate(geometry, target)
+            _downscale_textures(geometry, self.max_texture_size)
+            scene.geometry[name] = geometry
+
+        return scene.export(file_type="glb")
+
+
+def _cluster_decimate(mesh: trimesh.Trimesh, target_faces: int) -> trimesh.Trimesh:
+    """Decimate by vertex clustering on a uniform grid, keeping UVs and colours."""
+    if len(mesh.faces) <= target_faces:
+        return mesh
+
+    vertices = np.asarray(mesh.vertices, dtype=np.float64)
+    faces = np.asarray(mesh.faces, dtype=np.int64)
+    origin = vertices.min(axis=0)
+    extent = float((vertices.max(axis=0) - origin).max()) or 1.0
+
+    def cluster(cells: int):
+        grid = np.floor((vertices - origin) / extent * (cells - 1e-6)).astype(np.int64)
+        keys = (grid[:, 0] * cells + grid[:, 1]) * cells + grid[:, 2]
+        _, representative, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        remapped = inverse.reshape(-1)[faces]
+        valid = (
+            (remapped[:, 0] != remapped[:, 1])
+            & (remapped[:, 1] != remapped[:, 2])
+            & (remapped[:, 0] != remapped[:, 2])
+        )
+        return representative, inverse.reshape(-1), remapped, valid
+
+    # binary search for the finest grid that stays within the face budget
+    low, high = 2, 4096
+    best = cluster(low)
+    while low < high:
+        cells = (low + high + 1) // 2
+        result = cluster(cells)
+        if result[3].sum() <= target_faces:
+            low, best = cells, result
+        else:
+            high = cells - 1
+    representative, inverse, remapped, valid = best
+
+    # cluster positions are the mean of their members
+    counts = np.bincount(inverse, minlength=len(representative)).astype(np.float64)
+    positions = np.zeros((len(representative), 3))
+    np.add.at(positions, inverse, vertices)
+    positions /= counts[:, None]
+
+    visual = None
+    if (
+        isinstance(mesh.visual, trimesh.visual.TextureVisuals)
+        and mesh.visual.uv is not None
+    ):
+        visual = trimesh.visual.TextureVisuals(
+            uv=np.asarray(mesh.visual.uv)[representative],
+            material=mesh.visual.material,
+        )
+    elif mesh.visual.kind == "vertex":
+        visual = trimesh.visual.ColorVisuals(
+            vertex_colors=mesh.visual.vertex_colors[representative]
+        )
+    elif mesh.visual.kind == "face":
+        visual = trimesh.visual.ColorVisuals(face_colors=mesh.visual.face_colors[valid])
+
+    return trimesh.Trimesh(
+        vertices=positions,
+        faces=remapped[valid],
+        visual=visual,
+        process=False,
+    )
+
+
+def _downscale_textures(mesh: trimesh.Trimesh, max_size: int) -> None:
+    material = getattr(mesh.visual, "material", None)
+    if material is None:
+        return
+    for attribute in (
+        "image",
+        "baseColorTexture",
+        "metallicRoughnessTexture",
+        "normalTexture",
+        "occlusionTexture",
+        "emissiveTexture",
+    ):
+        texture = getattr(material, attribute, None)
+        if isinstance(texture, Image.Image) and max(texture.size) > max_size:
+            texture = texture.copy()
+            texture.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            setattr(material, attribute, texture)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import heapq
+import itertools
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+FINISHED = ("completed", "failed", "cancelled")
+
+
+class JobCancelledError(Exception):
+    pass
+
+
+@dataclasses.dataclass(eq=False)
+class Job:
+    id: str
+    priority: int
+    run: Callable[[], Awaitable[Any]] | None = dataclasses.field(repr=False)
+    status: str = "queued"  # queued, running, completed, failed, cancelled
+    created_at: float = dataclasses.field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    result: Any = None
+    cancel_requested: bool = False
+    _done: asyncio.Event = dataclasses.field(default_factory=asyncio.Event, repr=False)
+    _task: asyncio.Task | None = dataclasses.field(default=None, repr=False)
+    _exception: BaseException | None = dataclasses.field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    async def wait(self) -> Any:
+        """Wait for the job to finish and return its result."""
+        await self._done.wait()
+        if self.status == "cancelled":
+            raise JobCancelledError(f"Job {self.id} was cancelled")
+        if self._exception is not None:
+            raise self._exception
+        return self.result
+
+
+class JobQueue:
+    """Priority queue with FIFO ordering per priority in front of a GPU-bound engine.
+
+    Higher priorities run first. Queued jobs report their position and an ETA
+    based on a moving average of recent job durations; queued and running jobs
+    can be cancelled. `concurrency` jobs run at once; the orchestrator sets it
+    from the engine when it is not configured, one runs at a time until then.
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        history: int = 100,
+        initial_duration_s: float = 60.0,
+    ):
+        self.concurrency = concurrency
+        self.history = history
+        self._avg_duration_s = initial_duration_s
+        self._heap: list[tuple[int, int, Job]] = []
+        self._seq = itertools.count()
+        self._jobs: collections.OrderedDict[str, Job] = collections.OrderedDict()
+        self._running: set[Job] = set()
+        self._available = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._workers: list[asyncio.Task] = []
+
+    def submit(
+        self,
+        run: Callable[[], Awaitable[Any]],
+        priority: int = 0,
+        job_id: str | None = None,
+    ) -> Job:
+        job = Job(id=job_id or str(uuid.uuid4()), priority=priority, run=run)
+        self._jobs[job.id] = job
+        heapq.heappush(self._heap, (-priority, next(self._seq), job))
+        self._prune()
+        self._start_workers()
+        self._available.set()
+        self._notify()
+        logger.info("Queued job", job_id=job.id, priority=priority)
+        return job
+
+    def record(self, result: Any, job_id: str | None = None) -> Job:
+        """Register a job that completed without running, e.g. from a cache."""
+        job = Job(id=job_id or str(uuid.uuid4()), priority=0, run=None)
+        job.started_at = job.created_at
+        self._jobs[job.id] = job
+        job.result = result
+        self._finish(job, "completed")
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; returns False if it already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.cancel_requested = True
+        if job.status == "queued":
+            # lazily removed from the heap by the workers
+            self._finish(job, "cancelled")
+        elif job._task is not None:
+            job._task.cancel()
+        logger.info("Cancelled job", job_id=job_id)
+        return True
+
+    def position(self, job: Job) -> int | None:
+        """Number of queued jobs ahead of `job`, or None if it is not queued."""
+        if job.status != "queued":
+            return None
+        queued = sorted(e for e in self._heap if e[2].status == "queued")
+        return next(i for i, entry in enumerate(queued) if entry[2] is job)
+
+    def eta_s(self, job: Job) -> float | None:
+        """Estimated seconds until `job` completes."""
+        now = time.time()
+        if job.status == "running":
+            return max(0.0, self._avg_duration_s - (now - job.started_at))
+        position = self.position(job)
+        if position is None:
+            return None
+        running = sum(
+            max(0.0, self._avg_duration_s - (now - r.started_at)) for r in self._running
+        )
+        return (
+            running + position * self._avg_duration_s
+        ) / self._limit + self._avg_duration_s
+
+    def snapshot(self, job: Job) -> dict[str, Any]:
+        eta_s = self.eta_s(job)
+        return {
+            "id": job.id,
+            "status": job.status,
+            "priority": job.priority,
+            "position": self.position(job),
+            "eta_s": round(eta_s, 1) if eta_s is not None else None,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+            "error": job.error,
+        }
+
+    async def updates(
+        self, job: Job, refresh_s: float = 5.0
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield snapshots of a queued job until it starts running or finishes."""
+        while True:
+            changed = self._changed
+            yield self.snapshot(job)
+            if job.status != "queued":
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), refresh_s)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @property
+    def _limit(self) -> int:
+        return self.concurrency or 1
+
+    def _start_workers(self) -> None:
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._limit:
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def _next(self) -> Job:
+        while True:
+            while self._heap:
+                _, _, job = heapq.heappop(self._heap)
+                if job.status == "queued":
+                    return job
+            self._available.clear()
+            await self._available.wait()
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._next()
+            job.status = "running"
+            job.started_at = time.time()
+            self._running.add(job)
+            self._notify()
+
+            job._task = asyncio.create_task(job.run())
+            try:
+                job.result = await job._task
+                self._finish(job, "completed")
+                self._record_duration(job)
+            except asyncio.CancelledError:
+                self._finish(job, "cancelled")
+                if not job.cancel_requested:
+                    # the queue itself is shutting down
+                    raise
+            except Exception as exc:
+                job._exception = exc
+                job.error = str(exc)
+                self._finish(job, "failed")
+                logger.warning("Job failed", job_id=job.id, error=str(exc))
+
+    def _finish(self, job: Job, status: str) -> None:
+        self._running.discard(job)
+        job.status = status
+        job.finished_at = time.time()
+        job._done.set()
+        self._notify()
+
+    def _record_duration(self, job: Job) -> None:
+        duration = job.finished_at - job.started_at
+        self._avg_duration_s = 0.7 * self._avg_duration_s + 0.3 * duration
+        logger.info("Job completed", job_id=job.id, duration_s=round(duration, 2))
+
+    def _notify(self) -> None:
+        # wake up everyone waiting for a change, then arm a fresh event
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import concurrent.futures
+import io
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable
+
+import structlog
+from PIL import Image
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+def to_jpeg(data_url: str) -> bytes:
+    """Decode an image data URL and re-encode it as RGB JPEG bytes."""
+    raw_bytes = base64.b64decode(data_url.split(",", 1)[1])
+    img = Image.open(io.BytesIO(raw_bytes))
+    if img.mode in ("RGBA", "P", "LA"):
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def save_data_url(data_url: str, path: Path) -> Path:
+    """Decode a base64 data URL into `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(base64.b64decode(data_url.split(",", 1)[1]))
+    return path
+
+
+def encode_data_urls(paths: list[Path]) -> list[str]:
+    """Encode image files as data URLs."""
+    data_urls = []
+    for path in paths:
+        encoded = base64.b64encode(path.read_bytes()).decode("utf-8")
+        mime_type = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
+        data_urls.append(f"data:{mime_type};base64,{encoded}")
+    return data_urls
+
+
+class MediaPool:
+    """Runs CPU-bound media work off the event loop.
+
+    Work goes to a process pool of `workers` processes, or to a thread pool when
+    `processes` is off or process pools are unavailable. Submitted functions take
+    and return bytes or file paths rather than decoded frames.
+    """
+
+    def __init__(self, workers: int = 2, processes: bool = True):
+        self.workers = workers
+        self.processes = processes
+        self._broken = False
+        self._executor = self._create_executor()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        executor = self._executor
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, func, *args
+            )
+        except BrokenProcessPool:
+            # a worker died (e.g. OOM or a decoder crash), failing every call in
+            # flight; they are not rerun, least of all on threads, where the
+            # crashing input would take the server down. Only the first of them
+            # replaces the pool.
+            if executor is self._executor:
+                self._recreate_executor()
+            raise
+        self._broken = False
+        return result
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _recreate_executor(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        # broke again before any run succeeded: processes don't work here
+        if self._broken:
+            self.processes = False
+        self._broken = True
+        logger.warning(
+            "Media process pool broke, recreating it", processes=self.processes
+        )
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        if self.processes:
+            try:
+                # spawn, since forking a threaded (and possibly CUDA) process
+                # can deadlock or crash the children
+                return concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning("Process pool unavailable, using threads", error=str(e))
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="media"
+        )
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import base64
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class RemoteWorkerError(RuntimeError):
+    pass
+
+
+def encode_files(paths: list[Path]) -> list[dict[str, str]]:
+    """Encode files for a JSON job payload."""
+    return [
+        {"name": path.name, "data": base64.b64encode(path.read_bytes()).decode()}
+        for path in paths
+    ]
+
+
+def decode_files(files: list[dict[str, str]], output_dir: Path) -> list[Path]:
+    """Write files from a JSON job payload into `output_dir`."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for file in files:
+        # never trust paths from the other side
+        path = output_dir / Path(file["name"]).name
+        path.write_bytes(base64.b64decode(file["data"]))
+        paths.append(path)
+    return paths
+
+
+class RemoteClient:
+    """Client for a render or generation node running `python -m backend.worker`.
+
+    Jobs are JSON requests carrying their input files; replies carry the
+    output files, so API and worker nodes need no shared storage.
+    """
+
+    def __init__(self, url: str, timeout_s: float):
+        self.url = url.rstrip("/")
+        self.timeout_s = timeout_s
+        self.healthy = False
+        self._client: httpx.AsyncClient | None = None
+
+    async def post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        try:
+            response = await self._http().post(path, json=payload)
+        except httpx.HTTPError as e:
+            self.healthy = False
+            raise RemoteWorkerError(f"Worker {self.url} is unreachable: {e}") from e
+        if response.status_code != 200:
+            raise RemoteWorkerError(
+                f"Worker {self.url}{path} failed ({response.status_code}): "
+                f"{response.text}"
+            )
+        self.healthy = True
+        return response.json()
+
+    async def health(self) -> bool:
+        """Whether the worker is reachable and has its engine loaded."""
+        try:
+            response = await self._http().get("/health", timeout=10)
+            # a worker answers while it is still loading or after it failed to
+            self.healthy = (
+                response.status_code == 200 and response.json().get("ready") is True
+            )
+        except (httpx.HTTPError, ValueError):
+            self.healthy = False
+        return self.healthy
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _http(self) -> httpx.AsyncClient:
+        # created lazily so the client binds to the running event loop
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.url, timeout=self.timeout_s)
+        return self._client
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pydantic_core
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+# Events and artifact dumps go through pydantic-core's serializer, which handles
+# models nested in plain dicts in one pass and writes UTF-8 bytes directly
+
+
+def sse_event(event: dict[str, Any]) -> bytes:
+    """A server-sent event frame carrying `event` as compact JSON."""
+    return b"data: " + pydantic_core.to_json(event) + b"\n\n"
+
+
+def dump_json(obj: Any, path: Path, indent: int | None = None) -> None:
+    """Write `obj` as JSON; compact unless an `indent` is given."""
+    path.write_bytes(pydantic_core.to_json(obj, indent=indent))
+
+
+def json_body(model: type[BaseModel]):
+    """A dependency validating the raw request body as `model`.
+
+    Parses and validates in a single pass, without first building the generic
+    JSON tree FastAPI would, which matters for bodies carrying large base64 media.
+    """
+
+    async def parse(request: Request) -> BaseModel:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            errors = e.errors(include_url=False)
+            for error in errors:
+                error["loc"] = ("body", *error["loc"])
+                if error["type"] == "json_invalid":
+                    error["input"] = {}  # like FastAPI, don't echo the whole body
+            raise RequestValidationError(errors)
+
+    return parse
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import json
+import math
+import mimetypes
+import os
+import pathlib
+import shutil
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+import boto3
+import botocore.exceptions
+import structlog
+
+from backend.utils.cache import BACKEND_DIR, FileCache
+
+logger = structlog.stdlib.get_logger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+
+class Storage(ABC):
+    """Artifact store shared by all replicas of the backend.
+
+    Files are stored once per content, under `blobs/` and the SHA-256 of their
+    bytes; small JSON documents such as cache manifests are stored by name.
+    `url` gives a client-facing URL for any key.
+    """
+
+    def put_file(self, path: pathlib.Path) -> str:
+        """Store a file by content and return its key."""
+        digest = FileCache.hash_file(path)
+        key = f"blobs/{digest[:2]}/{digest}{path.suffix.lower()}"
+        if not self.exists(key):
+            self._upload(path, key)
+        return key
+
+    def put_json(self, key: str, document: Any) -> None:
+        self._write(key, json.dumps(document).encode())
+
+    def get_json(self, key: str) -> Any | None:
+        data = self._read(key)
+        return None if data is None else json.loads(data)
+
+    def local_path(self, key: str) -> pathlib.Path | None:
+        """The file behind `key` if this process can serve it from disk."""
+        return None
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def download(self, key: str, path: pathlib.Path) -> None:
+        pass
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        pass
+
+    @abstractmethod
+    def _upload(self, path: pathlib.Path, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def _read(self, key: str) -> bytes | None:
+        pass
+
+
+class LocalStorage(Storage):
+    """Storage in a directory, served by the app under `base_url`.
+
+    Replicas can share it through a network mount. With `max_bytes`, the least
+    recently stored or used files are evicted once the directory exceeds it,
+    except files whose URL was handed out less than `published_ttl_s` ago. The
+    sizes are tracked in an index built on start, so each replica only counts
+    the files it finds then and those it stores or uses itself.
+    """
+
+    def __init__(
+        self,
+        directory: str = "storage",
+        base_url: str = "/storage",
+        max_bytes: int | None = None,
+        published_ttl_s: float = 86400,
+    ):
+        path = pathlib.Path(directory)
+        self.directory = (path if path.is_absolute() else BACKEND_DIR / path).resolve()
+        self.base_url = base_url.rstrip("/")
+        self.max_bytes = max_bytes
+        self.published_ttl_s = published_ttl_s
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._files: dict[str, tuple[float, int]] = {}  # key -> (last used, size)
+        self._published: dict[str, float] = {}  # key -> time its URL was handed out
+        self._total = 0
+        if max_bytes is not None:
+            self._scan()
+
+    def put_file(self, path: pathlib.Path) -> str:
+        key = super().put_file(path)
+        self._touch(key)
+        return key
+
+    def local_path(self, key: str) -> pathlib.Path:
+        path = (self.directory / key).resolve()
+        if not path.is_relative_to(self.directory):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def exists(self, key: str) -> bool:
+        return self.local_path(key).is_file()
+
+    def download(self, key: str, path: pathlib.Path) -> None:
+        shutil.copyfile(self.local_path(key), path)
+        self._touch(key)
+
+    def url(self, key: str) -> str:
+        if self.max_bytes is not None:
+            with self._lock:
+                self._published[key] = time.time()
+        return f"{self.base_url}/{key}"
+
+    def _upload(self, path: pathlib.Path, key: str) -> None:
+        self._replace(key, lambda target: shutil.copyfile(path, target))
+
+    def _write(self, key: str, data: bytes) -> None:
+        self._replace(key, lambda target: target.write_bytes(data))
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            return self.local_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _replace(self, key: str, write: Callable[[pathlib.Path], Any]) -> None:
+        # write next to the target first so readers never see partial files
+        target = self.local_path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f".{target.name}-{uuid.uuid4().hex}")
+        try:
+            write(staging)
+            os.replace(staging, target)
+        finally:
+            staging.unlink(missing_ok=True)
+        if self.max_bytes is not None:
+            self._record(key, target.stat().st_size)
+            self._evict()
+
+    def _touch(self, key: str) -> None:
+        # mark as recently used for LRU eviction; the mtime keeps the order
+        # across restarts
+        try:
+            os.utime(self.local_path(key))
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if key in self._files:
+                self._files[key] = (time.time(), self._files[key][1])
+
+    def _scan(self) -> None:
+        for path in self.directory.rglob("*"):
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            stat = path.stat()
+            key = path.relative_to(self.directory).as_posix()
+            self._files[key] = (stat.st_mtime, stat.st_size)
+            self._total += stat.st_size
+
+    def _record(self, key: str, size: int) -> None:
+        with self._lock:
+            _, previous = self._files.get(key, (0.0, 0))
+            self._files[key] = (time.time(), size)
+            self._total += size - previous
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._total <= self.max_bytes:
+                return
+            now = time.time()
+            for key, _ in sorted(self._files.items(), key=lambda item: item[1][0]):
+                if self._total <= self.max_bytes:
+                    break
+                # clients may still fetch published files by their URL
+                if now - self._published.get(key, -math.inf) < self.published_ttl_s:
+                    continue
+                self._published.pop(key, None)
+                _, size = self._files.pop(key)
+                self._total -= size
+                self.local_path(key).unlink(missing_ok=True)
+                logger.info("Evicted stored file", key=key)
+
+
+class S3Storage(Storage):
+    """Storage in an S3-compatible bucket.
+
+    URLs are presigned for `url_expiry_s` unless the bucket is served publicly
+    (or through a CDN) at `public_url`. Objects are not evicted; use a bucket
+    lifecycle rule for that.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        public_url: str | None = None,
+        url_expiry_s: int = 86400,
+    ):
+        self.bucket = bucket
+        self.prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.url_expiry_s = url_expiry_s
+        self.client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except botocore.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    def download(self, key: str, path: pathlib.Path) -> None:
+        response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(response["Body"], f, _CHUNK_SIZE)
+
+    def url(self, key: str) -> str:
+        if self.public_url:
+            return f"{self.public_url}/{self.prefix}{key}"
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self.prefix + key},
+            ExpiresIn=self.url_expiry_s,
+        )
+
+    def _upload(self, path: pathlib.Path, key: str) -> None:
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        with open(path, "rb") as f:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=self.prefix + key,
+                Body=f,
+                ContentType=content_type,
+            )
+
+    def _write(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import itertools
+import json
 import os
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Literal, Union, List
+from typing import Any, Collection, Literal, Union, List
 
 import jinja2
+import pydantic
 import structlog
 
+from backend.utils.cache import FileCache
+from backend.utils.remote import RemoteClient, decode_files, encode_files
+
 logger = structlog.stdlib.get_logger(__name__)
 
 _VERSIONS = {
@@ -24,27 +33,277 @@ _VERSIONS = {
     },
 }
 
+# opt-in v1 outputs next to the GLB, by name
+V1_EXTRA_OUTPUTS = {
+    "video": {
+        "video_gs": "sample_gs.mp4",
+        "video_rf": "sample_rf.mp4",
+        "video_mesh": "sample_mesh.mp4",
+    },
+    "ply": {"ply": "sample.ply"},
+}
+DEFAULT_TIER = "high"
+# v2 stages and how many jobs may be in each at once; sampling owns the GPU
+V2_STAGES = {"preprocess": 1, "sample": 1, "postprocess": 1}
+# v2 warmup run per prewarm mode; "off" defers all loading to the first job
+PREWARM_PIPELINE_TYPES = {"light": "512", "full": "1024_cascade"}
+
+
+class TrellisV1Params(pydantic.BaseModel):
+    seed: int = 1
+    sparse_structure_steps: int = 12
+    sparse_structure_cfg_strength: float = 7.5
+    slat_steps: int = 12
+    slat_cfg_strength: float = 3.0
+    simplify: float = 0.95
+    texture_size: int = 1024
+
+
+class TrellisV2Params(pydantic.BaseModel):
+    seed: int = 0
+    pipeline_type: str = "1024_cascade"
+    decimation_target: int = 300000
+    texture_size: int = 2048
+    remesh: bool = True
+    remesh_band: int = 1
+    remesh_project: int = 0
+
+
+class TrellisWorker:
+    """Long-lived TRELLIS v1 subprocess that keeps the pipeline loaded between jobs.
+
+    Jobs are sent as JSON lines on stdin and answered as JSON lines on stdout.
+    The worker is restarted when it dies, stops answering health checks or
+    exceeds the job timeout.
+    """
+
+    def __init__(
+        self,
+        script: str,
+        cwd: Path,
+        startup_timeout_s: float,
+        job_timeout_s: float,
+        health_interval_s: float,
+    ):
+        self._script = script
+        self._cwd = cwd
+        self.startup_timeout_s = startup_timeout_s
+        self.job_timeout_s = job_timeout_s
+        self.health_interval_s = health_interval_s
+
+        self._process: asyncio.subprocess.Process | None = None
+        self._script_dir: tempfile.TemporaryDirectory | None = None
+        self._stderr_task: asyncio.Task | None = None
+        self._monitor_task: asyncio.Task | None = None
+        self._stderr_tail: collections.deque[str] = collections.deque(maxlen=50)
+        self._lock = asyncio.Lock()
+        self._ids = itertools.count()
+        self.restarts = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        async with self._lock:
+            await self._ensure_started()
+        if self._monitor_task is None:
+            self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        async with self._lock:
+            await self._kill()
+
+    async def run(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Run a generation job and return the worker's timings."""
+        async with self._lock:
+            await self._ensure_started()
+            try:
+                reply = await self._request(
+                    {"type": "generate", **job}, self.job_timeout_s
+                )
+            except asyncio.CancelledError:
+                # the job cannot be interrupted inside the worker; free the GPU instead
+                await self._kill()
+                raise
+        if reply["status"] != "ok":
+            raise RuntimeError(f"TRELLIS v1 generation failed: {reply['error']}")
+        return reply.get("timings", {})
+
+    async def ping(self) -> bool:
+        async with self._lock:
+            if not self.alive:
+                return False
+            try:
+                await self._request({"type": "ping"}, timeout_s=10)
+                return True
+            except RuntimeError:
+                return False
+
+    async def _ensure_started(self) -> None:
+        if self.alive:
+            return
+        if self._process is not None:
+            self.restarts += 1
+            logger.warning(
+                "Restarting TRELLIS v1 worker",
+                returncode=self._process.returncode,
+                restarts=self.restarts,
+                stderr="".join(self._stderr_tail),
+            )
+            await self._kill()
+
+        # the script file must outlive the process, so keep the directory around
+        self._script_dir = tempfile.TemporaryDirectory()
+        script_path = Path(self._script_dir.name) / "trellis_worker.py"
+        script_path.write_text(self._script)
+
+        start = time.perf_counter()
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(script_path),
+            cwd=str(self._cwd),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20,
+        )
+        self._stderr_tail.clear()
+        self._stderr_task = asyncio.create_task(self._drain_stderr(self._process))
+
+        ready = await self._read_reply(self.startup_timeout_s)
+        if ready.get("status") != "ready":
+            await self._kill()
+            raise RuntimeError(f"TRELLIS v1 worker failed to start: {ready}")
+        logger.info(
+            "TRELLIS v1 worker ready",
+            load_s=round(ready.get("load_s", 0.0), 2),
+            startup_s=round(time.perf_counter() - start, 2),
+        )
+
+    async def _request(self, message: dict[str, Any], timeout_s: float) -> dict:
+        message = {"id": next(self._ids), **message}
+        self._process.stdin.write((json.dumps(message) + "\n").encode())
+        await self._process.stdin.drain()
+        reply = await self._read_reply(timeout_s)
+        if reply.get("id") != message["id"]:
+            await self._kill()
+            raise RuntimeError("TRELLIS v1 worker protocol out of sync")
+        return reply
+
+    async def _read_reply(self, timeout_s: float) -> dict[str, Any]:
+        try:
+            line = await asyncio.wait_for(self._process.stdout.readline(), timeout_s)
+        except asyncio.TimeoutError:
+            await self._kill()
+            raise RuntimeError(f"TRELLIS v1 worker timed out (>{timeout_s} s)")
+        if not line:
+            stderr = "".join(self._stderr_tail)
+            await self._kill()
+            raise RuntimeError(f"TRELLIS v1 worker exited unexpectedly: {stderr}")
+        return json.loads(line)
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        # keep the pipe from filling up and remember the tail for error reports
+        while line := await process.stderr.readline():
+            self._stderr_tail.append(line.decode(errors="replace"))
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval_s)
+            # skip the check while a job is running
+            if self._lock.locked():
+                continue
+            if not await self.ping():
+                logger.warning("TRELLIS v1 worker failed health check")
+                try:
+                    async with self._lock:
+                        await self._ensure_started()
+                except RuntimeError as exc:
+                    logger.error("Could not restart TRELLIS v1 worker", error=str(exc))
+
+    async def _kill(self) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+            await self._process.wait()
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+            self._stderr_task = None
+        if self._script_dir is not None:
+            self._script_dir.cleanup()
+            self._script_dir = None
+
 
 class TrellisEngine:
-    def __init__(self, version: Literal[1, 2] | None = None):
+    def __init__(
+        self,
+        version: Literal[1, 2] | None = None,
+        v1_params: dict[str, Any] | None = None,
+        v2_params: dict[str, Any] | None = None,
+        v1_tiers: dict[str, dict[str, Any]] | None = None,
+        v2_tiers: dict[str, dict[str, Any]] | None = None,
+        v2_stage_concurrency: dict[str, int] | None = None,
+        cache: FileCache | None = None,
+        prewarm: Literal["off", "light", "full"] = "light",
+        remote_url: str | None = None,
+        remote_timeout_s: float = 900,
+        worker_startup_timeout_s: float = 600,
+        worker_job_timeout_s: float = 900,
+        worker_health_interval_s: float = 60,
+    ):
+        if remote_url is not None and version is None:
+            raise ValueError("Set the TRELLIS version when using a remote worker")
         self.version = self._resolve_version(version)
         cfg = _VERSIONS[self.version]
 
         self.trellis_path: Path = cfg["trellis_path"]
         self.ckpt_path: Path = cfg["ckpt_path"]
         self._template_name: str | None = cfg.get("template")
-
-        self._generate_lock = asyncio.Lock()
+        self.v1_params = TrellisV1Params(**(v1_params or {}))
+        self.v2_params = TrellisV2Params(**(v2_params or {}))
+        # quality tiers override the base parameters of their version
+        self.tiers = dict((v1_tiers if self.version == 1 else v2_tiers) or {})
+        self.tiers.setdefault(DEFAULT_TIER, {})
+        self.cache = cache
+        if prewarm not in ("off", *PREWARM_PIPELINE_TYPES):
+            raise ValueError(f"Unsupported TRELLIS prewarm mode: {prewarm}")
+        self.prewarm = prewarm
+
+        unknown_stages = set(v2_stage_concurrency or {}) - set(V2_STAGES)
+        if unknown_stages:
+            raise ValueError(f"Unknown TRELLIS v2 stages: {sorted(unknown_stages)}")
+        self.v2_stage_concurrency = {**V2_STAGES, **(v2_stage_concurrency or {})}
+        self._v2_stages = {
+            stage: asyncio.Semaphore(limit)
+            for stage, limit in self.v2_stage_concurrency.items()
+        }
         self._pipeline = None
         self._o_voxel = None
+        self._load_lock = threading.Lock()
 
         template_dir = Path(__file__).parent / "templates"
         self._jinja_env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(str(template_dir))
         )
 
-        if self.version == 2:
-            self._load_v2_pipeline()
+        # generation runs on a worker node (see backend/worker.py) when remote
+        self._remote: RemoteClient | None = None
+        if remote_url is not None:
+            self._remote = RemoteClient(remote_url, remote_timeout_s)
+
+        self._worker: TrellisWorker | None = None
+        if self.version == 1 and self._remote is None:
+            template = self._jinja_env.get_template(self._template_name)
+            self._worker = TrellisWorker(
+                template.render(offline_path=self.ckpt_path.parent),
+                cwd=self.trellis_path,
+                startup_timeout_s=worker_startup_timeout_s,
+                job_timeout_s=worker_job_timeout_s,
+                health_interval_s=worker_health_interval_s,
+            )
 
     @staticmethod
     def _resolve_version(version: Literal[1, 2] | None) -> Literal[1, 2]:
@@ -68,63 +327,257 @@ class TrellisEngine:
     def display_name(self) -> str:
         return f"TrellisV{self.version}"
 
+    @property
+    def job_concurrency(self) -> int:
+        """How many generation jobs the engine takes at once.
+
+        The v1 worker runs one job at a time; v2 as many as it samples at once.
+        """
+        if self.version == 1:
+            return 1
+        return self.v2_stage_concurrency["sample"]
+
+    @property
+    def ready(self) -> bool:
+        """Whether the pipeline is loaded, so jobs do not pay the load time."""
+        if self._remote is not None:
+            return self._remote.healthy
+        if self._worker is not None:
+            return self._worker.alive
+        return self._pipeline is not None
+
+    async def start(self) -> None:
+        """Load the pipeline ahead of the first job, as configured by `prewarm`.
+
+        Failures are raised to the caller; jobs retry the load on their own.
+        """
+        if self._remote is not None:
+            # remote workers warm up on their own
+            if not await self._remote.health():
+                raise RuntimeError(
+                    f"TRELLIS worker {self._remote.url} is unreachable or not ready"
+                )
+            return
+        if self.prewarm == "off":
+            return
+        if self._worker is not None:
+            # the v1 worker process has no separate warmup run
+            await self._worker.start()
+            return
+        await asyncio.to_thread(self._load_v2_pipeline)
+        await self._run_v2_stage("sample", self._prewarm_v2)
+
+    async def stop(self) -> None:
+        if self._remote is not None:
+            await self._remote.aclose()
+        if self._worker is not None:
+            await self._worker.stop()
+
+    def params(
+        self, tier: str = DEFAULT_TIER
+    ) -> Union[TrellisV1Params, TrellisV2Params]:
+        """Resolve the pipeline parameters of a named quality tier."""
+        if tier not in self.tiers:
+            raise ValueError(f"Unknown TRELLIS quality tier '{tier}'")
+        base = self.v1_params if self.version == 1 else self.v2_params
+        return base.model_validate({**base.model_dump(), **dict(self.tiers[tier])})
+
     async def generate_3d_model(
-        self, image_path: Union[Path, List[Path]], output_dir: Path
+        self,
+        image_path: Union[Path, List[Path]],
+        output_dir: Path,
+        extra_outputs: Collection[str] = (),
+        tier: str = DEFAULT_TIER,
     ) -> Path:
+        params = self.params(tier)
+        unknown = set(extra_outputs) - set(V1_EXTRA_OUTPUTS)
+        if unknown:
+            raise ValueError(f"Unsupported TRELLIS outputs: {sorted(unknown)}")
+        if extra_outputs and self.version == 2:
+            logger.warning(
+                "TRELLIS v2 only produces a GLB, ignoring extra outputs",
+                extra_outputs=sorted(extra_outputs),
+            )
+
         output_dir.mkdir(parents=True, exist_ok=True)
 
         output_glb = output_dir / "sample.glb"
         output_glb.unlink(missing_ok=True)
 
-        if self.version == 2:
-            await self._generate_v2_async(image_path, output_glb)
+        # generation is deterministic, so identical inputs give identical results
+        cache_key = None
+        if self.cache is not None:
+            cache_key = await asyncio.to_thread(
+                self._cache_key, image_path, extra_outputs, params
+            )
+            if await asyncio.to_thread(self.cache.restore, cache_key, output_dir):
+                return output_glb
+
+        await self.generate_with_params(image_path, output_dir, params, extra_outputs)
+
+        if not output_glb.exists():
+            raise RuntimeError("GLB file not generated")
+
+        if self.cache is not None and cache_key is not None:
+            await asyncio.to_thread(
+                self.cache.store,
+                cache_key,
+                self._output_paths(output_dir, output_glb, extra_outputs),
+            )
+        return output_glb
+
+    async def generate_with_params(
+        self,
+        image_path: Union[Path, List[Path]],
+        output_dir: Path,
+        params: Union[TrellisV1Params, TrellisV2Params],
+        extra_outputs: Collection[str] = (),
+    ) -> None:
+        """Run one uncached generation into `output_dir` with resolved parameters."""
+        output_glb = output_dir / "sample.glb"
+        if self._remote is not None:
+            await self._generate_remote(image_path, output_dir, params, extra_outputs)
+        elif self.version == 2:
+            await self._generate_v2_async(image_path, output_glb, params)
         else:
             v1_image_path = (
                 image_path[0] if isinstance(image_path, list) else image_path
             )
-            await self._generate_v1_async(v1_image_path, output_dir, output_glb)
-
-        if output_glb.exists():
-            return output_glb
+            await self._generate_v1_async(
+                v1_image_path, output_dir, output_glb, extra_outputs, params
+            )
 
-        raise RuntimeError("GLB file not generated")
+    async def cached_result(
+        self,
+        image_path: Union[Path, List[Path]],
+        output_dir: Path,
+        extra_outputs: Collection[str] = (),
+        tier: str = DEFAULT_TIER,
+    ) -> Path | None:
+        """Restore a previous result for the same inputs into `output_dir`, if any."""
+        if self.cache is None:
+            return None
+        cache_key = await asyncio.to_thread(
+            self._cache_key, image_path, extra_outputs, self.params(tier)
+        )
+        if await asyncio.to_thread(self.cache.restore, cache_key, output_dir):
+            return output_dir / "sample.glb"
+        return None
+
+    def _cache_key(
+        self,
+        image_path: Union[Path, List[Path]],
+        extra_outputs: Collection[str],
+        params: Union[TrellisV1Params, TrellisV2Params],
+    ) -> str:
+        if self.version == 1:
+            # v1 conditions on the front image only
+            image_path = image_path[0] if isinstance(image_path, list) else image_path
+            outputs = sorted(extra_outputs)
+        else:
+            outputs = []
+        settings = {
+            "version": self.version,
+            "params": params.model_dump(),
+            "outputs": outputs,
+        }
+        return self.cache.key(image_path, settings)
+
+    def _output_paths(
+        self, output_dir: Path, output_glb: Path, extra_outputs: Collection[str]
+    ) -> list[Path]:
+        paths = [output_glb]
+        if self.version == 1:
+            for name in extra_outputs:
+                paths.extend(
+                    output_dir / filename
+                    for filename in V1_EXTRA_OUTPUTS[name].values()
+                    if (output_dir / filename).exists()
+                )
+        return paths
 
     async def _generate_v1_async(
-        self, image_path: Path, output_dir: Path, output_glb: Path
+        self,
+        image_path: Path,
+        output_dir: Path,
+        output_glb: Path,
+        extra_outputs: Collection[str],
+        params: TrellisV1Params,
     ) -> None:
-        if self._template_name is None:
-            raise RuntimeError(f"No template configured for TRELLIS v{self.version}")
-
-        template_vars = self._v1_vars(image_path, output_dir, output_glb)
-        template = self._jinja_env.get_template(self._template_name)
-        script_content = template.render(**template_vars)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            script_path = Path(temp_dir) / "run_trellis.py"
-            script_path.write_text(script_content)
-
-            cmd = f"cd {self.trellis_path} && python {script_path}"
-            process = await asyncio.create_subprocess_shell(
-                cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            _, stderr = await process.communicate()
+        if self._worker is None:
+            raise RuntimeError(f"No worker configured for TRELLIS v{self.version}")
 
-            if process.returncode != 0:
-                raise RuntimeError(
-                    f"TRELLIS v{self.version} generation failed: {stderr.decode()}"
-                )
+        timings = await self._worker.run(
+            self._v1_job(image_path, output_dir, output_glb, extra_outputs, params)
+        )
+        logger.info(
+            "TRELLIS v1 generation complete",
+            **{stage: round(seconds, 2) for stage, seconds in timings.items()},
+        )
+
+    async def _generate_remote(
+        self,
+        image_path: Union[Path, List[Path]],
+        output_dir: Path,
+        params: Union[TrellisV1Params, TrellisV2Params],
+        extra_outputs: Collection[str],
+    ) -> None:
+        image_paths = image_path if isinstance(image_path, list) else [image_path]
+        payload = {
+            "version": self.version,
+            "images": await asyncio.to_thread(encode_files, image_paths),
+            "params": params.model_dump(),
+            "extra_outputs": sorted(extra_outputs),
+        }
+        reply = await self._remote.post("/generate", payload)
+        await asyncio.to_thread(decode_files, reply["files"], output_dir)
 
     async def _generate_v2_async(
-        self, image_paths: Union[Path, List[Path]], output_glb: Path
+        self,
+        image_paths: Union[Path, List[Path]],
+        output_glb: Path,
+        params: TrellisV2Params,
     ) -> None:
-        async with self._generate_lock:
-            await asyncio.to_thread(self._run_v2, image_paths, output_glb)
+        # each stage has its own limit, so job N+1 can sample while job N is
+        # postprocessed
+        timings = {}
+        start = time.perf_counter()
+        images = await self._run_v2_stage(
+            "preprocess", self._v2_preprocess, image_paths
+        )
+        timings["preprocess_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mesh = await self._run_v2_stage("sample", self._v2_sample, images, params)
+        timings["sample_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await self._run_v2_stage(
+            "postprocess", self._v2_postprocess, mesh, output_glb, params
+        )
+        timings["postprocess_s"] = time.perf_counter() - start
+        logger.info(
+            "TRELLIS v2 generation complete",
+            **{stage: round(seconds, 2) for stage, seconds in timings.items()},
+        )
+
+    async def _run_v2_stage(self, stage: str, func, *args) -> Any:
+        async with self._v2_stages[stage]:
+            run = asyncio.ensure_future(asyncio.to_thread(func, *args))
+            try:
+                return await asyncio.shield(run)
+            except asyncio.CancelledError:
+                # threads cannot be interrupted; hold the stage until it is free
+                await asyncio.wait([run])
+                raise
 
     def _load_v2_pipeline(self) -> None:
-        if self._pipeline is not None:
-            return
+        # startup warmup and the first job may both get here
+        with self._load_lock:
+            if self._pipeline is None:
+                self._load_v2_pipeline_locked()
+
+    def _load_v2_pipeline_locked(self) -> None:
 
         trellis_path = str(self.trellis_path)
         if trellis_path not in sys.path:
@@ -139,7 +592,6 @@ class TrellisEngine:
             }
         )
 
-        from PIL import Image
         from trellis2.pipelines import Trellis2ImageTo3DPipeline
         import o_voxel
 
@@ -148,38 +600,43 @@ class TrellisEngine:
         self._pipeline.cuda()
         self._o_voxel = o_voxel
 
-        self._prewarm_v2(Image)
+    def _prewarm_v2(self) -> None:
+        from PIL import Image
 
-    def _prewarm_v2(self, Image_module) -> None:
-        logger.info("Prewarming TRELLIS v2 pipeline")
+        pipeline_type = PREWARM_PIPELINE_TYPES[self.prewarm]
+        logger.info("Prewarming TRELLIS v2 pipeline", pipeline_type=pipeline_type)
         warmup_image_path = self.trellis_path / "assets" / "example_image" / "T.png"
 
         if warmup_image_path.exists():
-            warmup_image = Image_module.open(warmup_image_path)
+            warmup_image = Image.open(warmup_image_path)
         else:
-            warmup_image = Image_module.new("RGBA", (64, 64), (0, 0, 0, 0))
+            warmup_image = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
             warmup_image.paste((255, 255, 255, 255), (16, 16, 48, 48))
 
-        self._pipeline.run(warmup_image, seed=0, pipeline_type="1024_cascade")
+        self._pipeline.run(warmup_image, seed=0, pipeline_type=pipeline_type)
         logger.info("TRELLIS v2 prewarm complete")
 
-    def _run_v2(self, image_paths: Union[Path, List[Path]], output_glb: Path) -> None:
+    def _v2_preprocess(self, image_paths: Union[Path, List[Path]]) -> Any:
         from PIL import Image
 
         if self._pipeline is None or self._o_voxel is None:
             self._load_v2_pipeline()
 
         if isinstance(image_paths, list):
-            images = [Image.open(p) for p in image_paths]
-        else:
-            images = Image.open(image_paths)
+            return [self._pipeline.preprocess_image(Image.open(p)) for p in image_paths]
+        return self._pipeline.preprocess_image(Image.open(image_paths))
 
-        mesh = self._pipeline.run(
+    def _v2_sample(self, images: Any, params: TrellisV2Params) -> Any:
+        return self._pipeline.run(
             images,
-            seed=0,
-            pipeline_type="1024_cascade",
+            seed=params.seed,
+            pipeline_type=params.pipeline_type,
+            preprocess_image=False,
         )[0]
 
+    def _v2_postprocess(
+        self, mesh: Any, output_glb: Path, params: TrellisV2Params
+    ) -> None:
         glb = self._o_voxel.postprocess.to_glb(
             vertices=mesh.vertices,
             faces=mesh.faces,
@@ -188,24 +645,29 @@ class TrellisEngine:
             attr_layout=mesh.layout,
             voxel_size=mesh.voxel_size,
             aabb=[[-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]],
-            decimation_target=300000,
-            texture_size=2048,
-            remesh=True,
-            remesh_band=1,
-            remesh_project=0,
+            decimation_target=params.decimation_target,
+            texture_size=params.texture_size,
+            remesh=params.remesh,
+            remesh_band=params.remesh_band,
+            remesh_project=params.remesh_project,
             verbose=True,
         )
         glb.export(str(output_glb), extension_webp=True)
 
-    def _v1_vars(
-        self, image_path: Path, output_dir: Path, output_glb: Path
+    def _v1_job(
+        self,
+        image_path: Path,
+        output_dir: Path,
+        output_glb: Path,
+        extra_outputs: Collection[str],
+        params: TrellisV1Params,
     ) -> dict[str, Any]:
+        outputs = {"glb": str(output_glb)}
+        for name in extra_outputs:
+            for key, filename in V1_EXTRA_OUTPUTS[name].items():
+                outputs[key] = str(output_dir / filename)
         return {
-            "offline_path": self.ckpt_path.parent,
-            "image_path": image_path,
-            "output_video_gs": output_dir / "sample_gs.mp4",
-            "output_video_rf": output_dir / "sample_rf.mp4",
-            "output_video_mesh": output_dir / "sample_mesh.mp4",
-            "output_glb": output_glb,
-            "output_ply": output_dir / "sample.ply",
+            "image_path": str(image_path),
+            "params": params.model_dump(),
+            "outputs": outputs,
         }
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import base64
-import os
 import re
-import tempfile
 from pathlib import Path
 
 import cv2
 import numpy as np
 import pydantic_ai
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+VIDEO_SUFFIXES = {
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "video/ogg": ".ogg",
+}
 
 
 def _decode_data_url(data_url: str) -> tuple[bytes, str]:
@@ -39,29 +46,55 @@ def _is_near_solid_frame(frame: np.ndarray, threshold: float = 50.0) -> bool:
     return std_dev < threshold
 
 
-def _select_diverse_indices(features: list[np.ndarray], count: int) -> list[int]:
-    if not features:
+def _select_diverse_indices(features: np.ndarray, count: int) -> list[int]:
+    # Farthest-point sampling over the stacked (frames, dims) feature matrix.
+    if len(features) == 0:
         return []
 
+    # float64: in float32 the expanded form loses the small distances between
+    # near-identical frames to rounding and can re-pick a selected frame
+    features = np.asarray(features, dtype=np.float64)
+    norms = np.einsum("ij,ij->i", features, features)
+
+    def sq_dist(idx: int) -> np.ndarray:
+        # |a - b|² = |a|² - 2 a·b + |b|², a single matrix-vector product
+        dist = norms - 2.0 * (features @ features[idx]) + norms[idx]
+        return np.maximum(dist, 0.0, out=dist)
+
     selected = [0]
+    # squared distance from every frame to its nearest selected frame
+    min_dist = sq_dist(0)
+    min_dist[0] = -np.inf
     while len(selected) < min(count, len(features)):
-        best_idx = None
-        best_dist = -1.0
-        for idx, feat in enumerate(features):
-            if idx in selected:
-                continue
-            min_dist = min(
-                float(np.linalg.norm(feat - features[s_idx])) for s_idx in selected
-            )
-            if min_dist > best_dist:
-                best_dist = min_dist
-                best_idx = idx
-        if best_idx is None:
-            break
+        best_idx = int(np.argmax(min_dist))
         selected.append(best_idx)
+        np.minimum(min_dist, sq_dist(best_idx), out=min_dist)
+        min_dist[selected] = -np.inf
     return selected
 
 
+def _shot_representatives(features: np.ndarray, threshold: float) -> list[int]:
+    # Split at large jumps between consecutive frames; keep each shot's medoid-ish
+    # frame (the one closest to the shot mean).
+    jumps = np.abs(np.diff(features, axis=0)).mean(axis=1)
+    bounds = [0, *(np.flatnonzero(jumps > threshold) + 1).tolist(), len(features)]
+    representatives = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        shot = features[start:stop]
+        offset = ((shot - shot.mean(axis=0)) ** 2).sum(axis=1).argmin()
+        representatives.append(start + int(offset))
+    return representatives
+
+
+def _downscale(frame: np.ndarray, max_size: int) -> np.ndarray:
+    height, width = frame.shape[:2]
+    scale = max_size / max(height, width)
+    if scale >= 1.0:
+        return frame
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+
 def _frame_to_image(frame: np.ndarray) -> pydantic_ai.BinaryImage:
     success, buffer = cv2.imencode(".jpg", frame)
     if not success:
@@ -69,62 +102,89 @@ def _frame_to_image(frame: np.ndarray) -> pydantic_ai.BinaryImage:
     return pydantic_ai.BinaryImage(data=buffer.tobytes(), media_type="image/jpeg")
 
 
-def extract_key_frames(
-    video_data_url: str, frame_count: int = 5
-) -> list[pydantic_ai.BinaryImage]:
-    # Return the most diverse frames as BinaryImage objects.
+def save_video(video_data_url: str, output_dir: Path, name: str) -> Path:
+    """Write an uploaded video data URL to `output_dir` as the video asset file."""
     video_bytes, mime_type = _decode_data_url(video_data_url)
-    suffix = {
-        "video/mp4": ".mp4",
-        "video/webm": ".webm",
-        "video/ogg": ".ogg",
-    }.get(mime_type, ".mp4")
-
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-        tmp_file.write(video_bytes)
-        temp_path = Path(tmp_file.name)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    video_path = output_dir / f"{name}{VIDEO_SUFFIXES.get(mime_type, '.mp4')}"
+    video_path.write_bytes(video_bytes)
+    return video_path
+
+
+class KeyFrameExtractor:
+    """Picks the most diverse frames of a video in a single decoding pass.
+
+    Candidates are sampled every `stride` frames, or every `interval_s` seconds
+    when no stride is set; skipped frames are grabbed but never decoded. At most
+    `max_candidates` downscaled candidates are kept: when the buffer is full,
+    every other candidate is dropped and the sampling stride doubles. With a
+    `shot_threshold`, frames are first reduced to one candidate per shot.
+    """
+
+    def __init__(
+        self,
+        frame_count: int = 5,
+        interval_s: float = 0.5,
+        stride: int | None = None,
+        max_candidates: int = 64,
+        max_size: int = 768,
+        shot_threshold: float | None = None,
+    ):
+        self.frame_count = frame_count
+        self.interval_s = interval_s
+        self.stride = stride
+        self.max_candidates = max_candidates
+        self.max_size = max_size
+        self.shot_threshold = shot_threshold
+
+    def extract(self, video_path: Path) -> list[pydantic_ai.BinaryImage]:
+        capture = cv2.VideoCapture(str(video_path))
+        if not capture.isOpened():
+            # like an undecodable video, this yields no frames
+            logger.warning("Could not open video", video=video_path.name)
+            return []
 
-    try:
-        capture = cv2.VideoCapture(str(temp_path))
-        features: list[np.ndarray] = []
-        valid_indices: list[int] = []
-        frame_idx = 0
-
-        while True:
-            success, frame = capture.read()
-            if not success or frame is None:
-                break
-            # Skip near-solid frames (pure black, white, or uniform color)
-            if not _is_near_solid_frame(frame):
-                features.append(_feature_vector(frame))
-                valid_indices.append(frame_idx)
-            frame_idx += 1
-
-        capture.release()
+        try:
+            stride = self._stride(capture)
+            frames: list[np.ndarray] = []
+            features: list[np.ndarray] = []
+            frame_idx = 0
+            while capture.grab():
+                if frame_idx % stride == 0:
+                    success, frame = capture.retrieve()
+                    # Skip near-solid frames (pure black, white, or uniform color)
+                    if success and frame is not None:
+                        frame = _downscale(frame, self.max_size)
+                        if not _is_near_solid_frame(frame):
+                            frames.append(frame)
+                            features.append(_feature_vector(frame))
+                    if len(frames) > self.max_candidates:
+                        frames, features = frames[::2], features[::2]
+                        stride *= 2
+                frame_idx += 1
+        finally:
+            capture.release()
 
         if not features:
             return []
-
-        selected_local = _select_diverse_indices(features, frame_count)
-        # Map back to original frame indices
-        indices = [valid_indices[i] for i in selected_local]
-
-        # Re-open video to fetch only the selected frames to save memory
-        capture = cv2.VideoCapture(str(temp_path))
-        frame_map = {}
-        sorted_indices = sorted(list(set(indices)))
-
-        for idx in sorted_indices:
-            capture.set(cv2.CAP_PROP_POS_FRAMES, idx)
-            success, frame = capture.read()
-            if success and frame is not None:
-                frame_map[idx] = _frame_to_image(frame)
-
-        capture.release()
-
-        return [frame_map[idx] for idx in indices if idx in frame_map]
-    finally:
-        try:
-            os.remove(temp_path)
-        except OSError:
-            pass
+        return [
+            _frame_to_image(frames[idx]) for idx in self._select(np.stack(features))
+        ]
+
+    def _select(self, features: np.ndarray) -> list[int]:
+        candidates = np.arange(len(features))
+        if self.shot_threshold is not None:
+            # pick from one frame per scene, unless there are too few scenes
+            shots = _shot_representatives(features, self.shot_threshold)
+            if len(shots) >= self.frame_count:
+                candidates = np.asarray(shots)
+        selected = _select_diverse_indices(features[candidates], self.frame_count)
+        return [int(candidates[idx]) for idx in selected]
+
+    def _stride(self, capture: cv2.VideoCapture) -> int:
+        if self.stride is not None:
+            return max(1, self.stride)
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        if not fps or not np.isfinite(fps):
+            return 1
+        return max(1, round(fps * self.interval_s))
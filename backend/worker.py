@@ -0,0 +1,187 @@
+"""Render or 3D generation worker for API nodes using remote engines.
+
+Run one per node, next to the engine it hosts; Hydra overrides pick the local
+engine:
+
+    python -m backend.worker render engine=blender --port 8101
+    python -m backend.worker trellis --port 8102
+    python -m backend.worker trellis --stub --port 8102  # stand-in, no GPU needed
+
+API nodes point `engine=remote` / `trellis.remote_url` at these workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Collection
+
+import hydra
+import numpy as np
+import structlog
+import trimesh
+import uvicorn
+from fastapi import Body, FastAPI, HTTPException
+from hydra import compose, initialize_config_dir
+from PIL import Image
+
+from backend.engines.engine import RenderProfile
+from backend.engines.remote import RemoteEngine
+from backend.utils.remote import decode_files, encode_files
+
+logger = structlog.stdlib.get_logger(__name__)
+
+ROOT_DIR = Path(__file__).parent.resolve()
+
+
+class StubTrellis:
+    """Stand-in for TRELLIS that returns a cube tinted with the input's mean colour."""
+
+    ready = True
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def generate_with_params(
+        self,
+        image_path: Path | list[Path],
+        output_dir: Path,
+        params: Any,
+        extra_outputs: Collection[str] = (),
+    ) -> None:
+        image_paths = image_path if isinstance(image_path, list) else [image_path]
+        with Image.open(image_paths[0]) as image:
+            color = np.asarray(image.convert("RGB")).reshape(-1, 3).mean(axis=0)
+        box = trimesh.creation.box()
+        box.visual.vertex_colors = [*color.astype(np.uint8), 255]
+        box.export(output_dir / "sample.glb")
+
+
+def _start_error(task: asyncio.Task | None) -> str | None:
+    if task is None or not task.done() or task.cancelled():
+        return None
+    error = task.exception()
+    return None if error is None else str(error) or type(error).__name__
+
+
+def _log_start_failure(task: asyncio.Task) -> None:
+    error = _start_error(task)
+    if error is not None:
+        logger.error("Failed to load the TRELLIS engine", error=error)
+
+
+def create_app(role: str, overrides: list[str], stub: bool = False) -> FastAPI:
+    with initialize_config_dir(config_dir=str(ROOT_DIR / "config"), version_base=None):
+        cfg = compose(config_name="config", overrides=overrides)
+
+    app = FastAPI(title=f"Imagin3D {role} worker")
+    state: dict[str, Any] = {}
+
+    def build(node: Any) -> Any:
+        # engine caches share their entries through the configured storage
+        if node.get("cache"):
+            storage = hydra.utils.instantiate(cfg.storage)
+            return hydra.utils.instantiate(node, cache={"storage": storage})
+        return hydra.utils.instantiate(node)
+
+    @app.on_event("startup")
+    async def startup() -> None:
+        if role == "render":
+            engine = build(cfg.engine)
+            if isinstance(engine, RemoteEngine):
+                raise ValueError("A render worker needs a local engine, not 'remote'")
+        elif stub:
+            engine = StubTrellis()
+        else:
+            cfg.trellis.remote_url = None
+            engine = build(cfg.trellis)
+            # load the pipeline in the background; jobs wait for it if needed
+            state["start"] = asyncio.create_task(engine.start())
+            state["start"].add_done_callback(_log_start_failure)
+        state["engine"] = engine
+        logger.info("Worker ready", role=role, stub=stub)
+
+    @app.on_event("shutdown")
+    async def shutdown() -> None:
+        if "start" in state:
+            state["start"].cancel()
+        if role == "trellis":
+            await state["engine"].stop()
+
+    @app.get("/health")
+    async def health():
+        engine = state.get("engine")
+        ready = engine is not None and (role == "render" or engine.ready)
+        # a job may still load the engine after the startup load failed
+        error = None if ready else _start_error(state.get("start"))
+        if error is not None:
+            return {"status": "failed", "role": role, "ready": False, "error": error}
+        return {"status": "ok", "role": role, "ready": ready}
+
+    @app.post("/render")
+    async def render(payload: dict = Body(...)):
+        if role != "render":
+            raise HTTPException(404, "Not a render worker")
+        settings = RenderProfile(**payload["settings"])
+        with tempfile.TemporaryDirectory() as tmp:
+            model_path = decode_files([payload["model"]], Path(tmp))[0]
+            output_dir = Path(tmp) / "renders"
+            output_dir.mkdir()
+            await state["engine"]._render(model_path, output_dir, settings)
+            return {"files": encode_files(sorted(output_dir.iterdir()))}
+
+    @app.post("/generate")
+    async def generate(payload: dict = Body(...)):
+        if role != "trellis":
+            raise HTTPException(404, "Not a TRELLIS worker")
+        engine = state["engine"]
+        params = payload["params"]
+        if not stub:
+            if payload["version"] != engine.version:
+                raise HTTPException(
+                    409,
+                    f"Worker runs TRELLIS v{engine.version}, not v{payload['version']}",
+                )
+            params = engine.params().model_validate(params)
+        with tempfile.TemporaryDirectory() as tmp:
+            # inputs keep their order (front, back), names may collide
+            images = [
+                decode_files([image], Path(tmp) / f"input_{i}")[0]
+                for i, image in enumerate(payload["images"])
+            ]
+            output_dir = Path(tmp) / "output"
+            output_dir.mkdir()
+            await engine.generate_with_params(
+                images if len(images) > 1 else images[0],
+                output_dir,
+                params,
+                payload.get("extra_outputs", []),
+            )
+            return {"files": encode_files(sorted(output_dir.iterdir()))}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("role", choices=["render", "trellis"])
+    parser.add_argument("overrides", nargs="*", help="Hydra config overrides")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8101")))
+    parser.add_argument(
+        "--stub", action="store_true", help="serve a stand-in TRELLIS (no GPU)"
+    )
+    args = parser.parse_args()
+
+    app = create_app(args.role, args.overrides, stub=args.stub)
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
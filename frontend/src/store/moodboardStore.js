@@ -757,6 +757,10 @@ export const useMoodboardStore = create((set, get) => ({
                   const url = data.file.startsWith('http') ? data.file : `${BACKEND_URL}${data.file}`
                   get().openModelDialog(url)
               }
+            } else if (type === 'preview') {
+              // Show the draft model until the refined one arrives
+              const url = data.file.startsWith('http') ? data.file : `${BACKEND_URL}${data.file}`
+              get().openModelDialog(url)
             } else if (type === 'cancelled') {
               // Pipeline was cancelled
               set({
@@ -793,6 +797,9 @@ export const useMoodboardStore = create((set, get) => ({
               } else if (data.type === 'closeness') {
                 set({ closenessScore: data.score })
               }
+            } else if (type === 'rejected') {
+              // Non-fatal: the element is left out and the pipeline continues
+              console.warn(`Element ${data.element_id} was rejected:`, data.reason)
             } else if (type === 'error') {
               console.error('Backend error:', data)
               throw new Error(data)